@@ -25,6 +25,7 @@ from .modules import (
     ScraperModule,
     APIModule,
     DatabaseModule,
+    AsyncDatabaseModule,
     DesktopModule,
 )
 from .workflows import Workflow, WorkflowStep
@@ -56,6 +57,7 @@ class RPA:
         self._scraper: Optional[ScraperModule] = None
         self._api: Optional[APIModule] = None
         self._database: Optional[DatabaseModule] = None
+        self._async_database: Optional[AsyncDatabaseModule] = None
         self._desktop: Optional[DesktopModule] = None
 
         self.logger.info("RPA initialized")
@@ -80,7 +82,11 @@ class RPA:
     def pdf(self) -> PDFModule:
         """PDF automation module."""
         if self._pdf is None:
-            self._pdf = PDFModule()
+            self._pdf = PDFModule(
+                workers=self.config.get("pdf.workers", 0),
+                chunk_size=self.config.get("pdf.chunk_size", 25),
+                cache=self.config.get("pdf.cache"),
+            )
         return self._pdf
 
     @property
@@ -111,6 +117,12 @@ class RPA:
             self._scraper = ScraperModule(
                 user_agent=self.config.get("scraper.user_agent"),
                 rate_limit=self.config.get("scraper.rate_limit", 1.0),
+                timeout=self.config.get("scraper.timeout", 30),
+                cache=self.config.get("scraper.cache"),
+                parser=self.config.get("scraper.parser", "lxml"),
+                driver_pool=self.config.get("scraper.driver_pool"),
+                fast_render=self.config.get("scraper.fast_render"),
+                download=self.config.get("scraper.download"),
             )
         return self._scraper
 
@@ -118,7 +130,14 @@ class RPA:
     def api(self) -> APIModule:
         """API integration module."""
         if self._api is None:
-            self._api = APIModule()
+            self._api = APIModule(
+                timeout=self.config.get("api.timeout", 30),
+                retry_count=self.config.get("api.retry_count", 3),
+                retry_delay=self.config.get("api.retry_delay", 1.0),
+                max_concurrency=self.config.get("api.max_concurrency", 8),
+                per_host_limit=self.config.get("api.per_host_limit"),
+                cache=self.config.get("api.cache"),
+            )
         return self._api
 
     @property
@@ -126,9 +145,22 @@ class RPA:
         """Database operations module."""
         if self._database is None:
             connection_string = self.config.get("database.default")
-            self._database = DatabaseModule(connection_string)
+            self._database = DatabaseModule(
+                connection_string,
+                pool=self.config.get("database.pool"),
+            )
         return self._database
 
+    @property
+    def async_database(self) -> AsyncDatabaseModule:
+        """Asyncio database module (same connection settings as database)."""
+        if self._async_database is None:
+            self._async_database = AsyncDatabaseModule(
+                self.config.get("database.default"),
+                pool=self.config.get("database.pool"),
+            )
+        return self._async_database
+
     @property
     def desktop(self) -> DesktopModule:
         """Desktop automation module."""
@@ -204,6 +236,8 @@ class RPA:
             self._scraper.close()
         if self._database:
             self._database.close()
+        if self._pdf:
+            self._pdf.close()
         self.scheduler.stop()
         self.logger.info("RPA closed")
 
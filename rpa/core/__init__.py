@@ -1,11 +1,27 @@
 from .config import Config
 from .logger import get_logger
 from .scheduler import Scheduler
+from .http import AsyncHTTPClient
+from .cache import ExtractionCache, HTTPCache, MemoryCache, SQLiteCache
+from .ratelimit import RateLimiter, TokenBucket
+from .engines import EngineRegistry, get_engine, release_engine, engine_metrics, dispose_engines
 
 __all__ = [
     "Config",
     "get_logger",
     "Scheduler",
+    "AsyncHTTPClient",
+    "HTTPCache",
+    "MemoryCache",
+    "SQLiteCache",
+    "ExtractionCache",
+    "RateLimiter",
+    "TokenBucket",
+    "EngineRegistry",
+    "get_engine",
+    "release_engine",
+    "engine_metrics",
+    "dispose_engines",
 ]
 
 # Optional NLP imports - these require additional dependencies
@@ -0,0 +1,507 @@
+"""HTTP response and document extraction caching for RPA framework."""
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+from urllib.parse import urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .logger import LoggerMixin
+
+
+@dataclass
+class CacheEntry:
+    """A cached HTTP response."""
+    url: str
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+    stored_at: float = field(default_factory=time.time)
+    expires_at: float = 0.0
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    @property
+    def etag(self) -> Optional[str]:
+        return CaseInsensitiveDict(self.headers).get("ETag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return CaseInsensitiveDict(self.headers).get("Last-Modified")
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    def to_response(self) -> requests.Response:
+        """Rebuild a requests.Response from the cached data."""
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.content
+        response.url = self.url
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
+
+    def to_httpx_response(self):
+        """Rebuild an httpx.Response from the cached data."""
+        from .http import httpx
+
+        return httpx.Response(
+            self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=httpx.Request("GET", self.url),
+        )
+
+
+class MemoryCache:
+    """In-process LRU cache bounded by entry count and total bytes."""
+
+    def __init__(self, max_entries: int = 512, max_bytes: int = 100 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.size
+            self._entries[key] = entry
+            self._bytes += entry.size
+
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+def _cache_config(config: Any, cache_type: type) -> Any:
+    """Normalize a module's `cache` setting.
+
+    Returns:
+        None when caching is disabled, a ready cache_type instance, or a
+        dict of settings (empty for True)
+    """
+    if not config:
+        return None
+    if isinstance(config, cache_type):
+        return config
+    if config is True:
+        return {}
+    if not config.get("enabled", True):
+        return None
+    return config
+
+
+class SQLiteStore:
+    """Keyed table in a SQLite file, evicting least recently used rows past max_bytes.
+
+    Subclasses set TABLE and the value COLUMNS; every table also has key,
+    size and accessed_at columns. Access times of cache hits are kept in
+    memory and written back in batches (every TOUCH_FLUSH_ROWS keys or
+    TOUCH_FLUSH_INTERVAL seconds, and before eviction), so reads do not
+    each need a write transaction.
+    """
+
+    TABLE = "entries"
+    COLUMNS = "value BLOB"
+    TOUCH_FLUSH_ROWS = 256
+    TOUCH_FLUSH_INTERVAL = 30.0
+
+    def __init__(self, path: str, max_bytes: int):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._touched: Dict[str, float] = {}
+        self._touches_flushed = time.time()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.TABLE} ("
+            f"key TEXT PRIMARY KEY, {self.COLUMNS}, size INTEGER, accessed_at REAL)"
+        )
+        self._conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{self.TABLE}_accessed ON {self.TABLE} (accessed_at)")
+        self._conn.commit()
+
+    def _touch(self, keys: List[str]) -> None:
+        """Mark rows as just used (lock must be held)."""
+        now = time.time()
+        for key in keys:
+            self._touched[key] = now
+        if len(self._touched) >= self.TOUCH_FLUSH_ROWS or now - self._touches_flushed >= self.TOUCH_FLUSH_INTERVAL:
+            self._flush_touches()
+            self._conn.commit()
+
+    def _flush_touches(self) -> None:
+        """Write pending access times (lock must be held; the caller commits)."""
+        if self._touched:
+            self._conn.executemany(
+                f"UPDATE {self.TABLE} SET accessed_at = ? WHERE key = ?",
+                [(accessed_at, key) for key, accessed_at in self._touched.items()],
+            )
+            self._touched.clear()
+        self._touches_flushed = time.time()
+
+    def _put(self, rows: List[Dict[str, Any]]) -> None:
+        """Insert or replace rows (column dicts including key and size), then evict."""
+        if not rows:
+            return
+        names = [*rows[0], "accessed_at"]
+        sql = f"INSERT OR REPLACE INTO {self.TABLE} ({', '.join(names)}) VALUES ({', '.join('?' * len(names))})"
+        now = time.time()
+        with self._lock:
+            # Eviction must see recent hits; flushed first so older access
+            # times don't overwrite the new rows'
+            self._flush_touches()
+            self._conn.executemany(sql, [(*row.values(), now) for row in rows])
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """Drop least recently used rows until under max_bytes (lock must be held)."""
+        total = self._conn.execute(f"SELECT COALESCE(SUM(size), 0) FROM {self.TABLE}").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute(f"SELECT key, size FROM {self.TABLE} ORDER BY accessed_at").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute(f"DELETE FROM {self.TABLE} WHERE key = ?", (key,))
+            total -= size
+
+    def _totals(self) -> tuple:
+        """(row count, stored bytes)."""
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM {self.TABLE}").fetchone()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._touched.pop(key, None)
+            self._conn.execute(f"DELETE FROM {self.TABLE} WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._touched.clear()
+            self._conn.execute(f"DELETE FROM {self.TABLE}")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_touches()
+            self._conn.commit()
+            self._conn.close()
+
+
+class SQLiteCache(SQLiteStore):
+    """On-disk HTTP response cache in a SQLite file."""
+
+    TABLE = "entries"
+    COLUMNS = "url TEXT, status_code INTEGER, headers TEXT, content BLOB, stored_at REAL, expires_at REAL"
+
+    def __init__(self, path: str = "data/http_cache.db", max_bytes: int = 500 * 1024 * 1024):
+        super().__init__(path, max_bytes)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, status_code, headers, content, stored_at, expires_at "
+                "FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._touch([key])
+
+        url, status_code, headers, content, stored_at, expires_at = row
+        return CacheEntry(
+            url=url,
+            status_code=status_code,
+            headers=json.loads(headers),
+            content=content,
+            stored_at=stored_at,
+            expires_at=expires_at,
+        )
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        if entry.size > self.max_bytes:
+            return
+        self._put([{
+            "key": key,
+            "url": entry.url,
+            "status_code": entry.status_code,
+            "headers": json.dumps(entry.headers),
+            "content": entry.content,
+            "size": entry.size,
+            "stored_at": entry.stored_at,
+            "expires_at": entry.expires_at,
+        }])
+
+
+class HTTPCache(LoggerMixin):
+    """Cache GET responses with TTLs and ETag/Last-Modified revalidation.
+
+    Fresh entries are served without touching the network. Stale entries
+    with validators are revalidated with a conditional request, and a 304
+    reply extends the entry instead of re-downloading the body.
+    """
+
+    def __init__(self, backend: Optional[Union[MemoryCache, SQLiteCache]] = None, ttl: float = 300):
+        self.backend = backend or MemoryCache()
+        self.ttl = ttl
+
+    @classmethod
+    def from_config(cls, config: Any) -> Optional["HTTPCache"]:
+        """Build a cache from a module's `cache` setting.
+
+        Args:
+            config: None/False (disabled), True (in-memory defaults), an
+                HTTPCache, or a dict with enabled, backend ('memory' or
+                'sqlite'), ttl, max_entries, max_bytes and path
+
+        Returns:
+            HTTPCache or None when caching is disabled
+        """
+        config = _cache_config(config, cls)
+        if config is None or isinstance(config, cls):
+            return config
+
+        backend_name = config.get("backend", "memory")
+        if backend_name == "memory":
+            backend = MemoryCache(
+                max_entries=config.get("max_entries", 512),
+                max_bytes=config.get("max_bytes", 100 * 1024 * 1024),
+            )
+        elif backend_name == "sqlite":
+            backend = SQLiteCache(
+                path=config.get("path", "data/http_cache.db"),
+                max_bytes=config.get("max_bytes", 500 * 1024 * 1024),
+            )
+        else:
+            raise ValueError(f"Unsupported cache backend: {backend_name}")
+
+        return cls(backend, ttl=config.get("ttl", 300))
+
+    @staticmethod
+    def key(
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        variant: Any = None,
+    ) -> str:
+        """Build the cache key for a request.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            params: Query parameters
+            headers: Request headers - responses for different headers
+                (credentials, Accept, ...) are kept apart
+            variant: Anything else the response depends on (e.g. basic auth)
+        """
+        if params:
+            query = urlencode(sorted(params.items()), doseq=True)
+            url = f"{url}{'&' if '?' in url else '?'}{query}"
+        key = f"{method.upper()} {url}"
+        if headers or variant is not None:
+            vary = repr((sorted((k.lower(), v) for k, v in (headers or {}).items()), variant))
+            key += f" #{hashlib.sha256(vary.encode()).hexdigest()[:16]}"
+        return key
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        return self.backend.get(key)
+
+    def validators(self, entry: CacheEntry) -> Dict[str, str]:
+        """Conditional request headers for revalidating an entry."""
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def _lifetime(self, headers: Any) -> Optional[float]:
+        """Seconds to keep a response, or None if it must not be stored."""
+        cache_control = (CaseInsensitiveDict(dict(headers)).get("Cache-Control") or "").lower()
+        if "no-store" in cache_control:
+            return None
+        if "no-cache" in cache_control:
+            return 0
+        match = re.search(r"max-age=(\d+)", cache_control)
+        if match:
+            return float(match.group(1))
+        return self.ttl
+
+    def store(self, key: str, url: str, status_code: int, headers: Any, content: bytes) -> Optional[CacheEntry]:
+        """Store a successful response.
+
+        Returns:
+            The stored entry, or None if the response is not cacheable
+        """
+        if status_code != 200:
+            return None
+        lifetime = self._lifetime(headers)
+        if lifetime is None:
+            return None
+
+        # Bodies are stored already decoded, so drop the transfer framing headers
+        headers = {
+            k: v for k, v in dict(headers).items()
+            if k.lower() not in ("content-encoding", "content-length", "transfer-encoding")
+        }
+
+        now = time.time()
+        entry = CacheEntry(
+            url=url,
+            status_code=status_code,
+            headers=headers,
+            content=content,
+            stored_at=now,
+            expires_at=now + lifetime,
+        )
+        if lifetime > 0 or entry.etag or entry.last_modified:
+            self.backend.set(key, entry)
+        return entry
+
+    def revalidated(self, key: str, entry: CacheEntry, headers: Any) -> CacheEntry:
+        """Extend an entry after a 304 Not Modified reply."""
+        lifetime = self._lifetime(headers)
+        now = time.time()
+        entry.stored_at = now
+        entry.expires_at = now + (lifetime if lifetime is not None else 0)
+        self.backend.set(key, entry)
+        return entry
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        self.backend.clear()
+
+
+class ExtractionCache(SQLiteStore):
+    """Content-addressed on-disk store for document extraction results.
+
+    Results are keyed by the SHA-256 of the file's bytes, so renamed or
+    re-uploaded copies of a document share entries and a modified file
+    never matches stale ones. Entries live in a SQLite file and the least
+    recently used are evicted past max_bytes.
+    """
+
+    TABLE = "extractions"
+    COLUMNS = "value TEXT"
+
+    def __init__(self, path: str = "data/extraction_cache.db", max_bytes: int = 256 * 1024 * 1024):
+        super().__init__(path, max_bytes)
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls, config: Any) -> Optional["ExtractionCache"]:
+        """Build a cache from a module's `cache` setting.
+
+        Args:
+            config: None/False (disabled), True (defaults), an
+                ExtractionCache, or a dict with enabled, path and max_bytes
+
+        Returns:
+            ExtractionCache or None when caching is disabled
+        """
+        config = _cache_config(config, cls)
+        if config is None or isinstance(config, cls):
+            return config
+        return cls(
+            path=config.get("path", "data/extraction_cache.db"),
+            max_bytes=config.get("max_bytes", 256 * 1024 * 1024),
+        )
+
+    @staticmethod
+    def file_digest(file_path: str) -> str:
+        """SHA-256 of a file's contents."""
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def key(digest: str, *parts: Any, options: Optional[Dict[str, Any]] = None) -> str:
+        """Build a key from a content digest, e.g. page and kind, plus extraction options."""
+        key = ":".join([digest, *(str(p) for p in parts)])
+        if options:
+            key += ":" + json.dumps(options, sort_keys=True, default=str)
+        return key
+
+    def get(self, key: str) -> Any:
+        """Cached value for a key, or None."""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Cached values for several keys in one query; missing keys are left out."""
+        found: Dict[str, Any] = {}
+        with self._lock:
+            for i in range(0, len(keys), 500):
+                batch = keys[i:i + 500]
+                marks = ", ".join("?" * len(batch))
+                found.update(self._conn.execute(
+                    f"SELECT key, value FROM extractions WHERE key IN ({marks})", batch
+                ).fetchall())
+            self.hits += len(found)
+            self.misses += len(set(keys)) - len(found)
+            if found:
+                self._touch(list(found))
+        return {key: json.loads(value) for key, value in found.items()}
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value."""
+        self.set_many({key: value})
+
+    def set_many(self, items: Dict[str, Any]) -> None:
+        """Store several values in one transaction."""
+        rows = []
+        for key, value in items.items():
+            data = json.dumps(value)
+            if len(data) <= self.max_bytes:
+                rows.append({"key": key, "value": data, "size": len(data)})
+        self._put(rows)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Entry count, stored bytes, hits and misses."""
+        entries, size = self._totals()
+        return {"entries": entries, "bytes": size, "hits": self.hits, "misses": self.misses}
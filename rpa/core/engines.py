@@ -0,0 +1,273 @@
+"""Process-wide SQLAlchemy engine registry with pool metrics."""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import QueuePool
+
+from .logger import get_logger
+
+logger = get_logger("EngineRegistry")
+
+# Seconds spent opening new connections during the current checkout, per thread
+_connecting = threading.local()
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long callers wait for a connection.
+
+    Time spent opening a new connection is not waiting on the pool, so it
+    is left out.
+    """
+
+    def _do_get(self):
+        _connecting.seconds = 0.0
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            metrics = getattr(self, "_rpa_metrics", None)
+            if metrics is not None:
+                metrics.record_wait(max(0.0, time.perf_counter() - started - _connecting.seconds))
+
+    def _create_connection(self):
+        started = time.perf_counter()
+        try:
+            return super()._create_connection()
+        finally:
+            _connecting.seconds = getattr(_connecting, "seconds", 0.0) + time.perf_counter() - started
+
+    def recreate(self):
+        pool = super().recreate()
+        pool._rpa_metrics = getattr(self, "_rpa_metrics", None)
+        return pool
+
+
+class PoolMetrics:
+    """Counters collected from pool events for one engine."""
+
+    def __init__(self):
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidated = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.waits = 0
+        self._lock = threading.Lock()
+
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.waits += 1
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+
+    def attach(self, engine: Engine) -> None:
+        """Subscribe to the engine's pool events."""
+        engine.pool._rpa_metrics = self
+
+        @event.listens_for(engine, "connect")
+        def on_connect(dbapi_connection, record):
+            with self._lock:
+                self.connects += 1
+
+        @event.listens_for(engine, "checkout")
+        def on_checkout(dbapi_connection, record, proxy):
+            with self._lock:
+                self.checkouts += 1
+
+        @event.listens_for(engine, "checkin")
+        def on_checkin(dbapi_connection, record):
+            with self._lock:
+                self.checkins += 1
+
+        @event.listens_for(engine, "invalidate")
+        def on_invalidate(dbapi_connection, record, exception):
+            with self._lock:
+                self.invalidated += 1
+
+    def snapshot(self, engine: Engine) -> Dict[str, Any]:
+        """Current pool state plus cumulative counters."""
+        pool = engine.pool
+        with self._lock:
+            stats = {
+                "pool": type(pool).__name__,
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidated": self.invalidated,
+                "wait_time_total": self.wait_total,
+                "wait_time_max": self.wait_max,
+                "wait_time_avg": self.wait_total / self.waits if self.waits else 0.0,
+            }
+        if isinstance(pool, QueuePool):
+            stats.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                # QueuePool counts overflow from -pool_size upwards
+                overflow=max(0, pool.overflow()),
+            )
+        return stats
+
+
+class EngineRegistry:
+    """Share one engine (and connection pool) per database URL.
+
+    Engines are created on first use with the given pool options; later
+    requests for the same URL get the existing engine, so modules,
+    workflows and web requests all draw from the same pool. Each get()
+    counts as a reference; release() disposes the engine once the last
+    reference is gone.
+    """
+
+    def __init__(self):
+        self._engines: Dict[str, Engine] = {}
+        self._metrics: Dict[str, PoolMetrics] = {}
+        self._refs: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return make_url(url).render_as_string(hide_password=False)
+
+    @staticmethod
+    def _engine_kwargs(url: str, options: Dict[str, Any]) -> Dict[str, Any]:
+        """Translate pool settings into create_engine() arguments for the URL's dialect."""
+        parsed = make_url(url)
+        backend = parsed.get_backend_name()
+        in_memory = backend == "sqlite" and parsed.database in (None, "", ":memory:")
+        kwargs: Dict[str, Any] = {}
+
+        if not in_memory:
+            kwargs["poolclass"] = TimedQueuePool
+            for name in ("pool_size", "max_overflow", "pool_timeout"):
+                if options.get(name) is not None:
+                    kwargs[name] = options[name]
+        if options.get("pool_pre_ping"):
+            kwargs["pool_pre_ping"] = True
+        if options.get("pool_recycle") is not None:
+            kwargs["pool_recycle"] = options["pool_recycle"]
+
+        timeout = options.get("statement_timeout")
+        if timeout:
+            if backend == "postgresql":
+                kwargs["connect_args"] = {"options": f"-c statement_timeout={int(timeout * 1000)}"}
+            elif backend not in ("mysql", "mariadb"):
+                logger.warning(f"statement_timeout is not supported for {backend}, ignoring")
+
+        return kwargs
+
+    def get(self, url: str, **options: Any) -> Engine:
+        """Get the engine for a URL, creating it on first use.
+
+        Args:
+            url: SQLAlchemy connection string
+            **options: pool_size, max_overflow, pool_timeout, pool_pre_ping,
+                pool_recycle (seconds) and statement_timeout (seconds);
+                only applied when the engine is first created. MySQL's
+                max_execution_time only limits SELECT statements; MariaDB
+                uses max_statement_time, which covers all statements
+
+        Returns:
+            Shared Engine
+        """
+        key = self._key(url)
+        with self._lock:
+            engine = self._engines.get(key)
+            if engine is not None:
+                self._refs[key] += 1
+                return engine
+
+            engine = create_engine(url, **self._engine_kwargs(url, options))
+
+            timeout = options.get("statement_timeout")
+            if timeout and engine.dialect.name in ("mysql", "mariadb"):
+                @event.listens_for(engine, "connect")
+                def set_timeout(dbapi_connection, record):
+                    # The dialect has already met the server here, so is_mariadb
+                    # is also set for mysql:// URLs that point at MariaDB
+                    if engine.dialect.is_mariadb:
+                        statement = f"SET SESSION max_statement_time = {float(timeout)}"
+                    else:
+                        statement = f"SET SESSION max_execution_time = {int(timeout * 1000)}"
+                    cursor = dbapi_connection.cursor()
+                    cursor.execute(statement)
+                    cursor.close()
+
+            metrics = PoolMetrics()
+            metrics.attach(engine)
+            self._engines[key] = engine
+            self._metrics[key] = metrics
+            self._refs[key] = 1
+
+        logger.info(f"Created engine for {make_url(url).render_as_string(hide_password=True)}")
+        return engine
+
+    def metrics(self, url: Optional[str] = None) -> Dict[str, Any]:
+        """Pool metrics for one URL, or for every engine keyed by masked URL."""
+        with self._lock:
+            items = [(key, engine, self._metrics[key]) for key, engine in self._engines.items()]
+        if url is not None:
+            key = self._key(url)
+            return next((m.snapshot(e) for k, e, m in items if k == key), {})
+        return {
+            make_url(key).render_as_string(hide_password=True): metrics.snapshot(engine)
+            for key, engine, metrics in items
+        }
+
+    def release(self, url: str) -> bool:
+        """Drop one reference taken by get(); dispose the engine when none are left.
+
+        Returns:
+            True if the engine was disposed
+        """
+        key = self._key(url)
+        with self._lock:
+            if key not in self._engines:
+                return False
+            self._refs[key] -= 1
+            if self._refs[key] > 0:
+                return False
+            engine = self._engines.pop(key)
+            self._metrics.pop(key, None)
+            self._refs.pop(key, None)
+        engine.dispose()
+        return True
+
+    def dispose(self, url: Optional[str] = None) -> None:
+        """Close pooled connections and forget the engine(s), whoever still holds them."""
+        with self._lock:
+            keys = [self._key(url)] if url is not None else list(self._engines)
+            engines = [self._engines.pop(k) for k in keys if k in self._engines]
+            for k in keys:
+                self._metrics.pop(k, None)
+                self._refs.pop(k, None)
+        for engine in engines:
+            engine.dispose()
+
+
+_registry = EngineRegistry()
+
+
+def get_engine(url: str, **options: Any) -> Engine:
+    """Get the shared engine for a URL from the process-wide registry."""
+    return _registry.get(url, **options)
+
+
+def engine_metrics(url: Optional[str] = None) -> Dict[str, Any]:
+    """Pool metrics from the process-wide registry."""
+    return _registry.metrics(url)
+
+
+def release_engine(url: str) -> bool:
+    """Release a reference taken with get_engine() (disposes the last one)."""
+    return _registry.release(url)
+
+
+def dispose_engines(url: Optional[str] = None) -> None:
+    """Dispose engines in the process-wide registry."""
+    _registry.dispose(url)
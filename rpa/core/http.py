@@ -0,0 +1,128 @@
+"""Shared asyncio HTTP client for RPA framework."""
+
+import asyncio
+from typing import Any, Dict, Optional
+
+from .logger import LoggerMixin
+
+# httpx is optional - only the async module methods need it
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+    httpx = None
+
+# HTTP/2 support requires the h2 package (pip install httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class AsyncHTTPClient(LoggerMixin):
+    """Lazily-created httpx.AsyncClient with a shared connection pool.
+
+    One client is kept per running event loop, so every coroutine awaiting
+    on that loop reuses the same keep-alive connections (and HTTP/2
+    multiplexing when h2 is installed).
+    """
+
+    def __init__(
+        self,
+        timeout: float = 30,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        http2: bool = True,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self.headers = headers or {}
+        self._client = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closer = None
+
+    def check_available(self) -> None:
+        """Raise RuntimeError if httpx is not installed."""
+        if not HTTPX_AVAILABLE:
+            raise RuntimeError("httpx not installed. Run: pip install httpx")
+
+    @property
+    def client(self) -> "httpx.AsyncClient":
+        """Get or create the client bound to the running event loop."""
+        self.check_available()
+        loop = asyncio.get_running_loop()
+
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            if self._client is not None and not self._client.is_closed:
+                self._close_stale(self._client, self._loop)
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                ),
+                http2=self.http2,
+                headers=self.headers,
+                follow_redirects=True,
+            )
+            self._loop = loop
+            self._closer = None
+            self.logger.debug(f"Created async HTTP client (http2={self.http2})")
+
+        return self._client
+
+    def _close_stale(self, client: "httpx.AsyncClient", loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """Close a client left behind by another event loop.
+
+        Its connections belong to that loop, so they can only be closed
+        there. Loops run by asyncio.run() have already closed it on shutdown
+        (see _close_on_shutdown).
+        """
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        else:
+            self.logger.debug("Dropping async HTTP client of a stopped event loop")
+
+    async def _close_on_shutdown(self, client: "httpx.AsyncClient"):
+        """Async generator that closes the client when its loop shuts down.
+
+        The loop finalizes unfinished async generators on shutdown
+        (asyncio.run() does this), which runs the finally block on the
+        loop the client's connections belong to.
+        """
+        try:
+            yield
+        finally:
+            await client.aclose()
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> "httpx.Response":
+        """Send a request through the shared client.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            **kwargs: httpx request options (params, json, data, headers, ...)
+
+        Returns:
+            httpx.Response
+        """
+        client = self.client
+        if self._closer is None:
+            self._closer = self._close_on_shutdown(client)
+            await self._closer.__anext__()
+        return await client.request(method, url, **kwargs)
+
+    async def aclose(self) -> None:
+        """Close the client and its connection pool."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._loop = None
+        if self._closer is not None:
+            await self._closer.aclose()
+            self._closer = None
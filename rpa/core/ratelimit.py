@@ -0,0 +1,145 @@
+"""Per-host rate limiting for RPA framework."""
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Optional, Union
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """Token bucket that hands out request slots.
+
+    Callers reserve a slot under a short lock and then sleep outside it,
+    so the same bucket is safe to share between threads and coroutines.
+    """
+
+    def __init__(self, interval: float = 1.0, burst: int = 1):
+        """Create a bucket.
+
+        Args:
+            interval: Seconds between requests once the burst is used up
+                (0 disables throttling)
+            burst: Requests allowed back-to-back before throttling
+        """
+        self.interval = interval
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> float:
+        """Add the tokens earned since the last update (lock must be held)."""
+        now = time.monotonic()
+        if now > self._updated:
+            if self.interval > 0:
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) / self.interval)
+            else:
+                self._tokens = float(self.burst)
+            self._updated = now
+        return now
+
+    def reserve(self) -> float:
+        """Take one token.
+
+        Returns:
+            Seconds the caller must wait before sending its request
+        """
+        with self._lock:
+            now = self._refill()
+            wait = max(0.0, self._updated - now)
+            self._tokens -= 1
+            if self._tokens < 0 and self.interval > 0:
+                wait += -self._tokens * self.interval
+            return wait
+
+    def pause(self, seconds: float) -> None:
+        """Block new reservations for `seconds` (e.g. after Retry-After)."""
+        with self._lock:
+            now = self._refill()
+            self._tokens = min(self._tokens, 1.0)
+            self._updated = max(self._updated, now + seconds)
+
+    def slow_to(self, interval: float) -> None:
+        """Raise the interval to at least `interval` and drop the burst."""
+        with self._lock:
+            self._refill()
+            if interval > self.interval:
+                self.interval = interval
+                self.burst = 1
+                self._tokens = min(self._tokens, 1.0)
+
+
+class RateLimiter:
+    """Token-bucket rate limiter keyed by host.
+
+    Each host gets its own bucket, so a slow politeness policy on one site
+    does not throttle requests to the others.
+    """
+
+    def __init__(
+        self,
+        interval: float = 1.0,
+        burst: int = 1,
+        hosts: Optional[Dict[str, Union[float, Dict[str, Any]]]] = None,
+    ):
+        """Create a limiter.
+
+        Args:
+            interval: Default seconds between requests to the same host
+            burst: Default burst capacity per host
+            hosts: Per-host overrides, either an interval or
+                {'interval': ..., 'burst': ...}
+        """
+        self.interval = interval
+        self.burst = burst
+        self._overrides = hosts or {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        """Get the host key for a URL."""
+        return urlparse(url).netloc or url
+
+    def bucket(self, url: str) -> TokenBucket:
+        """Get or create the bucket for a URL's host."""
+        host = self.host_of(url)
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                override = self._overrides.get(host, {})
+                if not isinstance(override, dict):
+                    override = {"interval": override}
+                bucket = TokenBucket(
+                    interval=override.get("interval", self.interval),
+                    burst=override.get("burst", self.burst),
+                )
+                self._buckets[host] = bucket
+            return bucket
+
+    def acquire(self, url: str) -> float:
+        """Block until a request to `url` is allowed.
+
+        Returns:
+            Seconds waited
+        """
+        wait = self.bucket(url).reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def aacquire(self, url: str) -> float:
+        """Async version of acquire() - waits without blocking the event loop."""
+        wait = self.bucket(url).reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def pause(self, url: str, seconds: float) -> None:
+        """Hold off all requests to a host for `seconds`."""
+        self.bucket(url).pause(seconds)
+
+    def set_interval(self, url: str, interval: float) -> None:
+        """Slow a host down to at least `interval` seconds between requests."""
+        self.bucket(url).slow_to(interval)
@@ -4,8 +4,11 @@ from .pdf import PDFModule
 from .docs import DocsModule
 from .email import EmailModule
 from .scraper import ScraperModule
-from .api import APIModule
-from .database import DatabaseModule
+from .crawler import Crawler
+from .driver_pool import DriverPool
+from .page import Page
+from .api import APIModule, BatchError
+from .database import AsyncDatabaseModule, DatabaseModule
 from .desktop import DesktopModule
 
 __all__ = [
@@ -15,7 +18,12 @@ __all__ = [
     "DocsModule",
     "EmailModule",
     "ScraperModule",
+    "Crawler",
+    "DriverPool",
+    "Page",
     "APIModule",
+    "BatchError",
     "DatabaseModule",
+    "AsyncDatabaseModule",
     "DesktopModule",
 ]
@@ -1,15 +1,184 @@
 """API integration module for RPA framework."""
 
+import asyncio
+import math
+import threading
 import time
-from typing import Any, Callable, Dict, List, Optional, Union
-from urllib.parse import urljoin
+from collections import deque
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Union
+from urllib.parse import urljoin, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 
+from ..core.cache import HTTPCache
+from ..core.http import AsyncHTTPClient, httpx
 from ..core.logger import LoggerMixin
 
 
+class BatchError(dict):
+    """Failed batch item: a dict with 'error', 'endpoint' and 'status_code'.
+
+    A separate type so callers can tell failures apart from successful
+    responses whose JSON body happens to contain an 'error' key.
+    """
+
+    @classmethod
+    def from_exception(cls, req: Dict[str, Any], e: Exception) -> "BatchError":
+        response = getattr(e, "response", None)
+        return cls(
+            error=str(e),
+            endpoint=req.get("endpoint"),
+            status_code=response.status_code if response is not None else None,
+        )
+
+
+class _Pagination:
+    """State of one paginated listing, shared by iter_pages() and aiter_pages().
+
+    It works out which request comes next (page number, cursor or next
+    link) and when the listing ends; the iterators only perform the
+    requests. Send the request from next_request() and pass its response
+    to receive().
+    """
+
+    STRATEGIES = ("page", "cursor", "next")
+
+    def __init__(
+        self,
+        api: "APIModule",
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        strategy: str,
+        page_param: str,
+        limit_param: str,
+        limit: int,
+        max_pages: Optional[int],
+        data_key: Optional[str],
+        cursor_param: str,
+        cursor_key: str,
+        next_key: Optional[str],
+        total_key: Optional[str],
+        total_pages_key: Optional[str],
+    ):
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unsupported pagination strategy: {strategy}")
+        self.api = api
+        self.endpoint = endpoint
+        self.strategy = strategy
+        self.page_param = page_param
+        self.limit = limit
+        self.max_pages = max_pages
+        self.data_key = data_key
+        self.cursor_param = cursor_param
+        self.cursor_key = cursor_key
+        self.next_key = next_key
+        self.total_key = total_key
+        self.total_pages_key = total_pages_key
+
+        self.base_params: Dict[str, Any] = {**(params or {}), limit_param: limit}
+        self.url: Optional[str] = endpoint
+        self.params: Optional[Dict[str, Any]] = self.base_params
+        self.page = 0
+        self.last_page: Optional[int] = None
+        self.total_known = False
+        self.done = False
+
+    def page_request(self, page: int) -> tuple:
+        """(url, params) for a numbered page."""
+        return self.endpoint, {**self.base_params, self.page_param: page}
+
+    def next_request(self) -> Optional[tuple]:
+        """(url, params) for the next page, or None when the listing is done."""
+        if self.done:
+            return None
+        if self.strategy == "page":
+            return self.page_request(self.page + 1)
+        return self.url, self.params
+
+    def receive(self, response: Any) -> List[Dict[str, Any]]:
+        """Take the response to next_request() and return its items (empty when done)."""
+        body = response.json()
+        self.page += 1
+        items = self.items(self.page, body)
+        if not items:
+            return items
+
+        if self.strategy == "page":
+            if self.page == 1:
+                self.last_page, self.total_known = self._page_bounds(body)
+            if len(items) < self.limit or (self.last_page is not None and self.page >= self.last_page):
+                self.done = True
+        elif self.max_pages and self.page >= self.max_pages:
+            self.done = True
+        else:
+            self.url, self.params = self._next_link(body, response)
+            self.done = self.url is None
+        return items
+
+    def items(self, page: int, body: Any) -> List[Dict[str, Any]]:
+        """Items of a page's body; an empty page ends the listing."""
+        items = self.api._extract_items(body, self.data_key)
+        if not items:
+            self.done = True
+            return []
+        self.api.logger.info(f"Fetched page {page} ({len(items)} items)")
+        return items
+
+    def prefetch_pages(self, prefetch: int) -> Optional[range]:
+        """Pages left to fetch concurrently, once page 1 has reported the total.
+
+        The caller takes over the rest of the listing, fetching these pages
+        with page_request() and reading them with items().
+        """
+        if prefetch <= 0 or self.strategy != "page" or not self.total_known or self.done or self.page != 1:
+            return None
+        self.done = True
+        return range(2, self.last_page + 1)
+
+    def _page_bounds(self, first: Any) -> tuple:
+        """Work out the last page number from the first response.
+
+        Returns:
+            Tuple of (last_page or None, whether the API reported a total)
+        """
+        lookup = self.api._lookup
+        total_known = False
+        last_page = None
+        if self.total_pages_key and lookup(first, self.total_pages_key) is not None:
+            last_page = int(lookup(first, self.total_pages_key))
+            total_known = True
+        elif self.total_key and lookup(first, self.total_key) is not None:
+            last_page = math.ceil(int(lookup(first, self.total_key)) / self.limit)
+            total_known = True
+        if self.max_pages:
+            last_page = min(last_page, self.max_pages) if last_page else self.max_pages
+        return last_page, total_known
+
+    def _next_link(self, body: Any, response: Any) -> tuple:
+        """Work out the next request for cursor/next-link pagination.
+
+        Returns:
+            Tuple of (url or None when done, params)
+        """
+        if self.strategy == "cursor":
+            cursor = self.api._lookup(body, self.cursor_key)
+            if not cursor:
+                return None, None
+            return self.url, {**self.params, self.cursor_param: cursor}
+
+        next_url = self.api._lookup(body, self.next_key) if self.next_key and isinstance(body, dict) else None
+        if not next_url:
+            next_url = response.links.get("next", {}).get("url")
+        if not next_url:
+            return None, None
+        # Relative links are relative to the page that returned them; the
+        # next URL already carries its own query string
+        return urljoin(str(response.url), next_url), None
+
+
 class APIModule(LoggerMixin):
     """Handle REST API integrations."""
 
@@ -19,13 +188,29 @@ class APIModule(LoggerMixin):
         timeout: int = 30,
         retry_count: int = 3,
         retry_delay: float = 1.0,
+        max_concurrency: int = 8,
+        per_host_limit: Optional[int] = None,
+        cache: Optional[Union[bool, Dict[str, Any], HTTPCache]] = None,
     ):
         self.base_url = base_url
         self.timeout = timeout
         self.retry_count = retry_count
         self.retry_delay = retry_delay
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit
+        self.cache = HTTPCache.from_config(cache)
         self._session = requests.Session()
         self._default_headers: Dict[str, str] = {}
+        self._host_semaphores: Dict[tuple, threading.BoundedSemaphore] = {}
+        self._host_lock = threading.Lock()
+        self._basic_auth: Optional[tuple] = None
+        self._async_client = AsyncHTTPClient(timeout=timeout, max_connections=max(max_concurrency, 100))
+
+        # Size the connection pool so parallel batches reuse keep-alive
+        # connections instead of opening and discarding extra ones.
+        adapter = HTTPAdapter(pool_connections=max_concurrency, pool_maxsize=max_concurrency)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
     def configure(
         self,
@@ -59,6 +244,7 @@ class APIModule(LoggerMixin):
             self._default_headers[api_key_header] = api_key
 
         if basic_auth:
+            self._basic_auth = tuple(basic_auth)
             self._session.auth = HTTPBasicAuth(*basic_auth)
 
     def _build_url(self, endpoint: str) -> str:
@@ -69,6 +255,27 @@ class APIModule(LoggerMixin):
             return urljoin(self.base_url, endpoint)
         return endpoint
 
+    def _cache_lookup(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        request_headers: Dict[str, str],
+    ) -> tuple:
+        """Find a cached GET response, adding validators to request_headers if stale.
+
+        Returns:
+            Tuple of (cache key or None, cache entry or None)
+        """
+        if not self.cache or method != "GET":
+            return None, None
+
+        key = self.cache.key(method, url, params, headers=request_headers, variant=self._basic_auth)
+        entry = self.cache.get(key)
+        if entry and not entry.is_fresh():
+            request_headers.update(self.cache.validators(entry))
+        return key, entry
+
     def _request(
         self,
         method: str,
@@ -86,6 +293,11 @@ class APIModule(LoggerMixin):
         if headers:
             request_headers.update(headers)
 
+        key, entry = self._cache_lookup(method, url, params, request_headers)
+        if entry and entry.is_fresh():
+            self.logger.info(f"{method} {url} -> {entry.status_code} (cached)")
+            return entry.to_response()
+
         last_error = None
 
         for attempt in range(self.retry_count):
@@ -104,8 +316,14 @@ class APIModule(LoggerMixin):
                 # Log request
                 self.logger.info(f"{method} {url} -> {response.status_code}")
 
+                if entry and response.status_code == 304:
+                    return self.cache.revalidated(key, entry, response.headers).to_response()
+
                 # Raise for 4xx/5xx errors
                 response.raise_for_status()
+
+                if key:
+                    self.cache.store(key, response.url, response.status_code, response.headers, response.content)
                 return response
 
             except requests.exceptions.RequestException as e:
@@ -204,67 +422,213 @@ class APIModule(LoggerMixin):
         """Make a GET request and return raw response."""
         return self._request("GET", endpoint, params=params)
 
-    def paginate(
+    @staticmethod
+    def _lookup(response: Any, key: str) -> Any:
+        """Look up a dotted key path (e.g. 'meta.next_cursor') in a response."""
+        value = response
+        for part in key.split("."):
+            if isinstance(value, dict):
+                value = value.get(part)
+            else:
+                return None
+        return value
+
+    def _extract_items(self, response: Any, data_key: Optional[str]) -> List[Dict[str, Any]]:
+        """Pull the list of items out of a page response."""
+        if data_key:
+            return self._lookup(response, data_key) or []
+        if isinstance(response, list):
+            return response
+        return response.get("data", response.get("items", response.get("results", [])))
+
+    def _fetch_page(self, endpoint: str, params: Dict[str, Any]) -> requests.Response:
+        """Fetch one page and return the raw response."""
+        return self._request("GET", endpoint, params=params)
+
+    def iter_pages(
         self,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
+        strategy: str = "page",
         page_param: str = "page",
         limit_param: str = "limit",
         limit: int = 100,
         max_pages: Optional[int] = None,
         data_key: Optional[str] = None,
-    ) -> List[Dict[str, Any]]:
-        """Fetch paginated data from an API.
+        cursor_param: str = "cursor",
+        cursor_key: str = "next_cursor",
+        next_key: Optional[str] = "next",
+        total_key: Optional[str] = None,
+        total_pages_key: Optional[str] = None,
+        prefetch: int = 0,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Lazily fetch pages from a paginated API.
 
         Args:
             endpoint: API endpoint
             params: Base query parameters
+            strategy: 'page' (page/limit numbers), 'cursor' (opaque cursor
+                returned in each response) or 'next' (follow a next-page URL)
             page_param: Parameter name for page number
             limit_param: Parameter name for page size
             limit: Items per page
             max_pages: Maximum pages to fetch
-            data_key: Key in response containing data list
-
-        Returns:
-            Combined list of all items
+            data_key: Key in response containing data list (dotted paths allowed)
+            cursor_param: Parameter name for the cursor ('cursor' strategy)
+            cursor_key: Response key holding the next cursor ('cursor' strategy)
+            next_key: Response key holding the next URL ('next' strategy);
+                falls back to the HTTP Link header when missing
+            total_key: Response key holding the total item count
+            total_pages_key: Response key holding the total page count
+            prefetch: Pages to fetch concurrently ahead of the consumer once
+                the page count is known ('page' strategy only)
+
+        Yields:
+            List of items for each page
         """
-        all_items = []
-        page = 1
-        params = params or {}
-
+        pager = _Pagination(
+            self, endpoint, params, strategy, page_param, limit_param, limit, max_pages,
+            data_key, cursor_param, cursor_key, next_key, total_key, total_pages_key,
+        )
         while True:
-            params[page_param] = page
-            params[limit_param] = limit
+            request = pager.next_request()
+            if request is None:
+                return
+            items = pager.receive(self._fetch_page(*request))
+            if not items:
+                return
+            yield items
 
-            response = self.get(endpoint, params=params)
+            pages = pager.prefetch_pages(prefetch)
+            if pages:
+                yield from self._prefetch_pages(pager, pages, prefetch)
+                return
 
-            if data_key:
-                items = response.get(data_key, [])
-            elif isinstance(response, list):
-                items = response
-            else:
-                items = response.get("data", response.get("items", response.get("results", [])))
+    def _prefetch_pages(self, pager: _Pagination, pages: range, prefetch: int) -> Iterator[List[Dict[str, Any]]]:
+        """Fetch the given pages with up to `prefetch` requests in flight, yielding in order."""
+        pages = iter(pages)
+        pending = deque()
 
-            if not items:
-                break
+        with ThreadPoolExecutor(max_workers=prefetch) as executor:
+            for page in pages:
+                pending.append((page, executor.submit(self._fetch_page, *pager.page_request(page))))
+                if len(pending) >= prefetch:
+                    break
 
-            all_items.extend(items)
-            self.logger.info(f"Fetched page {page}, total items: {len(all_items)}")
+            while pending:
+                page, future = pending.popleft()
+                items = pager.items(page, future.result().json())
 
-            if len(items) < limit:
-                break
+                next_page = next(pages, None)
+                if next_page is not None and items:
+                    pending.append((next_page, executor.submit(self._fetch_page, *pager.page_request(next_page))))
 
-            if max_pages and page >= max_pages:
-                break
+                if not items:
+                    for _, queued in pending:
+                        queued.cancel()
+                    break
 
-            page += 1
+                yield items
 
+    def iter_items(self, endpoint: str, **kwargs) -> Iterator[Dict[str, Any]]:
+        """Lazily yield individual items from a paginated API.
+
+        Accepts the same arguments as iter_pages().
+        """
+        for items in self.iter_pages(endpoint, **kwargs):
+            yield from items
+
+    def paginate(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_param: str = "page",
+        limit_param: str = "limit",
+        limit: int = 100,
+        max_pages: Optional[int] = None,
+        data_key: Optional[str] = None,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """Fetch paginated data from an API.
+
+        Args:
+            endpoint: API endpoint
+            params: Base query parameters
+            page_param: Parameter name for page number
+            limit_param: Parameter name for page size
+            limit: Items per page
+            max_pages: Maximum pages to fetch
+            data_key: Key in response containing data list
+            **kwargs: Additional iter_pages() options (strategy, prefetch, ...)
+
+        Returns:
+            Combined list of all items
+        """
+        all_items = list(self.iter_items(
+            endpoint,
+            params=params,
+            page_param=page_param,
+            limit_param=limit_param,
+            limit=limit,
+            max_pages=max_pages,
+            data_key=data_key,
+            **kwargs,
+        ))
+        self.logger.info(f"Fetched {len(all_items)} items from {endpoint}")
         return all_items
 
+    def _host_semaphore(self, url: str, limit: int) -> threading.BoundedSemaphore:
+        """Get the semaphore limiting concurrent requests to a host."""
+        key = (urlparse(url).netloc, limit)
+        with self._host_lock:
+            semaphore = self._host_semaphores.get(key)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(limit)
+                self._host_semaphores[key] = semaphore
+            return semaphore
+
+    def _dispatch(self, req: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a single batch request config."""
+        method = req.get("method", "GET").upper()
+        endpoint = req["endpoint"]
+
+        if method == "GET":
+            return self.get(endpoint, params=req.get("params"), headers=req.get("headers"))
+        elif method == "POST":
+            return self.post(endpoint, json=req.get("json"), data=req.get("data"), headers=req.get("headers"))
+        elif method == "PUT":
+            return self.put(endpoint, json=req.get("json"), data=req.get("data"), headers=req.get("headers"))
+        elif method == "PATCH":
+            return self.patch(endpoint, json=req.get("json"), data=req.get("data"), headers=req.get("headers"))
+        elif method == "DELETE":
+            return {"success": self.delete(endpoint, headers=req.get("headers"))}
+        else:
+            raise ValueError(f"Unsupported method: {method}")
+
+    def _run_batch_item(
+        self,
+        req: Dict[str, Any],
+        per_host_limit: Optional[int],
+        raise_on_error: bool,
+    ) -> Dict[str, Any]:
+        """Run one batch item, honoring the per-host limit and capturing errors."""
+        try:
+            if per_host_limit:
+                with self._host_semaphore(self._build_url(req["endpoint"]), per_host_limit):
+                    return self._dispatch(req)
+            return self._dispatch(req)
+        except Exception as e:
+            if raise_on_error:
+                raise
+            return BatchError.from_exception(req, e)
+
     def batch_request(
         self,
         requests_data: List[Dict[str, Any]],
         parallel: bool = False,
+        max_concurrency: Optional[int] = None,
+        per_host_limit: Optional[int] = None,
+        raise_on_error: Optional[bool] = None,
     ) -> List[Dict[str, Any]]:
         """Execute multiple API requests.
 
@@ -272,33 +636,308 @@ class APIModule(LoggerMixin):
             requests_data: List of request configs, each with:
                 - method: HTTP method
                 - endpoint: API endpoint
-                - params/json/data: Request data
-            parallel: Execute in parallel (not implemented yet)
+                - params/json/data/headers: Request data
+            parallel: Execute concurrently on a bounded worker pool
+            max_concurrency: Maximum in-flight requests (default: module setting)
+            per_host_limit: Maximum in-flight requests per host (default: module setting)
+            raise_on_error: Re-raise the first failure instead of capturing it
+                (default: True when serial, False when parallel). In parallel
+                mode, requests not yet started are cancelled; those already
+                in flight still finish
 
         Returns:
-            List of responses
+            List of responses in the same order as requests_data. Failed
+            items are returned as BatchError dicts with 'error', 'endpoint'
+            and 'status_code' keys unless raise_on_error is set.
         """
-        results = []
-
-        for req in requests_data:
-            method = req.get("method", "GET").upper()
-            endpoint = req["endpoint"]
-
-            if method == "GET":
-                result = self.get(endpoint, params=req.get("params"))
-            elif method == "POST":
-                result = self.post(endpoint, json=req.get("json"), data=req.get("data"))
-            elif method == "PUT":
-                result = self.put(endpoint, json=req.get("json"))
-            elif method == "DELETE":
-                result = {"success": self.delete(endpoint)}
-            else:
-                raise ValueError(f"Unsupported method: {method}")
-
-            results.append(result)
+        per_host_limit = per_host_limit or self.per_host_limit
+        if raise_on_error is None:
+            raise_on_error = not parallel
+
+        if not parallel or len(requests_data) <= 1:
+            return [
+                self._run_batch_item(req, per_host_limit, raise_on_error)
+                for req in requests_data
+            ]
+
+        workers = min(max_concurrency or self.max_concurrency, len(requests_data))
+        self.logger.info(f"Running {len(requests_data)} requests with {workers} workers")
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._run_batch_item, req, per_host_limit, raise_on_error)
+                for req in requests_data
+            ]
+            if raise_on_error:
+                done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+                failed = [f for f in futures if f in done and f.exception() is not None]
+                if failed:
+                    # Don't start queued requests after the failure that stops the batch
+                    for future in futures:
+                        future.cancel()
+                    failed[0].result()
+            results = [future.result() for future in futures]
+
+        failed = sum(1 for r in results if isinstance(r, BatchError))
+        if failed:
+            self.logger.warning(f"Batch finished with {failed}/{len(results)} failed requests")
 
         return results
 
+    # Async methods (require httpx) - share one connection pool per event loop
+
+    async def _arequest(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        files: Optional[Dict[str, Any]] = None,
+    ) -> "httpx.Response":
+        """Make an async HTTP request with retry logic."""
+        self._async_client.check_available()
+        url = self._build_url(endpoint)
+
+        request_headers = self._default_headers.copy()
+        if headers:
+            request_headers.update(headers)
+
+        key, entry = self._cache_lookup(method, url, params, request_headers)
+        if entry and entry.is_fresh():
+            self.logger.info(f"{method} {url} -> {entry.status_code} (cached)")
+            return entry.to_httpx_response()
+
+        last_error = None
+
+        for attempt in range(self.retry_count):
+            try:
+                response = await self._async_client.request(
+                    method,
+                    url,
+                    params=params,
+                    data=data,
+                    json=json,
+                    headers=request_headers,
+                    files=files,
+                    auth=self._basic_auth,
+                )
+
+                self.logger.info(f"{method} {url} -> {response.status_code}")
+
+                if entry and response.status_code == 304:
+                    return self.cache.revalidated(key, entry, response.headers).to_httpx_response()
+
+                response.raise_for_status()
+
+                if key:
+                    self.cache.store(key, str(response.url), response.status_code, response.headers, response.content)
+                return response
+
+            except httpx.HTTPError as e:
+                last_error = e
+                if attempt < self.retry_count - 1:
+                    self.logger.warning(f"Request failed, retrying ({attempt + 1}/{self.retry_count}): {e}")
+                    await asyncio.sleep(self.retry_delay * (attempt + 1))
+                else:
+                    self.logger.error(f"Request failed after {self.retry_count} attempts: {e}")
+                    raise
+
+        raise last_error
+
+    async def aget(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Async version of get()."""
+        response = await self._arequest("GET", endpoint, params=params, headers=headers)
+        return response.json()
+
+    async def apost(
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        files: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Async version of post()."""
+        response = await self._arequest("POST", endpoint, data=data, json=json, headers=headers, files=files)
+        return response.json()
+
+    async def aput(
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Async version of put()."""
+        response = await self._arequest("PUT", endpoint, data=data, json=json, headers=headers)
+        return response.json()
+
+    async def apatch(
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """Async version of patch()."""
+        response = await self._arequest("PATCH", endpoint, data=data, json=json, headers=headers)
+        return response.json()
+
+    async def adelete(
+        self,
+        endpoint: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> bool:
+        """Async version of delete()."""
+        response = await self._arequest("DELETE", endpoint, headers=headers)
+        return response.is_success
+
+    async def aiter_pages(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        strategy: str = "page",
+        page_param: str = "page",
+        limit_param: str = "limit",
+        limit: int = 100,
+        max_pages: Optional[int] = None,
+        data_key: Optional[str] = None,
+        cursor_param: str = "cursor",
+        cursor_key: str = "next_cursor",
+        next_key: Optional[str] = "next",
+        total_key: Optional[str] = None,
+        total_pages_key: Optional[str] = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Async version of iter_pages().
+
+        With a known page count and prefetch=K, up to K page requests are
+        in flight on the event loop while pages are yielded in order.
+        """
+        pager = _Pagination(
+            self, endpoint, params, strategy, page_param, limit_param, limit, max_pages,
+            data_key, cursor_param, cursor_key, next_key, total_key, total_pages_key,
+        )
+        while True:
+            request = pager.next_request()
+            if request is None:
+                return
+            items = pager.receive(await self._arequest("GET", *request))
+            if not items:
+                return
+            yield items
+
+            pages = pager.prefetch_pages(prefetch)
+            if pages:
+                break
+
+        async def fetch(page: int) -> Any:
+            response = await self._arequest("GET", *pager.page_request(page))
+            return response.json()
+
+        pages = iter(pages)
+        pending = deque()
+        for page in pages:
+            pending.append((page, asyncio.ensure_future(fetch(page))))
+            if len(pending) >= prefetch:
+                break
+
+        try:
+            while pending:
+                page, task = pending.popleft()
+                items = pager.items(page, await task)
+                if not items:
+                    return
+
+                next_page = next(pages, None)
+                if next_page is not None:
+                    pending.append((next_page, asyncio.ensure_future(fetch(next_page))))
+
+                yield items
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+    async def aiter_items(self, endpoint: str, **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        """Async version of iter_items()."""
+        async for items in self.aiter_pages(endpoint, **kwargs):
+            for item in items:
+                yield item
+
+    async def apaginate(self, endpoint: str, **kwargs) -> List[Dict[str, Any]]:
+        """Async version of paginate()."""
+        all_items = [item async for item in self.aiter_items(endpoint, **kwargs)]
+        self.logger.info(f"Fetched {len(all_items)} items from {endpoint}")
+        return all_items
+
+    async def _adispatch(self, req: Dict[str, Any]) -> Dict[str, Any]:
+        """Async version of _dispatch()."""
+        method = req.get("method", "GET").upper()
+        endpoint = req["endpoint"]
+
+        if method == "GET":
+            return await self.aget(endpoint, params=req.get("params"), headers=req.get("headers"))
+        elif method == "POST":
+            return await self.apost(endpoint, json=req.get("json"), data=req.get("data"), headers=req.get("headers"))
+        elif method == "PUT":
+            return await self.aput(endpoint, json=req.get("json"), data=req.get("data"), headers=req.get("headers"))
+        elif method == "PATCH":
+            return await self.apatch(endpoint, json=req.get("json"), data=req.get("data"), headers=req.get("headers"))
+        elif method == "DELETE":
+            return {"success": await self.adelete(endpoint, headers=req.get("headers"))}
+        else:
+            raise ValueError(f"Unsupported method: {method}")
+
+    async def abatch_request(
+        self,
+        requests_data: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None,
+        per_host_limit: Optional[int] = None,
+        raise_on_error: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Async version of batch_request() - always runs concurrently.
+
+        Concurrency is bounded by semaphores on the event loop rather than
+        by worker threads, so hundreds of requests can be in flight at once.
+        """
+        limit = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+        per_host_limit = per_host_limit or self.per_host_limit
+        host_limits: Dict[str, asyncio.Semaphore] = {}
+
+        async def run(req: Dict[str, Any]) -> Dict[str, Any]:
+            host = urlparse(self._build_url(req["endpoint"])).netloc
+            if per_host_limit and host not in host_limits:
+                host_limits[host] = asyncio.Semaphore(per_host_limit)
+            try:
+                async with limit:
+                    if per_host_limit:
+                        async with host_limits[host]:
+                            return await self._adispatch(req)
+                    return await self._adispatch(req)
+            except Exception as e:
+                if raise_on_error:
+                    raise
+                return BatchError.from_exception(req, e)
+
+        results = await asyncio.gather(*(run(req) for req in requests_data))
+
+        failed = sum(1 for r in results if isinstance(r, BatchError))
+        if failed:
+            self.logger.warning(f"Batch finished with {failed}/{len(results)} failed requests")
+
+        return list(results)
+
+    async def aclose(self) -> None:
+        """Close the async connection pool."""
+        await self._async_client.aclose()
+
     def webhook_handler(
         self,
         callback: Callable[[Dict[str, Any]], Any],
@@ -344,3 +983,4 @@ class APIModule(LoggerMixin):
         """Clear authentication headers."""
         self._default_headers.pop("Authorization", None)
         self._session.auth = None
+        self._basic_auth = None
@@ -0,0 +1,355 @@
+"""Concurrent web crawler built on ScraperModule."""
+
+import asyncio
+import csv
+import json
+import re
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+from urllib.parse import urldefrag, urljoin, urlparse
+
+from ..core.logger import LoggerMixin
+from .page import Page
+
+
+class JSONLSink:
+    """Write crawl records to a JSON Lines file as they arrive."""
+
+    def __init__(self, file_path: str):
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+        self.file_path = file_path
+        self._file = open(file_path, "w", encoding="utf-8")
+
+    def write(self, record: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(record, default=str) + "\n")
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class CSVSink:
+    """Write crawl records to a CSV file; columns come from the first record."""
+
+    def __init__(self, file_path: str, fieldnames: Optional[List[str]] = None):
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+        self.file_path = file_path
+        self.fieldnames = fieldnames
+        self._file = open(file_path, "w", newline="", encoding="utf-8")
+        self._writer: Optional[csv.DictWriter] = None
+
+    def write(self, record: Dict[str, Any]) -> None:
+        if self._writer is None:
+            self._writer = csv.DictWriter(
+                self._file,
+                fieldnames=self.fieldnames or list(record.keys()),
+                extrasaction="ignore",
+            )
+            self._writer.writeheader()
+        self._writer.writerow({
+            k: json.dumps(v) if isinstance(v, (list, dict)) else v
+            for k, v in record.items()
+        })
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class DatabaseSink:
+    """Buffer crawl records and insert them into a table in batches."""
+
+    def __init__(self, database, table: str, batch_size: int = 500):
+        """Create a sink.
+
+        Args:
+            database: Connected DatabaseModule
+            table: Target table (columns must match record keys)
+            batch_size: Records per insert
+        """
+        self.database = database
+        self.table = table
+        self.batch_size = batch_size
+        self._buffer: List[Dict[str, Any]] = []
+
+    def write(self, record: Dict[str, Any]) -> None:
+        self._buffer.append({
+            k: json.dumps(v) if isinstance(v, (list, dict)) else v
+            for k, v in record.items()
+        })
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buffer:
+            self.database.bulk_insert(self.table, self._buffer, batch_size=self.batch_size)
+            self._buffer = []
+
+    def close(self) -> None:
+        self.flush()
+
+
+def open_sink(target: Union[str, Callable[[Dict[str, Any]], Any], Any]) -> Any:
+    """Turn a sink argument into an object with write()/close().
+
+    Args:
+        target: Path ending in .jsonl/.csv, a callable, or a sink object
+
+    Returns:
+        Sink object
+    """
+    if isinstance(target, str):
+        suffix = Path(target).suffix.lower()
+        if suffix in (".jsonl", ".ndjson"):
+            return JSONLSink(target)
+        elif suffix == ".csv":
+            return CSVSink(target)
+        raise ValueError(f"Unsupported sink format: {suffix}")
+
+    if hasattr(target, "write"):
+        return target
+
+    if callable(target):
+        class _CallableSink:
+            def write(self, record):
+                target(record)
+
+            def close(self):
+                pass
+
+        return _CallableSink()
+
+    raise TypeError(f"Unsupported sink: {target!r}")
+
+
+class Crawler(LoggerMixin):
+    """Crawl from seed URLs with a bounded number of concurrent fetches.
+
+    Pages are fetched through the scraper's async client, so per-host
+    politeness comes from its rate limiter. Extracted records are written
+    to the sink as each page is parsed rather than collected in memory.
+
+    Example:
+        crawler = Crawler(
+            scraper,
+            selectors={"title": "h1", "price": ".price"},
+            max_depth=2,
+            concurrency=16,
+        )
+        stats = crawler.run(["https://shop.example.com/"], sink="products.jsonl")
+
+        # inside a running event loop (async code, Jupyter)
+        stats = await crawler.arun(["https://shop.example.com/"], sink="products.jsonl")
+    """
+
+    def __init__(
+        self,
+        scraper,
+        selectors: Optional[Dict[str, Union[str, Dict[str, Any]]]] = None,
+        item_selector: Optional[str] = None,
+        max_depth: int = 1,
+        max_pages: Optional[int] = None,
+        concurrency: int = 8,
+        allowed_domains: Optional[List[str]] = None,
+        include_patterns: Optional[List[str]] = None,
+        exclude_patterns: Optional[List[str]] = None,
+        link_selector: str = "a[href]",
+        parser: Optional[str] = None,
+    ):
+        """Configure a crawl.
+
+        Args:
+            scraper: ScraperModule used for fetching
+            selectors: Dict of {field: selector spec} to extract (see Page.extract)
+            item_selector: Emit one record per matching element, with
+                selectors applied inside it (default: one record per page)
+            max_depth: Link depth to follow from the seeds (0 = seeds only)
+            max_pages: Maximum pages to fetch
+            concurrency: Maximum pages fetched at once
+            allowed_domains: Hosts to stay on (default: the seeds' hosts)
+            include_patterns: Regexes a URL must match to be followed
+            exclude_patterns: Regexes that stop a URL from being followed
+            link_selector: CSS selector for links to follow
+            parser: Page parser (default: the scraper's parser)
+        """
+        self.scraper = scraper
+        self.selectors = selectors or {}
+        self.item_selector = item_selector
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        self.concurrency = concurrency
+        self.allowed_domains = set(allowed_domains or [])
+        self.include_patterns = [re.compile(p) for p in include_patterns or []]
+        self.exclude_patterns = [re.compile(p) for p in exclude_patterns or []]
+        self.link_selector = link_selector
+        self.parser = parser
+
+        self._domains: set = set()
+        self._seen: set = set()
+        self._enqueued = 0
+        self._stats: Dict[str, Any] = {}
+
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        """Normalize a URL for de-duplication (drop fragment, lowercase host)."""
+        url, _ = urldefrag(url)
+        parsed = urlparse(url)
+        path = parsed.path or "/"
+        return parsed._replace(
+            scheme=parsed.scheme.lower(),
+            netloc=parsed.netloc.lower(),
+            path=path,
+        ).geturl()
+
+    def _in_scope(self, url: str) -> bool:
+        """Check whether a URL should be crawled."""
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https"):
+            return False
+        if self._domains and parsed.netloc.lower() not in self._domains:
+            return False
+        if self.include_patterns and not any(p.search(url) for p in self.include_patterns):
+            return False
+        if any(p.search(url) for p in self.exclude_patterns):
+            return False
+        return True
+
+    def _enqueue(self, queue: asyncio.Queue, url: str, depth: int) -> None:
+        """Add a URL to the frontier if it is new and in scope."""
+        if self.max_pages and self._enqueued >= self.max_pages:
+            return
+        url = self.normalize_url(url)
+        if url in self._seen or not self._in_scope(url):
+            return
+        self._seen.add(url)
+        self._enqueued += 1
+        queue.put_nowait((url, depth))
+
+    def extract(self, page: Page, depth: int) -> List[Dict[str, Any]]:
+        """Build records from a parsed page.
+
+        Args:
+            page: Parsed page
+            depth: Crawl depth of the page
+
+        Returns:
+            List of records
+        """
+        base = {"url": page.url, "depth": depth}
+
+        if not self.selectors:
+            title = page.select_one("title")
+            return [{**base, "title": page.element_text(title) if title is not None else None}]
+
+        if self.item_selector:
+            return [{**base, **item} for item in page.extract_items(self.item_selector, self.selectors)]
+
+        return [{**base, **page.extract(self.selectors)}]
+
+    async def _worker(self, queue: asyncio.Queue, sink: Any) -> None:
+        """Fetch pages from the frontier until cancelled."""
+        while True:
+            url, depth = await queue.get()
+            try:
+                response = await self.scraper.aget(url)
+                content_type = response.headers.get("Content-Type", "")
+                if "html" not in content_type and content_type:
+                    continue
+
+                page = Page(response.text, url=url, parser=self.parser or self.scraper.parser)
+                self._stats["pages"] += 1
+
+                for record in self.extract(page, depth):
+                    sink.write(record)
+                    self._stats["records"] += 1
+
+                if depth < self.max_depth:
+                    for a in page.select(self.link_selector):
+                        href = a.get("href")
+                        if href:
+                            self._enqueue(queue, urljoin(str(response.url), href), depth + 1)
+
+            except Exception as e:
+                self._stats["errors"] += 1
+                self.logger.warning(f"Failed to crawl {url}: {type(e).__name__}: {e}")
+            finally:
+                queue.task_done()
+
+    async def arun(
+        self,
+        seeds: Iterable[str],
+        sink: Union[str, Callable[[Dict[str, Any]], Any], Any],
+    ) -> Dict[str, Any]:
+        """Crawl from the seed URLs, streaming records to a sink.
+
+        Use this from code that already runs an event loop; run() wraps it
+        for synchronous callers. Fetching needs httpx; without it the crawl
+        raises RuntimeError before it starts.
+
+        Args:
+            seeds: Starting URLs
+            sink: Path (.jsonl/.csv), callable, or object with write()/close()
+
+        Returns:
+            Dict with pages, records, errors and duration
+        """
+        # Fail up front rather than counting every page as an error
+        self.scraper._async_client.check_available()
+        seeds = list(seeds)
+        self._domains = self.allowed_domains or {urlparse(s).netloc.lower() for s in seeds}
+
+        self._seen = set()
+        self._enqueued = 0
+        self._stats = {"pages": 0, "records": 0, "errors": 0}
+        started = time.time()
+
+        sink = open_sink(sink)
+        queue: asyncio.Queue = asyncio.Queue()
+        for seed in seeds:
+            self._enqueue(queue, seed, 0)
+
+        self.logger.info(f"Crawling from {len(seeds)} seeds with {self.concurrency} workers")
+        workers = [
+            asyncio.ensure_future(self._worker(queue, sink))
+            for _ in range(self.concurrency)
+        ]
+
+        try:
+            await queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            sink.close()
+
+        self._stats["duration"] = time.time() - started
+        self.logger.info(
+            f"Crawl finished: {self._stats['pages']} pages, "
+            f"{self._stats['records']} records, {self._stats['errors']} errors"
+        )
+        return dict(self._stats)
+
+    def run(
+        self,
+        seeds: Iterable[str],
+        sink: Union[str, Callable[[Dict[str, Any]], Any], Any],
+    ) -> Dict[str, Any]:
+        """Blocking version of arun() - runs the crawl on a new event loop.
+
+        It cannot be used where an event loop is already running (async
+        code, Jupyter); await arun() there instead and close the scraper's
+        async client with `await scraper.aclose()` when done.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError("Crawler.run() cannot be called from a running event loop; await Crawler.arun() instead")
+
+        async def main():
+            try:
+                return await self.arun(seeds, sink)
+            finally:
+                await self.scraper.aclose()
+
+        return asyncio.run(main())
@@ -0,0 +1,460 @@
+"""Parallel, resumable file downloads."""
+
+import hashlib
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import requests
+
+from ..core.logger import LoggerMixin
+
+
+class RemoteFileChanged(IOError):
+    """The remote file changed while parts of it were being downloaded."""
+
+
+class _Progress:
+    """Thread-safe byte counter that reports to a progress callback.
+
+    Bytes are counted per part file and re-synced with what the part holds
+    on disk at the start of every attempt, so retries never count the same
+    bytes twice.
+    """
+
+    def __init__(self, url: str, total: Optional[int], callback: Optional[Callable[[Dict[str, Any]], Any]]):
+        self.url = url
+        self.total = total
+        self.callback = callback
+        self.started = time.time()
+        self._parts: Dict[str, int] = {}
+        self._resumed: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def downloaded(self) -> int:
+        with self._lock:
+            return sum(self._parts.values())
+
+    @property
+    def resumed(self) -> int:
+        """Bytes that were already on disk before the first attempt."""
+        with self._lock:
+            return sum(self._resumed.values())
+
+    def start(self, part: Path, have: int) -> None:
+        """Record the bytes a part holds on disk before an attempt."""
+        key = str(part)
+        with self._lock:
+            self._parts[key] = have
+            # A part restarted from scratch keeps nothing from earlier runs
+            self._resumed[key] = min(self._resumed.get(key, have), have)
+
+    def advance(self, part: Path, n: int) -> None:
+        with self._lock:
+            self._parts[str(part)] += n
+            downloaded = sum(self._parts.values())
+            fetched = downloaded - sum(self._resumed.values())
+
+        if self.callback:
+            elapsed = time.time() - self.started
+            self.callback({
+                "url": self.url,
+                "downloaded": downloaded,
+                "total": self.total,
+                "speed": fetched / elapsed if elapsed > 0 else 0.0,
+            })
+
+
+class DownloadManager(LoggerMixin):
+    """Download files concurrently with resume, segmentation and de-duplication.
+
+    - Partial downloads are kept as `<name>.part` and resumed with HTTP
+      Range requests, so a failed transfer continues where it stopped.
+      The file's ETag or Last-Modified is stored beside the part and sent
+      as If-Range, so a file that changed in between is fetched again
+      from the start instead of being spliced together.
+    - Large files on servers that accept ranges are fetched as several
+      segments in parallel and joined on completion.
+    - Files are renamed into place atomically once complete.
+    - With dedupe=True, content already downloaded by this manager (same
+      SHA-256) is hard-linked instead of stored twice. Linked outputs share
+      their data, so editing one in place changes the other as well.
+
+    Example:
+        manager = DownloadManager(max_workers=8)
+        results = manager.download_many({
+            "https://example.com/a.zip": "downloads/a.zip",
+            "https://example.com/b.zip": "downloads/b.zip",
+        })
+    """
+
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: int = 30,
+        max_workers: int = 4,
+        chunk_size: int = 1024 * 1024,
+        segments: int = 4,
+        segment_threshold: int = 16 * 1024 * 1024,
+        retries: int = 3,
+        retry_delay: float = 1.0,
+        dedupe: bool = False,
+        before_request: Optional[Callable[[str], Any]] = None,
+        progress: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    ):
+        """Create a download manager.
+
+        Args:
+            session: requests session to use (default: a new one)
+            headers: Headers sent with every request
+            timeout: Request timeout in seconds
+            max_workers: Files downloaded at once by download_many()
+            chunk_size: Bytes read per chunk
+            segments: Parallel ranges per large file (1 disables segmenting)
+            segment_threshold: Minimum size in bytes for a segmented download
+            retries: Attempts per file or segment before giving up
+            retry_delay: Base delay between attempts (multiplied by attempt)
+            dedupe: Hard-link files whose content was already downloaded
+                (linked files share their data, so leave this off if
+                outputs are edited in place)
+            before_request: Called with the URL before each request (e.g. a rate limiter)
+            progress: Default progress callback, called with a dict of
+                url, downloaded, total and speed (bytes/second)
+        """
+        self.session = session or requests.Session()
+        self.headers = headers or {}
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.segments = max(1, segments)
+        self.segment_threshold = segment_threshold
+        self.retries = max(1, retries)
+        self.retry_delay = retry_delay
+        self.dedupe = dedupe
+        self.before_request = before_request
+        self.progress = progress
+
+        self._hashes: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, url: str, method: str = "GET", headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        if self.before_request:
+            self.before_request(url)
+        return self.session.request(
+            method,
+            url,
+            # Ask for the bytes as stored: sizes and ranges then refer to
+            # the file itself, not to a compressed transfer encoding
+            headers={**self.headers, **(headers or {}), "Accept-Encoding": "identity"},
+            stream=method == "GET",
+            timeout=self.timeout,
+            allow_redirects=True,
+        )
+
+    def _probe(self, url: str) -> Tuple[Optional[int], bool, Optional[str]]:
+        """Find the file size, whether the server accepts byte ranges, and its validator.
+
+        The validator is a strong ETag or else Last-Modified (weak ETags
+        cannot be used in If-Range); None if the server sends neither.
+        """
+        try:
+            response = self._get(url, method="HEAD")
+        except requests.RequestException:
+            return None, False, None
+        if response.status_code >= 400:
+            return None, False, None
+
+        length = response.headers.get("Content-Length")
+        ranges = response.headers.get("Accept-Ranges", "").lower() == "bytes"
+        etag = response.headers.get("ETag")
+        validator = etag if etag and not etag.startswith("W/") else response.headers.get("Last-Modified")
+        return (int(length) if length and length.isdigit() else None), ranges, validator
+
+    @staticmethod
+    def _part_files(tmp: Path) -> List[Path]:
+        """The part file and any segment parts (`<name>.part0`, ...) on disk."""
+        if not tmp.parent.exists():
+            return []
+        return [
+            p for p in tmp.parent.iterdir()
+            if p.name == tmp.name or (p.name.startswith(tmp.name) and p.name[len(tmp.name):].isdigit())
+        ]
+
+    def _prepare_parts(self, url: str, tmp: Path, validator: Optional[str]) -> None:
+        """Keep earlier partial downloads only if they are of the same remote version.
+
+        Parts without a matching stored validator cannot be trusted and are
+        deleted; the current validator is then stored for later resumes.
+        """
+        stamp = tmp.with_name(tmp.name + ".validator")
+        stored = stamp.read_text(encoding="utf-8") if stamp.exists() else None
+        if validator is None or stored != validator:
+            parts = self._part_files(tmp)
+            if parts:
+                self.logger.info(f"Discarding partial download of {url}: remote version unknown or changed")
+            for part in parts:
+                part.unlink()
+
+        if validator is None:
+            stamp.unlink(missing_ok=True)
+        else:
+            stamp.write_text(validator, encoding="utf-8")
+
+    def _fetch_range(
+        self,
+        url: str,
+        part: Path,
+        start: int,
+        end: Optional[int],
+        progress: _Progress,
+        resumable: bool = True,
+        validator: Optional[str] = None,
+    ) -> None:
+        """Download bytes start..end (inclusive) into `part`, resuming from its current size.
+
+        Raises IOError if the part does not end up with the expected size,
+        and RemoteFileChanged if the server answers with a different
+        version of the file.
+        """
+        expected = end - start + 1 if end is not None else None
+        have = part.stat().st_size if part.exists() else 0
+        if have and (not resumable or (expected is not None and have > expected)):
+            part.unlink()
+            have = 0
+
+        if expected is not None and have == expected:
+            progress.start(part, expected)
+            return
+
+        headers = {}
+        if start + have > 0 or end is not None:
+            headers["Range"] = f"bytes={start + have}-{end if end is not None else ''}"
+            if validator:
+                # The server sends the whole file instead if it has changed
+                headers["If-Range"] = validator
+
+        response = self._get(url, headers=headers)
+        response.raise_for_status()
+
+        mode = "ab"
+        if headers and response.status_code != 206:
+            current = response.headers.get("ETag") or response.headers.get("Last-Modified")
+            if validator and current and validator not in (current, response.headers.get("Last-Modified")):
+                part.unlink(missing_ok=True)
+                raise RemoteFileChanged(f"{url} changed since the download started")
+            if start > 0:
+                raise IOError(f"Server ignored range request for {url}")
+            # Full body instead of the requested range: start over
+            mode, have = "wb", 0
+
+        progress.start(part, have)
+
+        with open(part, mode) as f:
+            for chunk in response.iter_content(chunk_size=self.chunk_size):
+                if chunk:
+                    f.write(chunk)
+                    progress.advance(part, len(chunk))
+
+        # A server may still compress despite Accept-Encoding: identity, in
+        # which case the decoded size can't be compared with the range
+        encoding = response.headers.get("Content-Encoding", "identity").lower()
+        if expected is not None and encoding in ("", "identity"):
+            got = part.stat().st_size
+            if got != expected:
+                # Raised inside _with_retries, so the next attempt resumes
+                raise IOError(f"Incomplete download of {url}: {got} of {expected} bytes")
+
+    def _with_retries(self, func: Callable, *args) -> None:
+        """Run a fetch, retrying (and thereby resuming) on network errors."""
+        for attempt in range(1, self.retries + 1):
+            try:
+                return func(*args)
+            except RemoteFileChanged:
+                raise
+            except (requests.RequestException, IOError) as e:
+                if attempt == self.retries:
+                    raise
+                self.logger.warning(f"Download attempt {attempt} failed ({e}), retrying")
+                time.sleep(self.retry_delay * attempt)
+
+    @staticmethod
+    def _sha256(path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _download_segmented(
+        self,
+        url: str,
+        tmp: Path,
+        size: int,
+        progress: _Progress,
+        validator: Optional[str] = None,
+    ) -> int:
+        """Fetch a file as parallel byte ranges and join them into `tmp`."""
+        step = -(-size // self.segments)
+        bounds = [(start, min(start + step, size) - 1) for start in range(0, size, step)]
+        parts = [tmp.with_name(f"{tmp.name}{i}") for i in range(len(bounds))]
+
+        with ThreadPoolExecutor(max_workers=len(bounds)) as executor:
+            futures = [
+                executor.submit(
+                    self._with_retries, self._fetch_range, url, part, start, end, progress, True, validator,
+                )
+                for part, (start, end) in zip(parts, bounds)
+            ]
+            for future in futures:
+                future.result()
+
+        with open(tmp, "wb") as out:
+            for part in parts:
+                with open(part, "rb") as f:
+                    shutil.copyfileobj(f, out, self.chunk_size)
+        for part in parts:
+            part.unlink()
+
+        return len(bounds)
+
+    def _finalize(self, tmp: Path, path: Path) -> Tuple[str, Optional[str]]:
+        """Move a finished download into place, linking to identical content if seen before.
+
+        Returns:
+            (sha256, path of the identical earlier download or None)
+        """
+        digest = self._sha256(tmp)
+
+        with self._lock:
+            # `path` is about to be overwritten, so whatever it held before
+            # can no longer serve as a link target
+            for stale in [d for d, p in self._hashes.items() if p == str(path)]:
+                del self._hashes[stale]
+
+            original = self._hashes.get(digest) if self.dedupe else None
+            if original and not (Path(original).exists() and self._sha256(Path(original)) == digest):
+                # Changed or removed since it was downloaded
+                del self._hashes[digest]
+                original = None
+
+            if original:
+                tmp.unlink()
+                try:
+                    os.link(original, tmp)
+                except OSError:
+                    shutil.copyfile(original, tmp)
+            else:
+                self._hashes[digest] = str(path)
+
+        os.replace(tmp, path)
+        return digest, original
+
+    def download(
+        self,
+        url: str,
+        output_path: str,
+        progress: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    ) -> Dict[str, Any]:
+        """Download one file.
+
+        Args:
+            url: File URL
+            output_path: Destination path
+            progress: Progress callback (default: the manager's)
+
+        Returns:
+            Dict with url, path, bytes, sha256, segments, resumed_bytes,
+            duration and duplicate_of
+        """
+        started = time.time()
+        path = Path(output_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".part")
+
+        for attempt in (1, 2):
+            size, ranges, validator = self._probe(url)
+            self._prepare_parts(url, tmp, validator)
+            tracker = _Progress(url, size, progress or self.progress)
+            try:
+                if ranges and size and self.segments > 1 and size >= self.segment_threshold:
+                    segments = self._download_segmented(url, tmp, size, tracker, validator)
+                else:
+                    segments = 1
+                    end = size - 1 if ranges and size else None
+                    self._with_retries(self._fetch_range, url, tmp, 0, end, tracker, ranges, validator)
+                break
+            except RemoteFileChanged as e:
+                if attempt == 2:
+                    raise
+                # Segments of two versions cannot be joined: start again from zero
+                self.logger.warning(f"{e}, restarting download")
+                for part in self._part_files(tmp):
+                    part.unlink()
+                tmp.with_name(tmp.name + ".validator").unlink(missing_ok=True)
+
+        digest, duplicate_of = self._finalize(tmp, path)
+        tmp.with_name(tmp.name + ".validator").unlink(missing_ok=True)
+        duration = time.time() - started
+        self.logger.info(
+            f"Downloaded {url} to {path} ({tracker.downloaded} bytes in {duration:.2f}s"
+            f"{f', {segments} segments' if segments > 1 else ''})"
+        )
+
+        return {
+            "url": url,
+            "path": str(path),
+            "bytes": path.stat().st_size,
+            "sha256": digest,
+            "segments": segments,
+            "resumed_bytes": tracker.resumed,
+            "duration": duration,
+            "duplicate_of": duplicate_of,
+        }
+
+    def download_many(
+        self,
+        downloads: Union[Dict[str, str], List[Tuple[str, str]]],
+        max_workers: Optional[int] = None,
+        progress: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        raise_on_error: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Download many files concurrently.
+
+        Args:
+            downloads: Dict of {url: output_path} or list of (url, output_path)
+            max_workers: Files downloaded at once (default: manager's max_workers)
+            progress: Progress callback for every file
+            raise_on_error: Re-raise the first failure instead of recording it
+
+        Returns:
+            Result dicts in input order; failed downloads have 'error' set
+        """
+        items = list(downloads.items()) if isinstance(downloads, dict) else list(downloads)
+        started = time.time()
+
+        def run(item):
+            url, output_path = item
+            try:
+                return self.download(url, output_path, progress)
+            except Exception as e:
+                if raise_on_error:
+                    raise
+                self.logger.warning(f"Failed to download {url}: {e}")
+                return {"url": url, "path": output_path, "error": str(e)}
+
+        with ThreadPoolExecutor(max_workers=max_workers or self.max_workers) as executor:
+            results = list(executor.map(run, items))
+
+        total = sum(r.get("bytes", 0) for r in results)
+        failed = sum(1 for r in results if "error" in r)
+        self.logger.info(
+            f"Downloaded {len(results) - failed}/{len(results)} files "
+            f"({total} bytes) in {time.time() - started:.2f}s"
+        )
+        return results
@@ -0,0 +1,203 @@
+"""Pool of reusable Selenium WebDrivers."""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional
+
+from ..core.logger import LoggerMixin
+
+
+class DriverPool(LoggerMixin):
+    """Thread-safe pool of WebDriver instances with checkout/checkin semantics.
+
+    Browsers are started lazily up to `size`, reused across pages, health
+    checked on checkout and recycled after `max_pages` pages or when the
+    page's JS heap grows past `max_memory_mb`.
+
+    Example:
+        pool = DriverPool(make_driver, size=4)
+        with pool.driver() as driver:
+            driver.get("https://example.com")
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        size: int = 2,
+        max_pages: Optional[int] = 100,
+        max_memory_mb: Optional[float] = None,
+        checkout_timeout: Optional[float] = None,
+    ):
+        """Create a pool.
+
+        Args:
+            factory: Callable that starts a new WebDriver
+            size: Maximum number of live browsers
+            max_pages: Recycle a browser after this many checkouts
+            max_memory_mb: Recycle a browser when its JS heap exceeds this
+            checkout_timeout: Seconds to wait for a free browser (None = forever)
+        """
+        self.factory = factory
+        self.size = max(1, size)
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self.checkout_timeout = checkout_timeout
+
+        self._idle: deque = deque()
+        self._info: Dict[int, Dict[str, Any]] = {}
+        self._live = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._stats = {"created": 0, "recycled": 0, "unhealthy": 0, "checkouts": 0, "wait_time": 0.0}
+
+    def _is_healthy(self, driver: Any) -> bool:
+        """Check that the browser still answers commands."""
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def _memory_mb(self, driver: Any) -> Optional[float]:
+        """JS heap size of the current page in MB (Chrome only)."""
+        try:
+            used = driver.execute_script(
+                "return window.performance && performance.memory ? performance.memory.usedJSHeapSize : null"
+            )
+            return used / (1024 * 1024) if used else None
+        except Exception:
+            return None
+
+    def _quit(self, driver: Any) -> None:
+        """Quit a browser, ignoring errors from already-dead sessions."""
+        with self._cond:
+            self._info.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def checkout(self, timeout: Optional[float] = None) -> Any:
+        """Take a browser from the pool, starting one if below `size`.
+
+        Args:
+            timeout: Seconds to wait for a free browser (default: checkout_timeout)
+
+        Returns:
+            WebDriver instance; return it with checkin()
+        """
+        timeout = self.checkout_timeout if timeout is None else timeout
+        started = time.time()
+        deadline = started + timeout if timeout is not None else None
+
+        while True:
+            with self._cond:
+                if self._closed:
+                    raise RuntimeError("Driver pool is closed")
+
+                driver = self._idle.popleft() if self._idle else None
+                create = driver is None and self._live < self.size
+                if create:
+                    self._live += 1
+                elif driver is None:
+                    remaining = deadline - time.time() if deadline else None
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError(f"No browser available after {timeout}s")
+                    self._cond.wait(remaining)
+                    continue
+
+            if create:
+                try:
+                    driver = self.factory()
+                except Exception:
+                    with self._cond:
+                        self._live -= 1
+                        self._cond.notify()
+                    raise
+                with self._cond:
+                    self._info[id(driver)] = {"pages": 0, "created": time.time()}
+                    self._stats["created"] += 1
+                self.logger.info(f"Started browser {self._stats['created']} ({self._live}/{self.size} live)")
+            elif not self._is_healthy(driver):
+                self.logger.warning("Discarding unresponsive browser")
+                self._discard(driver, "unhealthy")
+                continue
+
+            with self._cond:
+                self._stats["checkouts"] += 1
+                self._stats["wait_time"] += time.time() - started
+            return driver
+
+    def _discard(self, driver: Any, reason: str = "recycled") -> None:
+        """Quit a browser and free its slot."""
+        self._quit(driver)
+        with self._cond:
+            self._live -= 1
+            self._stats[reason] += 1
+            self._cond.notify()
+
+    def checkin(self, driver: Any, discard: bool = False) -> None:
+        """Return a browser to the pool.
+
+        Args:
+            driver: Browser obtained from checkout()
+            discard: Quit the browser instead of reusing it (e.g. after an error)
+        """
+        with self._cond:
+            info = self._info.setdefault(id(driver), {"pages": 0, "created": time.time()})
+            info["pages"] += 1
+            pages = info["pages"]
+
+        recycle = discard or self._closed
+        if not recycle and self.max_pages and pages >= self.max_pages:
+            self.logger.info(f"Recycling browser after {pages} pages")
+            recycle = True
+        if not recycle and self.max_memory_mb:
+            memory = self._memory_mb(driver)
+            if memory and memory > self.max_memory_mb:
+                self.logger.info(f"Recycling browser using {memory:.0f} MB JS heap")
+                recycle = True
+
+        if recycle:
+            self._discard(driver)
+            return
+
+        with self._cond:
+            self._idle.append(driver)
+            self._cond.notify()
+
+    @contextmanager
+    def driver(self, timeout: Optional[float] = None):
+        """Check out a browser for the duration of a with-block.
+
+        If the block raises, the browser is health checked and discarded
+        only if it no longer responds; otherwise it goes back to the pool.
+        """
+        driver = self.checkout(timeout)
+        try:
+            yield driver
+        except Exception:
+            self.checkin(driver, discard=not self._is_healthy(driver))
+            raise
+        else:
+            self.checkin(driver)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Pool counters: live, idle, created, recycled, unhealthy, checkouts, wait_time."""
+        with self._cond:
+            return {"live": self._live, "idle": len(self._idle), **self._stats}
+
+    def close(self) -> None:
+        """Quit all idle browsers; browsers still checked out are quit on checkin."""
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._live -= len(idle)
+            self._cond.notify_all()
+
+        for driver in idle:
+            self._quit(driver)
@@ -0,0 +1,273 @@
+"""Parse-once page handle for multi-selector extraction."""
+
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Union
+from urllib.parse import urljoin
+
+import soupsieve
+from bs4 import BeautifulSoup
+
+from ..core.logger import LoggerMixin
+
+# lxml.html + cssselect is an optional, faster backend for large pages
+try:
+    import lxml.html
+    from lxml.cssselect import CSSSelector
+    LXML_CSS_AVAILABLE = True
+except ImportError:
+    LXML_CSS_AVAILABLE = False
+    CSSSelector = None
+
+
+@lru_cache(maxsize=512)
+def _compile_soup_selector(selector: str):
+    """Compile a CSS selector for BeautifulSoup trees."""
+    return soupsieve.compile(selector)
+
+
+@lru_cache(maxsize=512)
+def _compile_lxml_selector(selector: str):
+    """Compile a CSS selector to an XPath-backed lxml selector."""
+    return CSSSelector(selector)
+
+
+class Page(LoggerMixin):
+    """A fetched page parsed once, with cached compiled selectors.
+
+    Every extraction runs against the same parsed tree, so pulling many
+    fields out of one page costs a single download and a single parse.
+
+    Parsers:
+        - 'lxml' / 'html.parser': BeautifulSoup tree (default)
+        - 'lxml.html': raw lxml tree queried through cssselect; several
+          times faster on large pages, but `soup` is not available
+    """
+
+    def __init__(
+        self,
+        html: Union[str, bytes],
+        url: str = "",
+        parser: str = "lxml",
+        status_code: Optional[int] = None,
+    ):
+        self.html = html
+        self.url = url
+        self.parser = parser
+        self.status_code = status_code
+        self._soup: Optional[BeautifulSoup] = None
+        self._tree = None
+
+        if parser == "lxml.html" and not LXML_CSS_AVAILABLE:
+            raise RuntimeError("The lxml.html parser requires cssselect (pip install cssselect)")
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        """BeautifulSoup tree (parsed on first access)."""
+        if self.parser == "lxml.html":
+            raise RuntimeError("soup is not available with the lxml.html parser")
+        if self._soup is None:
+            self._soup = BeautifulSoup(self.html, self.parser)
+        return self._soup
+
+    @property
+    def tree(self):
+        """lxml tree (parsed on first access, lxml.html parser only)."""
+        if self.parser != "lxml.html":
+            raise RuntimeError("tree is only available with the lxml.html parser")
+        if self._tree is None:
+            try:
+                self._tree = lxml.html.fromstring(self.html)
+            except ValueError:
+                # Unicode strings with an XML encoding declaration
+                self._tree = lxml.html.fromstring(self.html.encode("utf-8"))
+        return self._tree
+
+    # Backend-neutral element helpers
+
+    def select(self, selector: str) -> List[Any]:
+        """Return all elements matching a CSS selector."""
+        if self.parser == "lxml.html":
+            return _compile_lxml_selector(selector)(self.tree)
+        return _compile_soup_selector(selector).select(self.soup)
+
+    def select_one(self, selector: str, within: Any = None) -> Optional[Any]:
+        """Return the first element matching a CSS selector (inside `within` if given)."""
+        if self.parser == "lxml.html":
+            matches = self._lxml_select_in(within, selector) if within is not None else (
+                _compile_lxml_selector(selector)(self.tree)
+            )
+            return matches[0] if matches else None
+        return _compile_soup_selector(selector).select_one(within if within is not None else self.soup)
+
+    def select_all_in(self, element: Any, selector: str) -> List[Any]:
+        """Return all descendants of `element` matching a CSS selector."""
+        if self.parser == "lxml.html":
+            return self._lxml_select_in(element, selector)
+        return _compile_soup_selector(selector).select(element)
+
+    @staticmethod
+    def _lxml_select_in(element: Any, selector: str) -> List[Any]:
+        # cssselect also matches the element itself; soupsieve only its descendants
+        return [m for m in _compile_lxml_selector(selector)(element) if m is not element]
+
+    def element_text(self, element: Any) -> str:
+        """Stripped text of an element."""
+        if self.parser == "lxml.html":
+            return "".join(s.strip() for s in element.itertext())
+        return element.get_text(strip=True)
+
+    def element_attrs(self, element: Any) -> Dict[str, Any]:
+        """Attributes of an element."""
+        if self.parser == "lxml.html":
+            return dict(element.attrib)
+        return dict(element.attrs)
+
+    def element_attr(self, element: Any, name: str) -> Any:
+        """Single attribute of an element."""
+        return element.get(name)
+
+    # Extraction
+
+    def text(self, selector: Optional[str] = None) -> str:
+        """Extract text content.
+
+        Args:
+            selector: CSS selector (default: whole page text)
+
+        Returns:
+            Extracted text
+        """
+        if selector:
+            text = " ".join(self.element_text(el) for el in self.select(selector))
+        elif self.parser == "lxml.html":
+            text = " ".join(s.strip() for s in self.tree.itertext() if s.strip())
+        else:
+            text = self.soup.get_text(separator=" ", strip=True)
+
+        self.logger.info(f"Extracted {len(text)} characters from {self.url}")
+        return text
+
+    def links(self, selector: str = "a[href]", absolute: bool = True) -> List[str]:
+        """Extract link targets.
+
+        Args:
+            selector: CSS selector for links
+            absolute: Convert to absolute URLs
+
+        Returns:
+            List of URLs
+        """
+        links = []
+
+        for a in self.select(selector):
+            href = a.get("href")
+            if href:
+                if absolute:
+                    href = urljoin(self.url, href)
+                links.append(href)
+
+        self.logger.info(f"Found {len(links)} links on {self.url}")
+        return links
+
+    def table(self, table_selector: str = "table", index: int = 0) -> List[List[str]]:
+        """Extract table rows.
+
+        Args:
+            table_selector: CSS selector for table
+            index: Table index if multiple match
+
+        Returns:
+            List of rows, each row is a list of cell values
+        """
+        tables = self.select(table_selector)
+
+        if not tables or index >= len(tables):
+            return []
+
+        rows = []
+        for tr in self.select_all_in(tables[index], "tr"):
+            cells = [self.element_text(td) for td in self.select_all_in(tr, "td, th")]
+            if cells:
+                rows.append(cells)
+
+        self.logger.info(f"Extracted table with {len(rows)} rows")
+        return rows
+
+    def elements(self, selector: str, attributes: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Extract text and attributes from matching elements.
+
+        Args:
+            selector: CSS selector
+            attributes: List of attributes to extract (default: all)
+
+        Returns:
+            List of dicts with text and attributes
+        """
+        results = []
+
+        for el in self.select(selector):
+            data = {"text": self.element_text(el)}
+
+            if attributes:
+                for attr in attributes:
+                    data[attr] = self.element_attr(el, attr)
+            else:
+                data["attrs"] = self.element_attrs(el)
+
+            results.append(data)
+
+        self.logger.info(f"Extracted {len(results)} elements matching '{selector}'")
+        return results
+
+    def _extract_field(self, spec: Union[str, Dict[str, Any]], within: Any = None) -> Any:
+        """Extract one field described by a selector string or spec dict."""
+        if isinstance(spec, str):
+            spec = {"selector": spec}
+
+        selector = spec["selector"]
+        attr = spec.get("attr")
+
+        def value(el):
+            return self.element_attr(el, attr) if attr else self.element_text(el)
+
+        if spec.get("all"):
+            matches = self.select_all_in(within, selector) if within is not None else self.select(selector)
+            return [value(el) for el in matches]
+
+        el = self.select_one(selector, within)
+        return value(el) if el is not None else spec.get("default")
+
+    def extract(self, selectors: Dict[str, Union[str, Dict[str, Any]]]) -> Dict[str, Any]:
+        """Extract many fields from the page in one pass over the parsed tree.
+
+        Args:
+            selectors: Dict of {field: spec}, where spec is a CSS selector
+                (text of the first match) or a dict with 'selector' and
+                optional 'attr', 'all' (list of every match) and 'default'
+
+        Returns:
+            Dict of {field: value}
+        """
+        return {name: self._extract_field(spec) for name, spec in selectors.items()}
+
+    def extract_items(
+        self,
+        item_selector: str,
+        selectors: Dict[str, Union[str, Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        """Extract one record per element matching item_selector.
+
+        Args:
+            item_selector: CSS selector for each item (e.g. a product card)
+            selectors: Field specs as in extract(), evaluated inside each item
+
+        Returns:
+            List of records
+        """
+        return [
+            {name: self._extract_field(spec, item) for name, spec in selectors.items()}
+            for item in self.select(item_selector)
+        ]
+
+    def __repr__(self) -> str:
+        return f"Page(url='{self.url}', parser='{self.parser}')"
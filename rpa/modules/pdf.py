@@ -1,7 +1,18 @@
 """PDF automation module for RPA framework."""
 
+import glob
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 import pdfplumber
 from PyPDF2 import PdfReader, PdfWriter, PdfMerger
@@ -9,11 +20,307 @@ from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
 from reportlab.lib.units import inch
 
+from ..core.cache import ExtractionCache
 from ..core.logger import LoggerMixin
 
 
+def _iter_pages(
+    file_path: str,
+    pages: Optional[List[int]] = None,
+    text: bool = True,
+    tables: bool = True,
+) -> Iterator[Dict[str, Any]]:
+    """Yield one record per page, releasing each page's parsed layout afterwards.
+
+    Args:
+        file_path: Path to PDF file
+        pages: Page numbers (0-indexed); None or empty for all pages
+        text: Include the page text
+        tables: Include the page tables
+
+    Yields:
+        Dict with page, width, height, rotation and optionally text and tables
+    """
+    with pdfplumber.open(file_path) as pdf:
+        page_list = pages if pages else range(len(pdf.pages))
+
+        for page_num in page_list:
+            if not 0 <= page_num < len(pdf.pages):
+                continue
+
+            page = pdf.pages[page_num]
+            record = {
+                "page": page_num,
+                "width": float(page.width),
+                "height": float(page.height),
+                "rotation": page.rotation,
+            }
+            try:
+                if text:
+                    record["text"] = page.extract_text() or ""
+                if tables:
+                    record["tables"] = page.extract_tables()
+            finally:
+                # Drop the page's cached chars/layout so memory stays flat
+                page.close()
+
+            yield record
+
+
+def _extract_pages(file_path: str, pages: Optional[List[int]], kind: str) -> List[Any]:
+    """Extract text or tables from the given pages of one PDF.
+
+    Runs in worker processes, so it only takes and returns picklable values.
+
+    Args:
+        file_path: Path to PDF file
+        pages: Page numbers (0-indexed); None or empty for all pages
+        kind: 'text' or 'tables'
+
+    Returns:
+        One result per valid page, in the order given
+    """
+    records = _iter_pages(file_path, pages, text=kind == "text", tables=kind == "tables")
+    return [record[kind] for record in records]
+
+
+# Batch pipeline operations, by the PDFModule method they call:
+# transforms produce a new PDF that later steps work on, extractions
+# write their result next to the output, and split ends the chain.
+BATCH_TRANSFORMS = ("decrypt", "encrypt", "rotate_pages", "add_watermark", "extract_pages")
+BATCH_EXTRACTIONS = ("extract_text", "extract_tables", "get_info")
+BATCH_TERMINAL = ("split",)
+
+
+def _normalize_steps(steps: List[Union[str, Dict[str, Any], tuple]]) -> List[Dict[str, Any]]:
+    """Turn step specs into {"op": name, **params} dicts and validate them.
+
+    Args:
+        steps: Operation names, dicts with 'op' and the method's keyword
+            arguments, or (name, params) tuples
+
+    Returns:
+        List of step dicts
+    """
+    normalized = []
+    for step in steps:
+        if isinstance(step, str):
+            step = {"op": step}
+        elif isinstance(step, tuple):
+            step = {"op": step[0], **(step[1] if len(step) > 1 else {})}
+        else:
+            step = dict(step)
+
+        op = step.get("op")
+        if op not in BATCH_TRANSFORMS + BATCH_EXTRACTIONS + BATCH_TERMINAL:
+            raise ValueError(f"Unsupported batch operation: {op}")
+        if normalized and normalized[-1]["op"] in BATCH_TERMINAL:
+            raise ValueError(f"'{normalized[-1]['op']}' must be the last batch operation")
+        normalized.append(step)
+
+    return normalized
+
+
+def _process_file(file_path: str, steps: List[Dict[str, Any]], output_dir: str) -> Dict[str, Any]:
+    """Run an operation chain on one PDF and describe the outcome.
+
+    Runs in worker processes. Errors are caught and recorded so one bad
+    file never stops the batch.
+
+    Args:
+        file_path: Input PDF
+        steps: Normalized steps
+        output_dir: Directory for this file's outputs
+
+    Returns:
+        Manifest record
+    """
+    started = time.perf_counter()
+    record: Dict[str, Any] = {"input": file_path, "status": "ok", "outputs": [], "results": {}, "steps": []}
+    module = PDFModule()
+    module.logger.disabled = True  # per-file detail goes to the manifest instead
+
+    out_dir = Path(output_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    stem = Path(file_path).stem
+    current = file_path
+    op = None
+
+    with tempfile.TemporaryDirectory(prefix="rpa_pdf_") as work_dir:
+        try:
+            for i, step in enumerate(steps):
+                op = step["op"]
+                params = {k: v for k, v in step.items() if k != "op"}
+                step_started = time.perf_counter()
+
+                if op in BATCH_TRANSFORMS:
+                    # Keep the input's name so split parts are named after it
+                    target = Path(work_dir) / str(i) / f"{stem}.pdf"
+                    target.parent.mkdir()
+                    current = getattr(module, op)(current, str(target), **params)
+                elif op == "extract_text":
+                    text = module.extract_text(current, **params)
+                    path = out_dir / f"{stem}.txt"
+                    path.write_text(text, encoding="utf-8")
+                    record["results"][op] = {"path": str(path), "characters": len(text)}
+                elif op == "extract_tables":
+                    tables = module.extract_tables(current, **params)
+                    path = out_dir / f"{stem}.tables.json"
+                    path.write_text(json.dumps(tables), encoding="utf-8")
+                    record["results"][op] = {"path": str(path), "tables": len(tables)}
+                elif op == "get_info":
+                    info = module.get_info(current)
+                    info["path"] = file_path
+                    record["results"][op] = info
+                elif op == "split":
+                    record["outputs"] = module.split(current, str(out_dir), **params)
+
+                record["steps"].append({"op": op, "seconds": round(time.perf_counter() - step_started, 4)})
+
+            if current != file_path and not record["outputs"]:
+                target = out_dir / f"{stem}.pdf"
+                shutil.move(current, target)
+                record["outputs"] = [str(target)]
+
+        except Exception as e:
+            record.update(status="error", failed_step=op, error=f"{type(e).__name__}: {e}")
+
+    record["seconds"] = round(time.perf_counter() - started, 4)
+    return record
+
+
 class PDFModule(LoggerMixin):
-    """Handle PDF file operations."""
+    """Handle PDF file operations.
+
+    Text and table extraction can be spread over a pool of worker
+    processes: pages are split into chunks of `chunk_size`, extracted in
+    parallel and merged back in page order. The pool is started on first
+    use and kept for later files until close() is called.
+
+    With a cache, extracted pages are stored by file content hash, so
+    extracting an unchanged document again is a lookup instead of a parse.
+    """
+
+    def __init__(
+        self,
+        workers: int = 0,
+        chunk_size: int = 25,
+        cache: Union[bool, Dict[str, Any], ExtractionCache, None] = None,
+    ):
+        """Create the module.
+
+        Args:
+            workers: Processes for page-parallel extraction (0 or 1 = serial)
+            chunk_size: Pages per worker task; documents with fewer pages
+                than this are extracted serially
+            cache: Extraction cache - True, a dict with enabled, path and
+                max_bytes, or an ExtractionCache (default: disabled)
+        """
+        self.workers = workers or 0
+        self.chunk_size = max(1, chunk_size)
+        self.cache = ExtractionCache.from_config(cache)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """Worker process pool, started on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+                self.logger.info(f"Started PDF worker pool with {self.workers} processes")
+            return self._executor
+
+    def _page_count(self, file_path: str) -> int:
+        with pdfplumber.open(file_path) as pdf:
+            return len(pdf.pages)
+
+    def _extract(self, file_path: str, pages: Optional[List[int]], kind: str) -> List[Any]:
+        """Per-page extraction results, served from the cache where possible."""
+        if self.cache is None:
+            return self._run_extraction(file_path, pages, kind)
+
+        digest = self.cache.file_digest(file_path)
+        options = {"pdfplumber": pdfplumber.__version__}
+
+        count_key = self.cache.key(digest, "pages")
+        count = self.cache.get(count_key)
+        if count is None:
+            count = self._page_count(file_path)
+            self.cache.set(count_key, count)
+
+        page_list = [p for p in (pages if pages else range(count)) if 0 <= p < count]
+        keys = {p: self.cache.key(digest, kind, p, options=options) for p in page_list}
+
+        cached = self.cache.get_many(list(keys.values()))
+        results = {p: cached[key] for p, key in keys.items() if key in cached}
+
+        missing = [p for p in keys if p not in results]
+        if missing:
+            extracted = dict(zip(missing, self._run_extraction(file_path, missing, kind)))
+            self.cache.set_many({keys[p]: value for p, value in extracted.items()})
+            results.update(extracted)
+
+        self.logger.info(f"Extraction cache: {len(keys) - len(missing)} of {len(keys)} pages cached")
+        return [results[p] for p in page_list]
+
+    def _run_extraction(self, file_path: str, pages: Optional[List[int]], kind: str) -> List[Any]:
+        """Per-page extraction results, sharded across the worker pool when it pays off."""
+        if self.workers <= 1:
+            return _extract_pages(file_path, pages, kind)
+
+        count = self._page_count(file_path)
+        page_list = [p for p in (pages if pages else range(count)) if 0 <= p < count]
+        if len(page_list) <= self.chunk_size:
+            return _extract_pages(file_path, page_list, kind)
+
+        chunks = [
+            page_list[i:i + self.chunk_size]
+            for i in range(0, len(page_list), self.chunk_size)
+        ]
+        self.logger.info(f"Extracting {len(page_list)} pages in {len(chunks)} chunks")
+
+        results = []
+        for chunk in self.executor.map(_extract_pages, repeat(file_path), chunks, repeat(kind)):
+            results.extend(chunk)
+        return results
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def iter_pages(
+        self,
+        file_path: str,
+        pages: Optional[List[int]] = None,
+        text: bool = True,
+        tables: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazily extract a PDF page by page.
+
+        Only one page's layout is held at a time, so memory stays flat
+        regardless of document length.
+
+        Args:
+            file_path: Path to PDF file
+            pages: Specific page numbers to extract (0-indexed)
+            text: Include page text
+            tables: Include page tables
+
+        Yields:
+            Dict with page (0-indexed), width, height, rotation, text and tables
+        """
+        self.logger.info(f"Iterating pages of: {file_path}")
+        count = 0
+
+        for record in _iter_pages(file_path, pages, text=text, tables=tables):
+            count += 1
+            yield record
+
+        self.logger.info(f"Iterated {count} pages")
 
     def extract_text(
         self,
@@ -30,16 +337,7 @@ class PDFModule(LoggerMixin):
             Extracted text content
         """
         self.logger.info(f"Extracting text from: {file_path}")
-        text_parts = []
-
-        with pdfplumber.open(file_path) as pdf:
-            page_list = pages if pages else range(len(pdf.pages))
-
-            for page_num in page_list:
-                if 0 <= page_num < len(pdf.pages):
-                    page = pdf.pages[page_num]
-                    text = page.extract_text() or ""
-                    text_parts.append(text)
+        text_parts = self._extract(file_path, pages, "text")
 
         result = "\n\n".join(text_parts)
         self.logger.info(f"Extracted {len(result)} characters from PDF")
@@ -62,14 +360,8 @@ class PDFModule(LoggerMixin):
         self.logger.info(f"Extracting tables from: {file_path}")
         all_tables = []
 
-        with pdfplumber.open(file_path) as pdf:
-            page_list = pages if pages else range(len(pdf.pages))
-
-            for page_num in page_list:
-                if 0 <= page_num < len(pdf.pages):
-                    page = pdf.pages[page_num]
-                    tables = page.extract_tables()
-                    all_tables.extend(tables)
+        for tables in self._extract(file_path, pages, "tables"):
+            all_tables.extend(tables)
 
         self.logger.info(f"Extracted {len(all_tables)} tables from PDF")
         return all_tables
@@ -220,9 +512,9 @@ class PDFModule(LoggerMixin):
         Returns:
             Path to watermarked PDF
         """
-        # Create watermark PDF
-        watermark_path = "/tmp/watermark_temp.pdf"
-        c = canvas.Canvas(watermark_path, pagesize=letter)
+        # Create watermark PDF in memory (safe to run in parallel)
+        watermark_pdf = io.BytesIO()
+        c = canvas.Canvas(watermark_pdf, pagesize=letter)
         c.saveState()
         c.setFillAlpha(opacity)
         c.setFont("Helvetica", 60)
@@ -234,7 +526,8 @@ class PDFModule(LoggerMixin):
 
         # Apply watermark
         reader = PdfReader(input_file)
-        watermark_reader = PdfReader(watermark_path)
+        watermark_pdf.seek(0)
+        watermark_reader = PdfReader(watermark_pdf)
         watermark_page = watermark_reader.pages[0]
 
         writer = PdfWriter()
@@ -245,7 +538,6 @@ class PDFModule(LoggerMixin):
         with open(output_path, "wb") as f:
             writer.write(f)
 
-        Path(watermark_path).unlink()
         self.logger.info(f"Added watermark to PDF: {output_path}")
         return output_path
 
@@ -361,7 +653,8 @@ class PDFModule(LoggerMixin):
             Path to decrypted PDF
         """
         reader = PdfReader(input_file)
-        reader.decrypt(password)
+        if reader.is_encrypted:
+            reader.decrypt(password)
 
         writer = PdfWriter()
         for page in reader.pages:
@@ -372,3 +665,149 @@ class PDFModule(LoggerMixin):
 
         self.logger.info(f"Created decrypted PDF: {output_path}")
         return output_path
+
+    # Batch processing
+
+    def batch(
+        self,
+        inputs: Union[str, List[str]],
+        steps: List[Union[str, Dict[str, Any], tuple]],
+        output_dir: str,
+        workers: Optional[int] = None,
+        manifest_path: Optional[str] = None,
+        recycle_after: int = 50,
+    ) -> Dict[str, Any]:
+        """Run an operation chain over many PDFs in a process pool.
+
+        Each file goes through the steps in order, e.g.
+        ["decrypt" with a password, "extract_text", "add_watermark", "split"].
+        Transform steps (decrypt, encrypt, rotate_pages, add_watermark,
+        extract_pages) feed their output to the next step and the final PDF
+        is written to the output directory; extract_text and extract_tables
+        write .txt / .tables.json files there, get_info is recorded in the
+        manifest, and split (last step only) writes the parts.
+
+        Failures are isolated per file and recorded in the manifest. Only
+        a bounded number of files are queued at once and the worker
+        processes are replaced after `recycle_after` files each, so memory
+        stays bounded however many files there are.
+
+        Args:
+            inputs: Glob pattern (recursive '**' allowed), directory, or list of paths
+            steps: Operation names, {"op": name, **kwargs} dicts or (name, kwargs) tuples
+            output_dir: Directory for outputs; inputs' sub-directories are kept
+            workers: Worker processes (default: the module's workers or CPU count)
+            manifest_path: JSON Lines manifest (default: output_dir/manifest.jsonl)
+            recycle_after: Files per worker before the processes are replaced
+
+        Returns:
+            Dict with files, succeeded, failed, seconds and manifest path
+        """
+        steps = _normalize_steps(steps)
+
+        if isinstance(inputs, str):
+            pattern = str(Path(inputs) / "*.pdf") if Path(inputs).is_dir() else inputs
+            files = sorted(glob.glob(pattern, recursive=True))
+        else:
+            files = [str(f) for f in inputs]
+
+        workers = workers or (self.workers if self.workers > 1 else None) or os.cpu_count() or 1
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        manifest_path = manifest_path or str(Path(output_dir) / "manifest.jsonl")
+        base = os.path.commonpath([os.path.dirname(os.path.abspath(f)) for f in files]) if files else ""
+
+        self.logger.info(
+            f"Batch processing {len(files)} PDFs with {workers} workers: "
+            f"{' -> '.join(step['op'] for step in steps)}"
+        )
+        started = time.perf_counter()
+        succeeded = failed = 0
+
+        def file_output_dir(file_path: str) -> str:
+            relative = os.path.relpath(os.path.dirname(os.path.abspath(file_path)), base)
+            return str(Path(output_dir) / relative)
+
+        executor: Optional[ProcessPoolExecutor] = None
+        used = 0
+        broken = False
+        recycle_after = recycle_after * workers
+        pending = set()
+        queue = iter(files)
+        retry: List[str] = []
+        retried = set()
+
+        def next_file() -> Optional[str]:
+            return retry.pop(0) if retry else next(queue, None)
+
+        file_path = next_file()
+
+        with open(manifest_path, "w", encoding="utf-8") as manifest:
+            try:
+                while file_path is not None or pending:
+                    retiring = executor is not None and (broken or used >= recycle_after)
+                    if retiring and not pending:
+                        # Replace the worker processes to release their memory
+                        executor.shutdown()
+                        executor, retiring = None, False
+
+                    while file_path is not None and not retiring and len(pending) < workers * 2:
+                        # Retries run on their own, so a crashing file cannot take others down again
+                        isolated = file_path in retried
+                        if isolated and pending or any(f.file_path in retried for f in pending):
+                            break
+                        if executor is None:
+                            executor, used, broken = ProcessPoolExecutor(max_workers=workers), 0, False
+                        try:
+                            future = executor.submit(_process_file, file_path, steps, file_output_dir(file_path))
+                        except BrokenProcessPool:
+                            broken = retiring = True
+                            break
+                        future.file_path = file_path
+                        pending.add(future)
+                        used += 1
+                        file_path = next_file()
+                        if isolated:
+                            break
+
+                    if not pending:
+                        continue
+
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        try:
+                            record = future.result()
+                        except BrokenProcessPool as e:
+                            # A worker died (e.g. killed for memory), taking every file
+                            # in flight with it; give each one more try on a fresh pool
+                            broken = True
+                            if future.file_path not in retried:
+                                retried.add(future.file_path)
+                                retry.append(future.file_path)
+                                continue
+                            record = {"input": future.file_path, "status": "error", "error": f"BrokenProcessPool: {e}"}
+
+                        if record["status"] == "ok":
+                            succeeded += 1
+                        else:
+                            failed += 1
+                            self.logger.warning(f"Batch failed for {record['input']}: {record['error']}")
+                        manifest.write(json.dumps(record, default=str) + "\n")
+
+                    if file_path is None:
+                        file_path = next_file()
+            finally:
+                if executor is not None:
+                    executor.shutdown(cancel_futures=True)
+
+        seconds = time.perf_counter() - started
+        self.logger.info(
+            f"Batch finished: {succeeded} succeeded, {failed} failed in {seconds:.2f}s "
+            f"(manifest: {manifest_path})"
+        )
+        return {
+            "files": len(files),
+            "succeeded": succeeded,
+            "failed": failed,
+            "seconds": seconds,
+            "manifest": manifest_path,
+        }
@@ -1,8 +1,13 @@
 """Web scraping module for RPA framework."""
 
+import threading
 import time
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Union
 from urllib.parse import urljoin, urlparse
+from urllib.robotparser import RobotFileParser
 
 import requests
 from bs4 import BeautifulSoup
@@ -12,7 +17,21 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 
+from ..core.cache import HTTPCache
+from ..core.http import AsyncHTTPClient
+from ..core.ratelimit import RateLimiter
 from ..core.logger import LoggerMixin
+from .downloads import DownloadManager
+from .driver_pool import DriverPool
+from .page import Page
+
+# URL patterns blocked for each resource type in fast render mode
+RESOURCE_PATTERNS = {
+    "image": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico", "*.bmp"],
+    "font": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    "media": ["*.mp4", "*.webm", "*.ogg", "*.mp3", "*.wav", "*.m4a", "*.mov", "*.m3u8"],
+    "stylesheet": ["*.css"],
+}
 
 
 class ScraperModule(LoggerMixin):
@@ -21,25 +40,139 @@ class ScraperModule(LoggerMixin):
     def __init__(
         self,
         user_agent: Optional[str] = None,
-        rate_limit: float = 1.0,
+        rate_limit: Union[float, Dict[str, Any]] = 1.0,
         timeout: int = 30,
+        burst: int = 1,
+        respect_retry_after: bool = True,
+        respect_crawl_delay: bool = False,
+        cache: Optional[Union[bool, Dict[str, Any], HTTPCache]] = None,
+        parser: str = "lxml",
+        driver_pool: Optional[Union[int, Dict[str, Any]]] = None,
+        fast_render: Optional[Union[bool, Dict[str, Any]]] = None,
+        download: Optional[Dict[str, Any]] = None,
     ):
+        """Initialize the scraper.
+
+        Args:
+            user_agent: User-Agent header to send
+            rate_limit: Seconds between requests to the same host, or a dict
+                with 'interval', 'burst', 'respect_retry_after',
+                'respect_crawl_delay' and per-host 'hosts' overrides
+            timeout: Request timeout in seconds
+            burst: Requests allowed back-to-back per host before throttling
+            respect_retry_after: Pause a host when it answers 429/503 with Retry-After
+            respect_crawl_delay: Apply robots.txt Crawl-delay per host
+            cache: Response cache - True, a dict of cache settings
+                (see HTTPCache.from_config) or an HTTPCache instance
+            parser: Default Page parser ('lxml', 'html.parser' or 'lxml.html')
+            driver_pool: Render get_dynamic() pages on a pool of browsers -
+                a pool size, or a dict with 'size', 'max_pages',
+                'max_memory_mb' and 'checkout_timeout' (see DriverPool).
+                Default: one shared browser
+            fast_render: Skip heavy resources on driver pool browsers - True,
+                or a dict with 'enabled', 'block_resources' (image, font,
+                media, stylesheet), 'block_urls' (wildcard patterns, e.g.
+                trackers) and 'idle_time' (seconds of network quiet for
+                get_dynamic). The shared browser used by screenshot(),
+                click_and_wait() and fill_form() is never affected
+            download: DownloadManager settings for download_file() and
+                download_images() (max_workers, chunk_size, segments,
+                segment_threshold, retries, dedupe)
+        """
         self.user_agent = user_agent or (
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
             "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         )
+        hosts = None
+        if isinstance(rate_limit, dict):
+            burst = rate_limit.get("burst", burst)
+            respect_retry_after = rate_limit.get("respect_retry_after", respect_retry_after)
+            respect_crawl_delay = rate_limit.get("respect_crawl_delay", respect_crawl_delay)
+            hosts = rate_limit.get("hosts")
+            rate_limit = rate_limit.get("interval", 1.0)
+
         self.rate_limit = rate_limit
         self.timeout = timeout
-        self._last_request_time = 0
+        self.respect_retry_after = respect_retry_after
+        self.respect_crawl_delay = respect_crawl_delay
+        self._limiter = RateLimiter(interval=rate_limit, burst=burst, hosts=hosts)
+        self.cache = HTTPCache.from_config(cache)
+        self.parser = parser
+        self._robots_checked: set = set()
+        self._robots_lock = threading.Lock()
         self._session = requests.Session()
+        self._async_client = AsyncHTTPClient(timeout=timeout)
         self._driver: Optional[webdriver.Chrome] = None
-
-    def _wait_for_rate_limit(self) -> None:
-        """Enforce rate limiting between requests."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.rate_limit:
-            time.sleep(self.rate_limit - elapsed)
-        self._last_request_time = time.time()
+        if isinstance(driver_pool, int):
+            driver_pool = {"size": driver_pool}
+        self._pool_config = driver_pool if driver_pool and driver_pool.get("size", 1) > 0 else None
+        self._pool: Optional[DriverPool] = None
+        self._pool_lock = threading.Lock()
+        if fast_render is True:
+            fast_render = {}
+        elif not fast_render or not fast_render.get("enabled", True):
+            fast_render = None
+        self.fast_render = fast_render
+        self._download_config = download or {}
+        self._downloader: Optional[DownloadManager] = None
+
+    def _robots_pending(self, url: str) -> Optional[str]:
+        """Return the robots.txt URL if this host still needs a Crawl-delay check."""
+        if not self.respect_crawl_delay:
+            return None
+        parsed = urlparse(url)
+        if not parsed.scheme:
+            return None
+        with self._robots_lock:
+            if parsed.netloc in self._robots_checked:
+                return None
+            self._robots_checked.add(parsed.netloc)
+        return f"{parsed.scheme}://{parsed.netloc}/robots.txt"
+
+    def _apply_crawl_delay(self, url: str, robots_txt: str) -> None:
+        """Slow the host down to its robots.txt Crawl-delay."""
+        parser = RobotFileParser()
+        parser.parse(robots_txt.splitlines())
+        parser.modified()  # crawl_delay() ignores parsers that were never "read"
+        delay = parser.crawl_delay(self.user_agent)
+        if delay:
+            self._limiter.set_interval(url, float(delay))
+            self.logger.info(f"Applying Crawl-delay {delay}s for {urlparse(url).netloc}")
+
+    def _handle_retry_after(self, url: str, status_code: int, headers: Any) -> None:
+        """Pause the host when a 429/503 response carries Retry-After."""
+        if not self.respect_retry_after or status_code not in (429, 503):
+            return
+        value = headers.get("Retry-After")
+        if not value:
+            return
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return
+        if seconds > 0:
+            self._limiter.pause(url, seconds)
+            self.logger.warning(f"{urlparse(url).netloc} asked to retry after {seconds:.1f}s")
+
+    def _wait_for_rate_limit(self, url: str) -> None:
+        """Enforce the per-host rate limit before a request."""
+        robots_url = self._robots_pending(url)
+        if robots_url:
+            try:
+                response = self._session.get(
+                    robots_url,
+                    headers={"User-Agent": self.user_agent},
+                    timeout=self.timeout,
+                )
+                if response.ok:
+                    self._apply_crawl_delay(url, response.text)
+            except requests.exceptions.RequestException as e:
+                self.logger.debug(f"Could not read {robots_url}: {e}")
+
+        self._limiter.acquire(url)
 
     def get(
         self,
@@ -57,12 +190,22 @@ class ScraperModule(LoggerMixin):
         Returns:
             Response object
         """
-        self._wait_for_rate_limit()
-
         request_headers = {"User-Agent": self.user_agent}
         if headers:
             request_headers.update(headers)
 
+        key, entry = None, None
+        if self.cache:
+            key = self.cache.key("GET", url, params, headers=request_headers)
+            entry = self.cache.get(key)
+            if entry and entry.is_fresh():
+                self.logger.info(f"GET {url} (cached)")
+                return entry.to_response()
+            if entry:
+                request_headers.update(self.cache.validators(entry))
+
+        self._wait_for_rate_limit(url)
+
         self.logger.info(f"GET {url}")
         response = self._session.get(
             url,
@@ -70,7 +213,16 @@ class ScraperModule(LoggerMixin):
             headers=request_headers,
             timeout=self.timeout,
         )
+
+        if entry and response.status_code == 304:
+            self.logger.info(f"GET {url} (not modified)")
+            return self.cache.revalidated(key, entry, response.headers).to_response()
+
+        self._handle_retry_after(url, response.status_code, response.headers)
         response.raise_for_status()
+
+        if key:
+            self.cache.store(key, response.url, response.status_code, response.headers, response.content)
         return response
 
     def get_soup(
@@ -90,6 +242,25 @@ class ScraperModule(LoggerMixin):
         response = self.get(url, params)
         return BeautifulSoup(response.text, "lxml")
 
+    def get_page(
+        self,
+        url: str,
+        params: Optional[Dict[str, str]] = None,
+        parser: Optional[str] = None,
+    ) -> Page:
+        """Fetch a page once and return a reusable parsed handle.
+
+        Args:
+            url: URL to fetch
+            params: Query parameters
+            parser: 'lxml' (default), 'html.parser' or 'lxml.html' (fastest)
+
+        Returns:
+            Page object for running any number of extractions
+        """
+        response = self.get(url, params)
+        return Page(response.text, url=str(response.url), parser=parser or self.parser, status_code=response.status_code)
+
     def extract_text(
         self,
         url: str,
@@ -104,16 +275,7 @@ class ScraperModule(LoggerMixin):
         Returns:
             Extracted text
         """
-        soup = self.get_soup(url)
-
-        if selector:
-            elements = soup.select(selector)
-            text = " ".join(el.get_text(strip=True) for el in elements)
-        else:
-            text = soup.get_text(separator=" ", strip=True)
-
-        self.logger.info(f"Extracted {len(text)} characters from {url}")
-        return text
+        return self.get_page(url).text(selector)
 
     def extract_links(
         self,
@@ -131,18 +293,7 @@ class ScraperModule(LoggerMixin):
         Returns:
             List of URLs
         """
-        soup = self.get_soup(url)
-        links = []
-
-        for a in soup.select(selector):
-            href = a.get("href")
-            if href:
-                if absolute:
-                    href = urljoin(url, href)
-                links.append(href)
-
-        self.logger.info(f"Found {len(links)} links on {url}")
-        return links
+        return self.get_page(url).links(selector, absolute)
 
     def extract_table(
         self,
@@ -160,24 +311,7 @@ class ScraperModule(LoggerMixin):
         Returns:
             List of rows, each row is a list of cell values
         """
-        soup = self.get_soup(url)
-        tables = soup.select(table_selector)
-
-        if not tables or index >= len(tables):
-            return []
-
-        table = tables[index]
-        rows = []
-
-        for tr in table.find_all("tr"):
-            cells = []
-            for td in tr.find_all(["td", "th"]):
-                cells.append(td.get_text(strip=True))
-            if cells:
-                rows.append(cells)
-
-        self.logger.info(f"Extracted table with {len(rows)} rows")
-        return rows
+        return self.get_page(url).table(table_selector, index)
 
     def extract_elements(
         self,
@@ -195,39 +329,282 @@ class ScraperModule(LoggerMixin):
         Returns:
             List of dicts with text and attributes
         """
-        soup = self.get_soup(url)
-        elements = soup.select(selector)
-        results = []
+        return self.get_page(url).elements(selector, attributes)
+
+    # Async methods (require httpx) - share one connection pool per event loop
+
+    async def _await_rate_limit(self, url: str) -> None:
+        """Async version of _wait_for_rate_limit()."""
+        robots_url = self._robots_pending(url)
+        if robots_url:
+            try:
+                response = await self._async_client.request(
+                    "GET", robots_url, headers={"User-Agent": self.user_agent}
+                )
+                if response.is_success:
+                    self._apply_crawl_delay(url, response.text)
+            except Exception as e:
+                self.logger.debug(f"Could not read {robots_url}: {e}")
+
+        await self._limiter.aacquire(url)
+
+    async def aget(
+        self,
+        url: str,
+        params: Optional[Dict[str, str]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        """Async version of get().
 
-        for el in elements:
-            data = {"text": el.get_text(strip=True)}
+        Returns:
+            httpx.Response object
+        """
+        self._async_client.check_available()
+        request_headers = {"User-Agent": self.user_agent}
+        if headers:
+            request_headers.update(headers)
 
-            if attributes:
-                for attr in attributes:
-                    data[attr] = el.get(attr)
-            else:
-                data["attrs"] = dict(el.attrs)
+        key, entry = None, None
+        if self.cache:
+            key = self.cache.key("GET", url, params, headers=request_headers)
+            entry = self.cache.get(key)
+            if entry and entry.is_fresh():
+                self.logger.info(f"GET {url} (cached)")
+                return entry.to_httpx_response()
+            if entry:
+                request_headers.update(self.cache.validators(entry))
 
-            results.append(data)
+        await self._await_rate_limit(url)
 
-        self.logger.info(f"Extracted {len(results)} elements matching '{selector}'")
-        return results
+        self.logger.info(f"GET {url}")
+        response = await self._async_client.request("GET", url, params=params, headers=request_headers)
+
+        if entry and response.status_code == 304:
+            self.logger.info(f"GET {url} (not modified)")
+            return self.cache.revalidated(key, entry, response.headers).to_httpx_response()
+
+        self._handle_retry_after(url, response.status_code, response.headers)
+        response.raise_for_status()
+
+        if key:
+            self.cache.store(key, str(response.url), response.status_code, response.headers, response.content)
+        return response
+
+    async def aget_soup(
+        self,
+        url: str,
+        params: Optional[Dict[str, str]] = None,
+    ) -> BeautifulSoup:
+        """Async version of get_soup()."""
+        response = await self.aget(url, params)
+        return BeautifulSoup(response.text, "lxml")
+
+    async def aget_page(
+        self,
+        url: str,
+        params: Optional[Dict[str, str]] = None,
+        parser: Optional[str] = None,
+    ) -> Page:
+        """Async version of get_page()."""
+        response = await self.aget(url, params)
+        return Page(response.text, url=str(response.url), parser=parser or self.parser, status_code=response.status_code)
+
+    async def aextract_text(self, url: str, selector: Optional[str] = None) -> str:
+        """Async version of extract_text()."""
+        return (await self.aget_page(url)).text(selector)
+
+    async def aextract_links(
+        self,
+        url: str,
+        selector: str = "a[href]",
+        absolute: bool = True,
+    ) -> List[str]:
+        """Async version of extract_links()."""
+        return (await self.aget_page(url)).links(selector, absolute)
+
+    async def aextract_table(
+        self,
+        url: str,
+        table_selector: str = "table",
+        index: int = 0,
+    ) -> List[List[str]]:
+        """Async version of extract_table()."""
+        return (await self.aget_page(url)).table(table_selector, index)
+
+    async def aextract_elements(
+        self,
+        url: str,
+        selector: str,
+        attributes: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Async version of extract_elements()."""
+        return (await self.aget_page(url)).elements(selector, attributes)
+
+    async def aclose(self) -> None:
+        """Close the async connection pool."""
+        await self._async_client.aclose()
+
+    def crawl(
+        self,
+        seeds: Union[str, List[str]],
+        sink: Any,
+        selectors: Optional[Dict[str, Union[str, Dict[str, Any]]]] = None,
+        max_depth: int = 1,
+        concurrency: int = 8,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Crawl from seed URLs, streaming extracted records to a sink.
+
+        Args:
+            seeds: Starting URL or URLs
+            sink: Output path (.jsonl/.csv), callable, or sink object
+            selectors: Dict of {field: selector spec} to extract (see Page.extract)
+            max_depth: Link depth to follow from the seeds
+            concurrency: Maximum pages fetched at once
+            **kwargs: Additional Crawler options (max_pages, allowed_domains, ...)
+
+        Returns:
+            Dict with pages, records, errors and duration
+        """
+        from .crawler import Crawler
+
+        if isinstance(seeds, str):
+            seeds = [seeds]
+
+        crawler = Crawler(
+            self,
+            selectors=selectors,
+            max_depth=max_depth,
+            concurrency=concurrency,
+            **kwargs,
+        )
+        return crawler.run(seeds, sink)
 
     # Selenium-based methods for dynamic pages
 
+    def _blocked_url_patterns(self) -> List[str]:
+        """URL patterns to block in fast render mode."""
+        patterns = []
+        for resource in self.fast_render.get("block_resources", ["image", "font", "media"]):
+            if resource not in RESOURCE_PATTERNS:
+                raise ValueError(f"Unknown resource type: {resource}")
+            patterns.extend(RESOURCE_PATTERNS[resource])
+        patterns.extend(self.fast_render.get("block_urls", []))
+        return patterns
+
+    def _create_driver(self, fast: bool = False) -> webdriver.Chrome:
+        """Start a new headless Chrome.
+
+        Args:
+            fast: Apply the fast render settings (render pool browsers only)
+        """
+        options = ChromeOptions()
+        options.add_argument("--headless")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument(f"--user-agent={self.user_agent}")
+
+        if not fast or self.fast_render is None:
+            return webdriver.Chrome(options=options)
+
+        # Return from get() at DOMContentLoaded instead of the load event
+        options.page_load_strategy = "eager"
+        if "image" in self.fast_render.get("block_resources", ["image", "font", "media"]):
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+
+        driver = webdriver.Chrome(options=options)
+        patterns = self._blocked_url_patterns()
+        if patterns:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        return driver
+
+    def _wait_for_network_idle(
+        self,
+        driver: webdriver.Chrome,
+        idle_time: float = 0.5,
+        timeout: float = 10,
+    ) -> bool:
+        """Wait until the page has fetched no new resources for `idle_time` seconds.
+
+        Resources are counted with a PerformanceObserver, because the
+        performance timeline buffer stops recording at 250 entries.
+
+        Returns:
+            True if the network went idle, False on timeout
+        """
+        script = """
+            if (document.readyState === 'loading') return -1;
+            if (window.__rpaResourceCount === undefined) {
+                window.__rpaResourceCount = performance.getEntriesByType('resource').length;
+                new PerformanceObserver(function (list) {
+                    window.__rpaResourceCount += list.getEntries().length;
+                }).observe({type: 'resource'});
+            }
+            return window.__rpaResourceCount;
+        """
+        deadline = time.time() + timeout
+        last_count, quiet_since = None, time.time()
+
+        while time.time() < deadline:
+            count = driver.execute_script(script)
+            if count != last_count or count == -1:
+                last_count, quiet_since = count, time.time()
+            elif time.time() - quiet_since >= idle_time:
+                return True
+            time.sleep(0.1)
+
+        return False
+
     def _get_driver(self) -> webdriver.Chrome:
-        """Get or create Selenium WebDriver."""
+        """Get or create the Selenium WebDriver used for interactive steps."""
         if self._driver is None:
-            options = ChromeOptions()
-            options.add_argument("--headless")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument(f"--user-agent={self.user_agent}")
-
-            self._driver = webdriver.Chrome(options=options)
+            self._driver = self._create_driver()
 
         return self._driver
 
+    @property
+    def driver_pool(self) -> Optional[DriverPool]:
+        """Browser pool for get_dynamic(), or None when pooling is off."""
+        if self._pool_config is None:
+            return None
+        with self._pool_lock:
+            if self._pool is None:
+                config = self._pool_config
+                self._pool = DriverPool(
+                    partial(self._create_driver, fast=True),
+                    size=config.get("size", 2),
+                    max_pages=config.get("max_pages", 100),
+                    max_memory_mb=config.get("max_memory_mb"),
+                    checkout_timeout=config.get("checkout_timeout"),
+                )
+            return self._pool
+
+    def _render(
+        self,
+        driver: webdriver.Chrome,
+        url: str,
+        wait_for: Optional[str],
+        wait_timeout: int,
+        fast: bool = False,
+    ) -> str:
+        """Load a URL in a browser and return the rendered HTML."""
+        self._wait_for_rate_limit(url)
+
+        self.logger.info(f"GET (dynamic) {url}")
+        driver.get(url)
+
+        if wait_for:
+            WebDriverWait(driver, wait_timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, wait_for))
+            )
+        elif fast and self.fast_render is not None:
+            # Eager loading returns before scripts settle, so wait for the network
+            self._wait_for_network_idle(driver, self.fast_render.get("idle_time", 0.5), wait_timeout)
+
+        return driver.page_source
+
     def get_dynamic(
         self,
         url: str,
@@ -236,6 +613,11 @@ class ScraperModule(LoggerMixin):
     ) -> str:
         """Fetch a page with JavaScript rendering.
 
+        With a driver pool configured the page is rendered on a pooled
+        browser (with fast_render applied); otherwise on the shared browser
+        that click_and_wait(), fill_form() and screenshot() act on, which
+        always loads pages in full.
+
         Args:
             url: URL to fetch
             wait_for: CSS selector to wait for
@@ -244,18 +626,44 @@ class ScraperModule(LoggerMixin):
         Returns:
             Page HTML
         """
-        self._wait_for_rate_limit()
-        driver = self._get_driver()
+        pool = self.driver_pool
+        if pool is None:
+            return self._render(self._get_driver(), url, wait_for, wait_timeout)
 
-        self.logger.info(f"GET (dynamic) {url}")
-        driver.get(url)
+        with pool.driver() as driver:
+            return self._render(driver, url, wait_for, wait_timeout, fast=True)
 
-        if wait_for:
-            WebDriverWait(driver, wait_timeout).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, wait_for))
-            )
+    def get_dynamic_many(
+        self,
+        urls: List[str],
+        wait_for: Optional[str] = None,
+        wait_timeout: int = 10,
+    ) -> List[Optional[str]]:
+        """Render several pages in parallel on the driver pool.
 
-        return driver.page_source
+        Args:
+            urls: URLs to fetch
+            wait_for: CSS selector to wait for on each page
+            wait_timeout: Timeout for wait
+
+        Returns:
+            Page HTML in the same order as urls (None for pages that failed)
+        """
+        pool = self.driver_pool
+        workers = pool.size if pool else 1
+
+        def fetch(url):
+            try:
+                return self.get_dynamic(url, wait_for, wait_timeout)
+            except Exception as e:
+                self.logger.warning(f"Failed to render {url}: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(fetch, urls))
+
+        self.logger.info(f"Rendered {sum(r is not None for r in results)}/{len(urls)} pages with {workers} browsers")
+        return results
 
     def get_dynamic_soup(
         self,
@@ -328,10 +736,13 @@ class ScraperModule(LoggerMixin):
         return output_path
 
     def close(self) -> None:
-        """Close the Selenium driver."""
+        """Close the Selenium driver and any pooled browsers."""
         if self._driver:
             self._driver.quit()
             self._driver = None
+        if self._pool:
+            self._pool.close()
+            self._pool = None
 
     def __enter__(self):
         return self
@@ -339,72 +750,70 @@ class ScraperModule(LoggerMixin):
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
+    @property
+    def downloader(self) -> DownloadManager:
+        """Download manager sharing this scraper's session and rate limiter."""
+        if self._downloader is None:
+            self._downloader = DownloadManager(
+                session=self._session,
+                headers={"User-Agent": self.user_agent},
+                timeout=self.timeout,
+                before_request=self._wait_for_rate_limit,
+                **self._download_config,
+            )
+        return self._downloader
+
     def download_file(
         self,
         url: str,
         output_path: str,
+        progress: Optional[Callable[[Dict[str, Any]], Any]] = None,
     ) -> str:
-        """Download a file.
+        """Download a file, resuming a previous partial download if present.
 
         Args:
             url: File URL
             output_path: Path to save file
+            progress: Callback receiving url, downloaded, total and speed
 
         Returns:
             Path to downloaded file
         """
-        self._wait_for_rate_limit()
-
-        response = self._session.get(
-            url,
-            headers={"User-Agent": self.user_agent},
-            stream=True,
-            timeout=self.timeout,
-        )
-        response.raise_for_status()
-
-        with open(output_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-
-        self.logger.info(f"Downloaded {url} to {output_path}")
-        return output_path
+        return self.downloader.download(url, output_path, progress)["path"]
 
     def download_images(
         self,
         url: str,
         output_dir: str,
         selector: str = "img[src]",
+        max_workers: Optional[int] = None,
+        progress: Optional[Callable[[Dict[str, Any]], Any]] = None,
     ) -> List[str]:
-        """Download all images from a page.
+        """Download all images from a page in parallel.
 
         Args:
             url: Page URL
             output_dir: Directory to save images
             selector: CSS selector for images
+            max_workers: Concurrent downloads (default: downloader setting)
+            progress: Callback receiving url, downloaded, total and speed
 
         Returns:
             List of downloaded file paths
         """
         from pathlib import Path
 
-        soup = self.get_soup(url)
-        images = soup.select(selector)
-        downloaded = []
+        page = self.get_page(url)
+        downloads = []
 
         Path(output_dir).mkdir(parents=True, exist_ok=True)
 
-        for i, img in enumerate(images):
+        for i, img in enumerate(page.select(selector)):
             src = img.get("src")
             if src:
                 img_url = urljoin(url, src)
                 ext = Path(urlparse(img_url).path).suffix or ".jpg"
-                output_path = str(Path(output_dir) / f"image_{i}{ext}")
-
-                try:
-                    self.download_file(img_url, output_path)
-                    downloaded.append(output_path)
-                except Exception as e:
-                    self.logger.warning(f"Failed to download {img_url}: {e}")
+                downloads.append((img_url, str(Path(output_dir) / f"image_{i}{ext}")))
 
-        return downloaded
+        results = self.downloader.download_many(downloads, max_workers=max_workers, progress=progress)
+        return [r["path"] for r in results if "error" not in r]
@@ -1,13 +1,54 @@
 """Spreadsheet automation module for Excel and CSV files."""
 
+import csv
+import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 
 import pandas as pd
 from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
+from openpyxl.utils import get_column_letter
 
 from ..core.logger import LoggerMixin
+from .transforms import apply_operation, plan_operations
+
+# xlsxwriter is optional; its constant_memory mode is the fastest streaming writer
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+# pyarrow is optional; needed for Parquet and Feather/Arrow IPC files
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# File suffixes handled by read() and write()
+EXCEL_SUFFIXES = (".xlsx", ".xls")
+CSV_COMPRESSION_SUFFIXES = (".gz", ".bz2", ".xz", ".zst", ".zip")
+PARQUET_SUFFIXES = (".parquet", ".pq")
+FEATHER_SUFFIXES = (".feather", ".arrow", ".ipc")
+
+# Rows per worksheet allowed by the xlsx format (header included)
+EXCEL_MAX_ROWS = 1048576
+
+# Chunks held back to infer a streamed Arrow schema while columns are all-null
+ARROW_SCHEMA_SAMPLE_CHUNKS = 10
+
+# Header look used by create_styled_excel and write_excel_stream
+DEFAULT_HEADER_STYLE = {
+    "bold": True,
+    "font_color": "FFFFFF",
+    "fill_color": "366092",
+    "align": "center",
+}
 
 
 class SpreadsheetModule(LoggerMixin):
@@ -18,6 +59,8 @@ class SpreadsheetModule(LoggerMixin):
         file_path: str,
         sheet_name: Optional[Union[str, int]] = 0,
         header: Optional[int] = 0,
+        usecols: Optional[List[Union[str, int]]] = None,
+        dtype: Optional[Union[str, Dict[str, Any]]] = None,
     ) -> pd.DataFrame:
         """Read an Excel file into a DataFrame.
 
@@ -25,12 +68,14 @@ class SpreadsheetModule(LoggerMixin):
             file_path: Path to the Excel file
             sheet_name: Sheet name or index (default: first sheet)
             header: Row to use as header (default: 0)
+            usecols: Columns to read, by name or position (default: all)
+            dtype: Type for all columns or a dict of {column: type}
 
         Returns:
             DataFrame with the spreadsheet data
         """
         self.logger.info(f"Reading Excel file: {file_path}")
-        df = pd.read_excel(file_path, sheet_name=sheet_name, header=header)
+        df = pd.read_excel(file_path, sheet_name=sheet_name, header=header, usecols=usecols, dtype=dtype)
         self.logger.info(f"Read {len(df)} rows from {file_path}")
         return df
 
@@ -40,6 +85,8 @@ class SpreadsheetModule(LoggerMixin):
         delimiter: str = ",",
         encoding: str = "utf-8",
         header: Optional[int] = 0,
+        usecols: Optional[List[Union[str, int]]] = None,
+        dtype: Optional[Union[str, Dict[str, Any]]] = None,
     ) -> pd.DataFrame:
         """Read a CSV file into a DataFrame.
 
@@ -48,18 +95,170 @@ class SpreadsheetModule(LoggerMixin):
             delimiter: Column delimiter (default: comma)
             encoding: File encoding (default: utf-8)
             header: Row to use as header (default: 0)
+            usecols: Columns to read, by name or position (default: all)
+            dtype: Type for all columns or a dict of {column: type}
 
         Returns:
             DataFrame with the CSV data
         """
         self.logger.info(f"Reading CSV file: {file_path}")
-        df = pd.read_csv(file_path, delimiter=delimiter, encoding=encoding, header=header)
+        df = pd.read_csv(
+            file_path,
+            delimiter=delimiter,
+            encoding=encoding,
+            header=header,
+            usecols=usecols,
+            dtype=dtype,
+        )
         self.logger.info(f"Read {len(df)} rows from {file_path}")
         return df
 
+    # Chunked readers for files too large to load at once
+
+    def iter_csv(
+        self,
+        file_path: str,
+        chunksize: int = 100000,
+        delimiter: str = ",",
+        encoding: str = "utf-8",
+        header: Optional[int] = 0,
+        usecols: Optional[List[Union[str, int]]] = None,
+        dtype: Optional[Union[str, Dict[str, Any]]] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Read a CSV file as a stream of DataFrame chunks.
+
+        Args:
+            file_path: Path to the CSV file
+            chunksize: Rows per chunk
+            delimiter: Column delimiter (default: comma)
+            encoding: File encoding (default: utf-8)
+            header: Row to use as header (default: 0)
+            usecols: Columns to read, by name or position (default: all)
+            dtype: Type for all columns or a dict of {column: type}; setting
+                it also keeps types consistent from chunk to chunk
+
+        Yields:
+            DataFrames of up to `chunksize` rows
+        """
+        self.logger.info(f"Streaming CSV file: {file_path} ({chunksize} rows per chunk)")
+        rows = 0
+
+        with pd.read_csv(
+            file_path,
+            delimiter=delimiter,
+            encoding=encoding,
+            header=header,
+            usecols=usecols,
+            dtype=dtype,
+            chunksize=chunksize,
+        ) as reader:
+            for chunk in reader:
+                rows += len(chunk)
+                yield chunk
+
+        self.logger.info(f"Streamed {rows} rows from {file_path}")
+
+    def iter_excel(
+        self,
+        file_path: str,
+        sheet_name: Optional[Union[str, int]] = 0,
+        chunksize: int = 10000,
+        header: Optional[int] = 0,
+        usecols: Optional[List[Union[str, int]]] = None,
+        dtype: Optional[Union[str, Dict[str, Any]]] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Read an Excel sheet as a stream of DataFrame chunks.
+
+        The workbook is opened in openpyxl's read-only mode, which parses
+        rows as they are requested instead of loading the whole sheet.
+        Completely empty rows are skipped.
+
+        Args:
+            file_path: Path to the Excel file
+            sheet_name: Sheet name or index (default: first sheet)
+            chunksize: Rows per chunk
+            header: Row to use as header (default: 0); None numbers the columns
+            usecols: Columns to read, by name or position (default: all);
+                returned in file order, as read_excel does
+            dtype: Type for all columns or a dict of {column: type}
+
+        Yields:
+            DataFrames of up to `chunksize` rows
+        """
+        self.logger.info(f"Streaming Excel file: {file_path} ({chunksize} rows per chunk)")
+        wb = load_workbook(file_path, read_only=True, data_only=True)
+
+        try:
+            ws = wb.worksheets[sheet_name] if isinstance(sheet_name, int) else wb[sheet_name]
+            row_iter = ws.iter_rows(values_only=True)
+
+            columns: Optional[List[Any]] = None
+            if header is not None:
+                for _ in range(header):
+                    next(row_iter, None)
+                names = next(row_iter, None) or ()
+                columns = [
+                    name if name is not None else f"Unnamed: {i}"
+                    for i, name in enumerate(names)
+                ]
+
+            positions = None
+            buffer: List[tuple] = []
+            rows = 0
+
+            def cell(value: Any) -> Any:
+                # Excel stores every number as a float; like read_excel, keep whole numbers as int
+                return int(value) if isinstance(value, float) and value.is_integer() else value
+
+            def make_chunk() -> pd.DataFrame:
+                labels = [columns[i] for i in positions]
+                chunk = pd.DataFrame.from_records(buffer, columns=labels)
+                if dtype is None:
+                    return chunk
+                # Typed columns are converted from the cell values (as read_excel
+                # does), not from an inferred dtype, so 2 stays "2" under str
+                raw = pd.DataFrame(buffer, columns=labels, dtype=object)
+                for i, name in enumerate(labels):
+                    target = dtype.get(name) if isinstance(dtype, dict) else dtype
+                    if target is not None:
+                        chunk.isetitem(i, raw.iloc[:, i].astype(target))
+                return chunk
+
+            for values in row_iter:
+                if all(v is None for v in values):
+                    continue
+
+                if columns is None:
+                    columns = list(range(len(values)))
+                if positions is None:
+                    if usecols is None:
+                        positions = list(range(len(columns)))
+                    else:
+                        missing = [c for c in usecols if not isinstance(c, int) and c not in columns]
+                        if missing:
+                            raise ValueError(f"Unknown columns in usecols: {missing}")
+                        # In file order, as pandas returns usecols
+                        positions = sorted({c if isinstance(c, int) else columns.index(c) for c in usecols})
+
+                width = len(values)
+                buffer.append(tuple(cell(values[i]) if i < width else None for i in positions))
+
+                if len(buffer) >= chunksize:
+                    rows += len(buffer)
+                    yield make_chunk()
+                    buffer = []
+
+            if buffer:
+                rows += len(buffer)
+                yield make_chunk()
+        finally:
+            wb.close()
+
+        self.logger.info(f"Streamed {rows} rows from {file_path}")
+
     def write_excel(
         self,
-        data: Union[pd.DataFrame, List[Dict[str, Any]]],
+        data: Union[pd.DataFrame, List[Dict[str, Any]], Iterable[Any]],
         file_path: str,
         sheet_name: str = "Sheet1",
         index: bool = False,
@@ -67,7 +266,8 @@ class SpreadsheetModule(LoggerMixin):
         """Write data to an Excel file.
 
         Args:
-            data: DataFrame or list of dicts to write
+            data: DataFrame, list of dicts, or an iterator of chunks/rows
+                (written with write_excel_stream())
             file_path: Output file path
             sheet_name: Name for the worksheet
             index: Whether to include the index
@@ -78,13 +278,16 @@ class SpreadsheetModule(LoggerMixin):
         if isinstance(data, list):
             data = pd.DataFrame(data)
 
+        if not isinstance(data, pd.DataFrame):
+            return self.write_excel_stream(data, file_path, sheet_name=sheet_name, styled=False)
+
         self.logger.info(f"Writing {len(data)} rows to Excel: {file_path}")
         data.to_excel(file_path, sheet_name=sheet_name, index=index)
         return file_path
 
     def write_csv(
         self,
-        data: Union[pd.DataFrame, List[Dict[str, Any]]],
+        data: Union[pd.DataFrame, List[Dict[str, Any]], Iterable[Any]],
         file_path: str,
         index: bool = False,
         encoding: str = "utf-8",
@@ -92,7 +295,9 @@ class SpreadsheetModule(LoggerMixin):
         """Write data to a CSV file.
 
         Args:
-            data: DataFrame or list of dicts to write
+            data: DataFrame, list of dicts, or an iterator of chunks
+                (DataFrames or lists of dicts, e.g. DatabaseModule.stream())
+                written one at a time
             file_path: Output file path
             index: Whether to include the index
             encoding: File encoding
@@ -103,73 +308,381 @@ class SpreadsheetModule(LoggerMixin):
         if isinstance(data, list):
             data = pd.DataFrame(data)
 
-        self.logger.info(f"Writing {len(data)} rows to CSV: {file_path}")
-        data.to_csv(file_path, index=index, encoding=encoding)
+        if isinstance(data, pd.DataFrame):
+            self.logger.info(f"Writing {len(data)} rows to CSV: {file_path}")
+            data.to_csv(file_path, index=index, encoding=encoding)
+            return file_path
+
+        rows = 0
+        columns = None
+        for chunk in data:
+            if not isinstance(chunk, pd.DataFrame):
+                chunk = pd.DataFrame(chunk)
+            if columns is not None:
+                # Later chunks are written without a header, so they must
+                # follow the first chunk's column order
+                extra = [c for c in chunk.columns if c not in columns]
+                if extra:
+                    self.logger.warning(f"Dropping columns not in {file_path}: {extra}")
+                chunk = chunk.reindex(columns=columns)
+            chunk.to_csv(
+                file_path,
+                index=index,
+                encoding=encoding,
+                mode="w" if columns is None else "a",
+                header=columns is None,
+            )
+            if columns is None:
+                columns = list(chunk.columns)
+            rows += len(chunk)
+
+        if columns is None:
+            Path(file_path).write_text("", encoding=encoding)
+
+        self.logger.info(f"Wrote {rows} rows to CSV in chunks: {file_path}")
         return file_path
 
+    # Columnar formats (Parquet, Feather/Arrow IPC)
+
+    @staticmethod
+    def _require_pyarrow() -> None:
+        if not PYARROW_AVAILABLE:
+            raise RuntimeError("pyarrow not installed. Run: pip install pyarrow")
+
+    def _write_arrow_chunks(
+        self,
+        data: Union[pd.DataFrame, List[Dict], Iterable[Any]],
+        open_writer: Any,
+        schema: Optional[Union["pa.Schema", Dict[str, Any]]] = None,
+    ) -> int:
+        """Write a table or an iterator of chunks through an Arrow writer factory.
+
+        The file schema is `schema` when given. Otherwise a DataFrame's
+        schema is inferred from the whole frame, and an iterator's from its
+        first chunk. Only while a column is still all-null are further
+        chunks held back (up to ARROW_SCHEMA_SAMPLE_CHUNKS) and their types
+        unified, so an int and a float chunk among them become float. Every
+        chunk is then cast to the file schema; a chunk that cannot be cast
+        without loss (e.g. floats after a first chunk of ints) raises
+        ValueError, so pass `schema` when types vary between chunks.
+
+        Returns:
+            Number of rows written
+        """
+        if isinstance(schema, dict):
+            schema = pa.schema([
+                (name, pa.type_for_alias(t) if isinstance(t, str) else t)
+                for name, t in schema.items()
+            ])
+        elif schema is None and isinstance(data, pd.DataFrame):
+            schema = pa.Schema.from_pandas(data, preserve_index=False)
+
+        def conform(table: "pa.Table") -> "pa.Table":
+            try:
+                return table.select(schema.names).cast(schema)
+            except (KeyError, pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+                raise ValueError(
+                    f"Chunk does not match the file schema ({e}); pass schema= to set column types"
+                ) from e
+
+        writer = None
+        pending: List["pa.Table"] = []
+        rows = 0
+        try:
+            for chunk in self._row_chunks(data, chunk_rows=100000):
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                rows += len(table)
+                if writer is not None:
+                    writer.write_table(conform(table))
+                    continue
+
+                pending.append(table)
+                if schema is None:
+                    inferred = self._unify_arrow_schemas(pending)
+                    if (any(pa.types.is_null(f.type) for f in inferred)
+                            and len(pending) < ARROW_SCHEMA_SAMPLE_CHUNKS):
+                        continue
+                    schema = inferred
+                writer = open_writer(schema)
+                for table in pending:
+                    writer.write_table(conform(table))
+                pending = []
+
+            if pending:
+                # The data ended while a column was still all-null
+                schema = self._unify_arrow_schemas(pending)
+                writer = open_writer(schema)
+                for table in pending:
+                    writer.write_table(conform(table))
+        finally:
+            if writer is not None:
+                writer.close()
+        return rows
+
+    @staticmethod
+    def _unify_arrow_schemas(tables: List["pa.Table"]) -> "pa.Schema":
+        """Common schema of several tables, promoting null and numeric types."""
+        try:
+            return pa.unify_schemas([t.schema for t in tables], promote_options="permissive")
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            raise ValueError(f"Chunks have incompatible column types ({e}); pass schema= to set them") from e
+
+    def read_parquet(
+        self,
+        file_path: str,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[tuple]] = None,
+        memory_map: bool = True,
+    ) -> pd.DataFrame:
+        """Read a Parquet file into a DataFrame.
+
+        Args:
+            file_path: Path to the Parquet file
+            columns: Columns to read (only these are decoded)
+            filters: Row filters pushed down to row groups,
+                e.g. [("status", "=", "open"), ("amount", ">", 100)]
+            memory_map: Map the file instead of reading it into memory
+
+        Returns:
+            DataFrame with the file data
+        """
+        self._require_pyarrow()
+        self.logger.info(f"Reading Parquet file: {file_path}")
+        table = pq.read_table(file_path, columns=columns, filters=filters, memory_map=memory_map)
+        df = table.to_pandas()
+        self.logger.info(f"Read {len(df)} rows from {file_path}")
+        return df
+
+    def iter_parquet(
+        self,
+        file_path: str,
+        columns: Optional[List[str]] = None,
+        batch_size: int = 100000,
+    ) -> Iterator[pd.DataFrame]:
+        """Read a Parquet file as a stream of DataFrame chunks.
+
+        Args:
+            file_path: Path to the Parquet file
+            columns: Columns to read
+            batch_size: Maximum rows per chunk
+
+        Yields:
+            DataFrames of up to `batch_size` rows
+        """
+        self._require_pyarrow()
+        self.logger.info(f"Streaming Parquet file: {file_path} ({batch_size} rows per chunk)")
+        parquet_file = pq.ParquetFile(file_path, memory_map=True)
+        try:
+            for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns):
+                yield batch.to_pandas()
+        finally:
+            parquet_file.close()
+
+    def write_parquet(
+        self,
+        data: Union[pd.DataFrame, List[Dict], Iterable[Any]],
+        file_path: str,
+        compression: str = "snappy",
+        schema: Optional[Union["pa.Schema", Dict[str, Any]]] = None,
+    ) -> str:
+        """Write data to a Parquet file.
+
+        Args:
+            data: DataFrame, list of dicts, or an iterator of chunks written
+                one at a time (each becomes a row group)
+            file_path: Output file path
+            compression: snappy, zstd, gzip, lz4 or none
+            schema: Column types as a pyarrow Schema or {name: type}
+                (e.g. {"qty": "float64"}); inferred from the data if omitted
+
+        Returns:
+            Path to the created file
+        """
+        self._require_pyarrow()
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+        rows = self._write_arrow_chunks(
+            data,
+            lambda schema: pq.ParquetWriter(file_path, schema, compression=compression),
+            schema=schema,
+        )
+        if rows == 0 and not Path(file_path).exists():
+            pq.write_table(pa.Table.from_pandas(pd.DataFrame(data), preserve_index=False), file_path)
+        self.logger.info(f"Wrote {rows} rows to Parquet: {file_path}")
+        return file_path
+
+    def read_feather(
+        self,
+        file_path: str,
+        columns: Optional[List[str]] = None,
+        memory_map: bool = True,
+    ) -> pd.DataFrame:
+        """Read a Feather (Arrow IPC) file into a DataFrame.
+
+        Files written with compression='uncompressed' are read zero-copy
+        from the memory map; compressed files are decompressed column by
+        column.
+
+        Args:
+            file_path: Path to the .feather/.arrow file
+            columns: Columns to read
+            memory_map: Map the file instead of reading it into memory
+
+        Returns:
+            DataFrame with the file data
+        """
+        self._require_pyarrow()
+        self.logger.info(f"Reading Feather file: {file_path}")
+        table = feather.read_table(file_path, columns=columns, memory_map=memory_map)
+        df = table.to_pandas()
+        self.logger.info(f"Read {len(df)} rows from {file_path}")
+        return df
+
+    def write_feather(
+        self,
+        data: Union[pd.DataFrame, List[Dict], Iterable[Any]],
+        file_path: str,
+        compression: str = "lz4",
+        schema: Optional[Union["pa.Schema", Dict[str, Any]]] = None,
+    ) -> str:
+        """Write data to a Feather (Arrow IPC) file.
+
+        Args:
+            data: DataFrame, list of dicts, or an iterator of chunks written
+                one at a time
+            file_path: Output file path
+            compression: lz4, zstd or uncompressed (fastest to read back)
+            schema: Column types as a pyarrow Schema or {name: type}
+                (e.g. {"qty": "float64"}); inferred from the data if omitted
+
+        Returns:
+            Path to the created file
+        """
+        self._require_pyarrow()
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+        options = pa.ipc.IpcWriteOptions(compression=None if compression == "uncompressed" else compression)
+        rows = self._write_arrow_chunks(
+            data,
+            lambda schema: pa.ipc.new_file(file_path, schema, options=options),
+            schema=schema,
+        )
+        if rows == 0 and not Path(file_path).exists():
+            feather.write_feather(pd.DataFrame(data), file_path, compression=compression)
+        self.logger.info(f"Wrote {rows} rows to Feather: {file_path}")
+        return file_path
+
+    @staticmethod
+    def _file_format(file_path: str) -> str:
+        """Format name for a path: excel, csv (optionally compressed), parquet or feather."""
+        suffixes = [s.lower() for s in Path(file_path).suffixes]
+        suffix = suffixes[-1] if suffixes else ""
+        if suffix in CSV_COMPRESSION_SUFFIXES and len(suffixes) > 1:
+            suffix = suffixes[-2] if suffixes[-2] == ".csv" else suffix
+
+        if suffix in EXCEL_SUFFIXES:
+            return "excel"
+        if suffix == ".csv":
+            return "csv"
+        if suffix in PARQUET_SUFFIXES:
+            return "parquet"
+        if suffix in FEATHER_SUFFIXES:
+            return "feather"
+        raise ValueError(f"Unsupported file format: {''.join(suffixes[-2:]) or file_path}")
+
     def read(self, file_path: str, **kwargs) -> pd.DataFrame:
-        """Auto-detect file type and read accordingly."""
-        path = Path(file_path)
-        if path.suffix.lower() in [".xlsx", ".xls"]:
-            return self.read_excel(file_path, **kwargs)
-        elif path.suffix.lower() == ".csv":
-            return self.read_csv(file_path, **kwargs)
-        else:
-            raise ValueError(f"Unsupported file format: {path.suffix}")
+        """Auto-detect file type and read accordingly.
 
-    def write(self, data: Union[pd.DataFrame, List[Dict]], file_path: str, **kwargs) -> str:
-        """Auto-detect file type and write accordingly."""
-        path = Path(file_path)
-        if path.suffix.lower() in [".xlsx", ".xls"]:
-            return self.write_excel(data, file_path, **kwargs)
-        elif path.suffix.lower() == ".csv":
-            return self.write_csv(data, file_path, **kwargs)
-        else:
-            raise ValueError(f"Unsupported file format: {path.suffix}")
+        Supports .xlsx/.xls, .csv (also .csv.gz, .csv.zst, .csv.bz2,
+        .csv.xz, .csv.zip), .parquet and .feather/.arrow.
+        """
+        readers = {
+            "excel": self.read_excel,
+            "csv": self.read_csv,
+            "parquet": self.read_parquet,
+            "feather": self.read_feather,
+        }
+        return readers[self._file_format(file_path)](file_path, **kwargs)
+
+    def write(self, data: Union[pd.DataFrame, List[Dict], Iterable[Any]], file_path: str, **kwargs) -> str:
+        """Auto-detect file type and write accordingly (same formats as read())."""
+        writers = {
+            "excel": self.write_excel,
+            "csv": self.write_csv,
+            "parquet": self.write_parquet,
+            "feather": self.write_feather,
+        }
+        return writers[self._file_format(file_path)](data, file_path, **kwargs)
+
+    def plan_transform(self, operations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Show the order in which transform() will run a list of operations.
+
+        Args:
+            operations: Operations as accepted by transform()
+
+        Returns:
+            Planned list of operation dicts
+        """
+        return plan_operations(operations)
 
     def transform(
         self,
-        data: pd.DataFrame,
+        data: Union[pd.DataFrame, List[Dict[str, Any]]],
         operations: List[Dict[str, Any]],
+        tables: Optional[Dict[str, Any]] = None,
+        optimize: bool = True,
     ) -> pd.DataFrame:
         """Apply a series of transformations to a DataFrame.
 
+        Operations are plain dicts, so they can be stored in workflow JSON.
+        Before running, filters and column drops are moved ahead of the
+        steps they do not depend on and adjacent filters are combined (see
+        plan_transform()). Every operation is vectorized and returns a new
+        frame, so the input is never modified and not copied up front.
+
         Args:
-            data: Input DataFrame
+            data: Input DataFrame or list of records
             operations: List of operations, each a dict with 'type' and params
+            tables: Named tables (DataFrames or record lists) for joins
+            optimize: Reorder operations before running (False keeps the order)
 
         Supported operations:
-            - filter: {'type': 'filter', 'column': 'col', 'condition': 'value'}
+            - filter: {'type': 'filter', 'conditions': [{'column': 'amount', 'op': '>=', 'value': 100}],
+              'how': 'all'}; op is ==, !=, >, >=, <, <=, between ('value': [lo, hi]),
+              in, not_in, regex, contains, startswith, endswith, isnull or notnull,
+              and 'value_column' compares against another column. The older
+              {'type': 'filter', 'column': 'col', 'condition': 'value'} still works
+            - select: {'type': 'select', 'columns': ['col1', 'col2']}
             - rename: {'type': 'rename', 'columns': {'old': 'new'}}
             - drop: {'type': 'drop', 'columns': ['col1', 'col2']}
             - sort: {'type': 'sort', 'by': 'column', 'ascending': True}
-            - fillna: {'type': 'fillna', 'value': 0}
+            - fillna: {'type': 'fillna', 'value': 0, 'columns': ['col']}
+            - compute: {'type': 'compute', 'column': 'total', 'expression': 'price * qty'}
+              or {'type': 'compute', 'columns': {'total': 'price * qty'}}
+            - cast: {'type': 'cast', 'columns': {'date': 'datetime', 'qty': 'int64'}, 'errors': 'coerce'}
+              errors is raise, coerce (bad values become missing) or ignore (column left as is)
+            - dedupe: {'type': 'dedupe', 'columns': ['id'], 'keep': 'first'}
+            - groupby: {'type': 'groupby', 'by': ['region'],
+              'aggregations': {'total': ['amount', 'sum'], 'orders': ['id', 'count']}}
+            - pivot: {'type': 'pivot', 'index': 'region', 'columns': 'month',
+              'values': 'amount', 'aggfunc': 'sum'}
+            - join: {'type': 'join', 'right': 'customers', 'on': 'customer_id', 'how': 'left'};
+              'right' is a name in `tables`, a file path, or a list of records
+            - limit: {'type': 'limit', 'n': 10}
 
         Returns:
             Transformed DataFrame
         """
-        df = data.copy()
-
-        for op in operations:
-            op_type = op.get("type")
-
-            if op_type == "filter":
-                column = op["column"]
-                condition = op["condition"]
-                df = df[df[column] == condition]
+        df = data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+        tables = tables or {}
 
-            elif op_type == "rename":
-                df = df.rename(columns=op["columns"])
-
-            elif op_type == "drop":
-                df = df.drop(columns=op["columns"])
-
-            elif op_type == "sort":
-                df = df.sort_values(by=op["by"], ascending=op.get("ascending", True))
-
-            elif op_type == "fillna":
-                df = df.fillna(op["value"])
+        def resolve_table(name: str) -> pd.DataFrame:
+            if name in tables:
+                table = tables[name]
+                return table if isinstance(table, pd.DataFrame) else pd.DataFrame(table)
+            return self.read(name)
 
+        for op in plan_operations(operations, optimize=optimize):
+            op_type = op.get("type")
+            df = apply_operation(df, op, resolve_table)
             self.logger.debug(f"Applied transformation: {op_type}")
 
         return df
@@ -197,7 +710,7 @@ class SpreadsheetModule(LoggerMixin):
 
     def create_styled_excel(
         self,
-        data: Union[pd.DataFrame, List[Dict]],
+        data: Union[pd.DataFrame, List[Dict], Iterable[Any]],
         file_path: str,
         sheet_name: str = "Sheet1",
         header_style: Optional[Dict] = None,
@@ -205,44 +718,210 @@ class SpreadsheetModule(LoggerMixin):
         """Create a styled Excel file with formatting.
 
         Args:
-            data: Data to write
+            data: Data to write (DataFrame, list of dicts, or an iterator of chunks/rows)
             file_path: Output path
             sheet_name: Sheet name
-            header_style: Optional header styling options
+            header_style: Optional header styling options (see write_excel_stream)
 
         Returns:
             Path to created file
         """
-        if isinstance(data, list):
-            data = pd.DataFrame(data)
+        self.write_excel_stream(data, file_path, sheet_name=sheet_name, header_style=header_style)
+        self.logger.info(f"Created styled Excel file: {file_path}")
+        return file_path
 
-        wb = Workbook()
-        ws = wb.active
-        ws.title = sheet_name
-
-        # Write headers
-        for col_idx, column in enumerate(data.columns, 1):
-            cell = ws.cell(row=1, column=col_idx, value=column)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.alignment = Alignment(horizontal="center")
-
-        # Write data
-        for row_idx, row in enumerate(data.values, 2):
-            for col_idx, value in enumerate(row, 1):
-                ws.cell(row=row_idx, column=col_idx, value=value)
-
-        # Auto-adjust column widths
-        for col_idx, column in enumerate(data.columns, 1):
-            max_length = max(
-                len(str(column)),
-                data[column].astype(str).str.len().max() if len(data) > 0 else 0
-            )
-            ws.column_dimensions[ws.cell(row=1, column=col_idx).column_letter].width = min(max_length + 2, 50)
+    # Streaming Excel output
 
-        wb.save(file_path)
-        self.logger.info(f"Created styled Excel file: {file_path}")
+    @staticmethod
+    def _row_chunks(
+        data: Union[pd.DataFrame, List[Dict], Iterable[Any]],
+        columns: Optional[List[str]] = None,
+        chunk_rows: int = 10000,
+    ) -> Iterator[pd.DataFrame]:
+        """Normalize tables, chunk iterators and row iterators into DataFrame chunks.
+
+        Items of an iterator may be DataFrames, lists of dicts, dicts (one
+        row) or tuples/lists of values (one row, in `columns` order).
+        """
+        if isinstance(data, list) and (not data or isinstance(data[0], dict)):
+            data = pd.DataFrame(data, columns=columns)
+
+        if isinstance(data, pd.DataFrame):
+            for start in range(0, len(data), chunk_rows):
+                yield data.iloc[start:start + chunk_rows]
+            return
+
+        rows: List[Any] = []
+        for item in data:
+            if isinstance(item, pd.DataFrame) or (isinstance(item, list) and item and isinstance(item[0], dict)):
+                if rows:
+                    yield pd.DataFrame(rows, columns=columns)
+                    rows = []
+                chunk = item if isinstance(item, pd.DataFrame) else pd.DataFrame(item)
+                if columns is None:
+                    columns = list(chunk.columns)
+                yield chunk
+                continue
+
+            if isinstance(item, dict) and columns is None:
+                columns = list(item.keys())
+            rows.append(item)
+            if len(rows) >= chunk_rows:
+                yield pd.DataFrame(rows, columns=columns)
+                rows = []
+
+        if rows:
+            yield pd.DataFrame(rows, columns=columns)
+
+    @staticmethod
+    def _sample_widths(sample: pd.DataFrame, max_width: int = 50) -> List[float]:
+        """Column widths from the header and a sample of rows."""
+        widths = []
+        for position, column in enumerate(sample.columns):
+            values = sample.iloc[:, position].dropna()
+            longest = values.astype(str).str.len().max() if len(values) else 0
+            widths.append(min(max(len(str(column)), int(longest)) + 2, max_width))
+        return widths
+
+    def write_excel_stream(
+        self,
+        data: Union[pd.DataFrame, List[Dict], Iterable[Any]],
+        file_path: str,
+        sheet_name: str = "Sheet1",
+        columns: Optional[List[str]] = None,
+        styled: bool = True,
+        header_style: Optional[Dict[str, Any]] = None,
+        width_sample: int = 1000,
+        engine: str = "auto",
+        max_rows: int = EXCEL_MAX_ROWS,
+    ) -> str:
+        """Write rows to an Excel file without holding the workbook in memory.
+
+        Rows are written as they arrive through xlsxwriter's constant_memory
+        mode or openpyxl's write-only mode, so memory depends on the chunk
+        size, not the number of rows. Column widths are estimated from the
+        first `width_sample` rows. When a sheet is full, writing continues
+        on a new sheet (`<sheet_name>_2`, ...) with the header repeated.
+
+        Args:
+            data: DataFrame, list of dicts, or an iterator of DataFrames,
+                lists of dicts, dicts or value tuples (e.g. DatabaseModule.stream())
+            file_path: Output file path
+            sheet_name: Name for the worksheet
+            columns: Header for value-tuple rows (default: taken from the data)
+            styled: Style the header row and size the columns
+            header_style: Overrides for DEFAULT_HEADER_STYLE (bold,
+                font_color, fill_color, align)
+            width_sample: Rows used to estimate column widths
+            engine: 'xlsxwriter', 'openpyxl' or 'auto' (xlsxwriter if installed)
+            max_rows: Rows per sheet including the header (default: the xlsx limit)
+
+        Returns:
+            Path to the created file
+        """
+        if not 1 < max_rows <= EXCEL_MAX_ROWS:
+            raise ValueError(f"max_rows must be between 2 and {EXCEL_MAX_ROWS}")
+        if engine == "auto":
+            engine = "xlsxwriter" if XLSXWRITER_AVAILABLE else "openpyxl"
+        if engine == "xlsxwriter" and not XLSXWRITER_AVAILABLE:
+            raise RuntimeError("xlsxwriter not installed. Run: pip install xlsxwriter")
+        if engine not in ("xlsxwriter", "openpyxl"):
+            raise ValueError(f"Unsupported Excel engine: {engine}")
+
+        style = {**DEFAULT_HEADER_STYLE, **(header_style or {})}
+        chunks = self._row_chunks(data, columns)
+        first = next(chunks, None)
+        if first is None:
+            first = pd.DataFrame(columns=columns or [])
+        header = [str(c) for c in first.columns]
+        widths = self._sample_widths(first.head(width_sample)) if styled else None
+
+        self.logger.info(f"Streaming rows to Excel ({engine}): {file_path}")
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+        rows = 0
+        sheets = 0
+
+        def next_sheet_name() -> str:
+            nonlocal sheets
+            sheets += 1
+            # Sheet names are limited to 31 characters
+            return sheet_name if sheets == 1 else f"{sheet_name[:25]}_{sheets}"
+
+        def chunk_values(chunk: pd.DataFrame) -> Iterator[tuple]:
+            # Missing values become empty cells rather than NaN
+            return chunk.astype(object).where(chunk.notna(), None).itertuples(index=False, name=None)
+
+        def all_chunks() -> Iterator[pd.DataFrame]:
+            yield first
+            yield from chunks
+
+        if engine == "xlsxwriter":
+            wb = xlsxwriter.Workbook(file_path, {
+                "constant_memory": True,
+                "strings_to_urls": False,
+                "default_date_format": "yyyy-mm-dd hh:mm:ss",
+            })
+            header_format = None
+            if styled:
+                header_format = wb.add_format({
+                    "bold": style["bold"],
+                    "font_color": f"#{style['font_color']}",
+                    "bg_color": f"#{style['fill_color']}",
+                    "align": style["align"],
+                })
+
+            def add_sheet():
+                ws = wb.add_worksheet(next_sheet_name())
+                if styled:
+                    for col_idx, width in enumerate(widths):
+                        ws.set_column(col_idx, col_idx, width)
+                ws.write_row(0, 0, header, header_format)
+                return ws
+
+            ws, row = add_sheet(), 0
+            for chunk in all_chunks():
+                for values in chunk_values(chunk):
+                    if row == max_rows - 1:
+                        ws, row = add_sheet(), 0
+                    row += 1
+                    # write_row() returns -1 instead of raising when out of range
+                    if ws.write_row(row, 0, values) == -1:
+                        raise ValueError(f"Row {row} could not be written to {file_path}")
+                    rows += 1
+            wb.close()
+
+        else:
+            wb = Workbook(write_only=True)
+            font = Font(bold=style["bold"], color=style["font_color"])
+            fill = PatternFill(start_color=style["fill_color"], end_color=style["fill_color"], fill_type="solid")
+            alignment = Alignment(horizontal=style["align"])
+
+            def add_sheet():
+                ws = wb.create_sheet(next_sheet_name())
+                if not styled:
+                    ws.append(header)
+                    return ws
+                for col_idx, width in enumerate(widths, 1):
+                    ws.column_dimensions[get_column_letter(col_idx)].width = width
+                header_cells = []
+                for name in header:
+                    cell = WriteOnlyCell(ws, value=name)
+                    cell.font, cell.fill, cell.alignment = font, fill, alignment
+                    header_cells.append(cell)
+                ws.append(header_cells)
+                return ws
+
+            ws, row = add_sheet(), 0
+            for chunk in all_chunks():
+                for values in chunk_values(chunk):
+                    if row == max_rows - 1:
+                        ws, row = add_sheet(), 0
+                    ws.append(values)
+                    row += 1
+                    rows += 1
+            wb.save(file_path)
+
+        self.logger.info(f"Wrote {rows} rows to Excel: {file_path} ({sheets} sheet{'s' if sheets > 1 else ''})")
         return file_path
 
     def get_sheet_names(self, file_path: str) -> List[str]:
@@ -256,12 +935,22 @@ class SpreadsheetModule(LoggerMixin):
         file_path: str,
         sheet_name: str = "Sheet1",
     ) -> str:
-        """Append data to an existing Excel file.
+        """Append rows to an existing Excel file in place.
+
+        The new rows are written after the sheet's last row, and existing
+        cells, styling and other sheets are kept. Values are matched to the
+        sheet's header row by column name (compared as text, so numeric or
+        date headers match too). Columns the sheet does not have yet are
+        added to the header.
+
+        Note:
+            The workbook is round-tripped through openpyxl, which does not
+            preserve charts, images or pivot tables.
 
         Args:
             data: Data to append
-            file_path: Path to existing file
-            sheet_name: Sheet to append to
+            file_path: Path to existing file (created if missing)
+            sheet_name: Sheet to append to (created if missing)
 
         Returns:
             Path to the file
@@ -272,6 +961,99 @@ class SpreadsheetModule(LoggerMixin):
         if not Path(file_path).exists():
             return self.write_excel(data, file_path, sheet_name)
 
-        existing = self.read_excel(file_path, sheet_name=sheet_name)
-        combined = pd.concat([existing, data], ignore_index=True)
-        return self.write_excel(combined, file_path, sheet_name)
+        wb = load_workbook(file_path)
+        ws = wb[sheet_name] if sheet_name in wb.sheetnames else wb.create_sheet(sheet_name)
+
+        header = [cell.value for cell in ws[1]] if ws.max_row >= 1 else []
+        while header and header[-1] is None:
+            header.pop()
+
+        if not header:
+            header = [str(c) for c in data.columns]
+            for col_idx, name in enumerate(header, 1):
+                ws.cell(row=1, column=col_idx, value=name)
+        else:
+            header = ["" if v is None else str(v) for v in header]
+            for name in map(str, data.columns):
+                if name not in header:
+                    header.append(name)
+                    ws.cell(row=1, column=len(header), value=name)
+
+        aligned = data.rename(columns=str).reindex(columns=header)
+        for values in aligned.astype(object).where(aligned.notna(), None).itertuples(index=False, name=None):
+            ws.append(values)
+
+        # Save beside the original and swap, so a failed save cannot corrupt it
+        tmp_path = f"{file_path}.tmp"
+        try:
+            wb.save(tmp_path)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        self.logger.info(f"Appended {len(data)} rows to {file_path} [{sheet_name}]")
+        return file_path
+
+    def append_to_csv(
+        self,
+        data: Union[pd.DataFrame, List[Dict]],
+        file_path: str,
+        encoding: str = "utf-8",
+    ) -> str:
+        """Append rows to the end of a CSV file without reading it.
+
+        Values are ordered to match the existing header line; columns the
+        file does not have are dropped (with a warning), since adding them
+        would mean rewriting the file. Compressed .gz/.bz2/.xz/.zst files
+        are appended as a new stream; .zip archives are rejected, since a
+        second member would make the file unreadable.
+
+        Args:
+            data: Data to append
+            file_path: Path to CSV file (created with a header if missing or empty)
+            encoding: File encoding
+
+        Returns:
+            Path to the file
+        """
+        if isinstance(data, list):
+            data = pd.DataFrame(data)
+
+        path = Path(file_path)
+        if not path.exists() or path.stat().st_size == 0:
+            return self.write_csv(data, file_path, encoding=encoding)
+
+        if path.suffix.lower() == ".zip":
+            raise ValueError(f"Cannot append to a ZIP archive: {file_path}; use .gz or .zst for appendable CSV")
+
+        compressed = path.suffix.lower() in CSV_COMPRESSION_SUFFIXES
+        if compressed:
+            header = list(pd.read_csv(path, nrows=0, encoding=encoding).columns)
+        else:
+            with open(path, "r", newline="", encoding=encoding) as f:
+                header = next(csv.reader(f), [])
+
+        extra = [c for c in data.columns if str(c) not in header]
+        if extra:
+            self.logger.warning(f"Dropping columns not in {file_path}: {extra}")
+        aligned = data.rename(columns=str).reindex(columns=header)
+
+        if compressed:
+            # Compressed files take the rows as a new compressed member/frame
+            aligned.to_csv(path, mode="a", index=False, header=False, encoding=encoding)
+            self.logger.info(f"Appended {len(data)} rows to {file_path}")
+            return file_path
+
+        # Make sure the new rows start on their own line
+        with open(path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            needs_newline = f.read(1) not in (b"\n", b"\r")
+
+        with open(path, "a", newline="", encoding=encoding) as f:
+            if needs_newline:
+                f.write("\n")
+            aligned.to_csv(f, index=False, header=False)
+
+        self.logger.info(f"Appended {len(data)} rows to {file_path}")
+        return file_path
@@ -0,0 +1,495 @@
+"""Planned, vectorized table transformations for SpreadsheetModule.transform()."""
+
+import operator
+import re
+from functools import reduce
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import pandas as pd
+from pandas.api.extensions import ExtensionDtype
+from pandas.api.types import is_bool_dtype, is_integer_dtype, is_numeric_dtype, pandas_dtype
+
+# Comparison operators usable in filter conditions
+COMPARISONS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+
+# Operations the planner moves towards the start of the list
+MOVABLE = ("filter", "drop")
+
+# Accepted values of a cast's 'errors' option
+CAST_ERRORS = ("raise", "coerce", "ignore")
+
+_EXPRESSION_WORDS = {"and", "or", "not", "in", "True", "False", "None"}
+
+
+def _as_list(value: Any) -> List[Any]:
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return [value]
+
+
+def normalize_operation(op: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy an operation, converting the legacy equality filter to the conditions form.
+
+    A dedupe's pandas-style 'subset' is accepted as an alias for 'columns'.
+    """
+    op = dict(op)
+    if op.get("type") == "filter" and "conditions" not in op:
+        condition = {"column": op.pop("column"), "op": op.pop("op", "==")}
+        if "value_column" in op:
+            condition["value_column"] = op.pop("value_column")
+        else:
+            condition["value"] = op.pop("value", op.pop("condition", None))
+        for key in ("case", "inclusive"):
+            if key in op:
+                condition[key] = op.pop(key)
+        op["conditions"] = [condition]
+    elif op.get("type") == "dedupe" and "subset" in op:
+        op["columns"] = op.pop("subset")
+    return op
+
+
+def _filter_columns(op: Dict[str, Any]) -> Set[str]:
+    columns = set()
+    for condition in op["conditions"]:
+        columns.add(condition["column"])
+        if "value_column" in condition:
+            columns.add(condition["value_column"])
+    return columns
+
+
+def _expression_columns(expression: str) -> Set[str]:
+    """Names an eval() expression may read (over-approximated, which only limits reordering)."""
+    quoted = set(re.findall(r"`([^`]+)`", expression))
+    unquoted = re.sub(r"`[^`]+`|'[^']*'|\"[^\"]*\"", " ", expression)
+    names = set(re.findall(r"[A-Za-z_][A-Za-z0-9_]*", unquoted)) - _EXPRESSION_WORDS
+    return quoted | names
+
+
+def _compute_columns(op: Dict[str, Any]) -> Dict[str, str]:
+    if "columns" in op:
+        return dict(op["columns"])
+    return {op["column"]: op["expression"]}
+
+
+def _op_columns(op: Dict[str, Any]) -> Set[str]:
+    """Columns a filter or drop refers to."""
+    return _filter_columns(op) if op["type"] == "filter" else set(_as_list(op["columns"]))
+
+
+def _rename_back(op: Dict[str, Any], mapping: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    """Rewrite a filter or drop to use the column names from before a rename.
+
+    Returns None when that could change the result: a rename target that is
+    not itself renamed away may collide with an existing column (leaving two
+    columns of that name), and an old name is gone after the rename.
+    """
+    targets, sources = set(mapping.values()), set(mapping)
+    if _op_columns(op) & ((targets - sources) | (sources - targets)):
+        return None
+    inverse = {new: old for old, new in mapping.items()}
+    op = dict(op)
+    if op["type"] == "filter":
+        conditions = []
+        for condition in op["conditions"]:
+            condition = dict(condition)
+            condition["column"] = inverse.get(condition["column"], condition["column"])
+            if "value_column" in condition:
+                condition["value_column"] = inverse.get(condition["value_column"], condition["value_column"])
+            conditions.append(condition)
+        op["conditions"] = conditions
+    else:
+        op["columns"] = [inverse.get(c, c) for c in _as_list(op["columns"])]
+    return op
+
+
+def _cast_is_row_wise(op: Dict[str, Any]) -> bool:
+    """Whether a cast gives the same dtype and values on any subset of rows.
+
+    'coerce' and 'ignore' pick their result from the values, as do
+    'numeric', 'datetime' (format inference) and 'category' (categories).
+    """
+    if op.get("errors", "raise") != "raise":
+        return False
+    for dtype in op["columns"].values():
+        if dtype in ("numeric", "datetime"):
+            return False
+        try:
+            if isinstance(pandas_dtype(dtype), pd.CategoricalDtype):
+                return False
+        except TypeError:
+            # Unknown dtype: keep the order so the cast raises where it was
+            return False
+    return True
+
+
+def _swap(op: Dict[str, Any], prev: Dict[str, Any]) -> Optional[Tuple[Optional[Dict], Optional[Dict]]]:
+    """Try to move a filter/drop in front of the operation before it.
+
+    Returns:
+        None if the order must be kept, otherwise (op, prev) as they should
+        run in the new order; either may be None when it is no longer needed
+    """
+    kind, prev_kind = op["type"], prev["type"]
+
+    if prev_kind == "rename":
+        renamed = _rename_back(op, prev["columns"])
+        return (renamed, prev) if renamed is not None else None
+
+    if kind == "filter":
+        reads = _filter_columns(op)
+        if prev_kind == "sort":
+            return op, prev
+        if prev_kind == "select":
+            return (op, prev) if reads <= set(_as_list(prev["columns"])) else None
+        if prev_kind == "drop":
+            return (op, prev) if not reads & set(_as_list(prev["columns"])) else None
+        if prev_kind == "compute":
+            return (op, prev) if not reads & set(_compute_columns(prev)) else None
+        if prev_kind == "cast":
+            if reads & set(prev["columns"]) or not _cast_is_row_wise(prev):
+                return None
+            return op, prev
+        # Not past fillna: whether a fill changes a column's dtype (e.g. a
+        # string filled into a float column) depends on the rows it sees
+        if prev_kind == "dedupe":
+            # Duplicates share the subset's values, so they are kept or removed together
+            subset = _as_list(prev.get("columns"))
+            return (op, prev) if not subset or reads <= set(subset) else None
+        if prev_kind == "groupby":
+            return (op, prev) if reads <= set(_as_list(prev["by"])) else None
+        if prev_kind == "join":
+            # Only an inner join drops the same rows either way; after an outer
+            # join the filtered rows would change the result's dtypes
+            keys = set(_as_list(prev.get("on")))
+            return (op, prev) if keys and reads <= keys and prev.get("how", "inner") == "inner" else None
+        return None
+
+    # kind == "drop"
+    dropped = set(_as_list(op["columns"]))
+    if prev_kind == "select":
+        # Fold the drop into the projection
+        if op.get("errors") != "ignore" and not dropped <= set(_as_list(prev["columns"])):
+            return None
+        selected = [c for c in _as_list(prev["columns"]) if c not in dropped]
+        return None, {**prev, "columns": selected}
+    if prev_kind == "limit":
+        return op, prev
+    if prev_kind == "drop":
+        # Reordering drops of the same column can change which one raises
+        if dropped & set(_as_list(prev["columns"])) and op.get("errors", "raise") != prev.get("errors", "raise"):
+            return None
+        return op, prev
+    if prev_kind == "fillna":
+        if prev.get("columns") is not None:
+            filled = [c for c in _as_list(prev["columns"]) if c not in dropped]
+            if not filled:
+                return op, None
+            prev = {**prev, "columns": filled}
+        return op, prev
+    if prev_kind == "filter":
+        return (op, prev) if not dropped & _filter_columns(prev) else None
+    if prev_kind == "sort":
+        return (op, prev) if not dropped & set(_as_list(prev["by"])) else None
+    if prev_kind == "dedupe":
+        subset = set(_as_list(prev.get("columns")))
+        return (op, prev) if subset and not dropped & subset else None
+    if prev_kind == "cast":
+        kept = {c: t for c, t in prev["columns"].items() if c not in dropped}
+        return op, ({**prev, "columns": kept} if kept else None)
+    if prev_kind == "compute":
+        computed = _compute_columns(prev)
+        needed = set().union(*(_expression_columns(e) for e in computed.values()))
+        if dropped & needed:
+            return None
+        if set(computed) <= dropped:
+            # Every computed column is dropped later: skip the computation. A
+            # computed column may also replace an existing one, so the drop
+            # keeps it but no longer requires it to exist.
+            return {**op, "errors": "ignore"}, None
+        if dropped & set(computed):
+            return None
+        return op, prev
+    return None
+
+
+def _merge_adjacent(planned: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Combine neighbouring AND-filters into one step and neighbouring drops into one call."""
+    merged: List[Dict[str, Any]] = []
+    for op in planned:
+        last = merged[-1] if merged else None
+        if (
+            last is not None and op["type"] == last["type"] == "filter"
+            and last.get("how", "all") == op.get("how", "all") == "all"
+        ):
+            merged[-1] = {**last, "conditions": last["conditions"] + op["conditions"]}
+        elif (
+            last is not None and op["type"] == last["type"] == "drop"
+            and last.get("errors", "raise") == op.get("errors", "raise")
+            and (op.get("errors") == "ignore" or not set(_as_list(op["columns"])) & set(_as_list(last["columns"])))
+        ):
+            # A repeated column would make the second drop raise, so those stay apart
+            columns = _as_list(last["columns"])
+            merged[-1] = {**last, "columns": columns + [c for c in _as_list(op["columns"]) if c not in columns]}
+        else:
+            merged.append(op)
+    return merged
+
+
+def plan_operations(operations: List[Dict[str, Any]], optimize: bool = True) -> List[Dict[str, Any]]:
+    """Order operations for execution.
+
+    Filters and column drops are moved ahead of operations they do not
+    depend on (sorts, computed columns, strict casts to a fixed dtype,
+    renames, and joins, group-bys or dedupes on the filtered keys), so
+    expensive steps run on less data. Computed or cast columns that are
+    dropped later are not produced at all. Either way, an expression or
+    cast that would fail only on the skipped columns or filtered-out rows
+    raises only with optimize=False. Adjacent filters are merged into one
+    step; its conditions still run in order, each on the rows the
+    previous kept.
+
+    Args:
+        operations: Operation dicts as accepted by apply_operation()
+        optimize: Reorder and merge (False keeps the given order)
+
+    Returns:
+        Planned list of operation dicts
+    """
+    planned: List[Dict[str, Any]] = []
+
+    for op in operations:
+        op = normalize_operation(op)
+        position = len(planned)
+
+        while optimize and op is not None and op["type"] in MOVABLE and position > 0:
+            swapped = _swap(op, planned[position - 1])
+            if swapped is None:
+                break
+            op, prev = swapped
+            if prev is None:
+                del planned[position - 1]
+            else:
+                planned[position - 1] = prev
+            position -= 1
+
+        if op is not None:
+            planned.insert(position, op)
+
+    return _merge_adjacent(planned) if optimize else planned
+
+
+def condition_mask(df: pd.DataFrame, condition: Dict[str, Any]) -> pd.Series:
+    """Boolean mask for one filter condition."""
+    column = df[condition["column"]]
+    op = condition.get("op", "==")
+    value = df[condition["value_column"]] if "value_column" in condition else condition.get("value")
+
+    if op in COMPARISONS:
+        mask = COMPARISONS[op](column, value)
+    elif op == "between":
+        low, high = value
+        mask = column.between(low, high, inclusive=condition.get("inclusive", "both"))
+    elif op in ("in", "isin"):
+        mask = column.isin(_as_list(value))
+    elif op in ("not_in", "notin"):
+        mask = ~column.isin(_as_list(value))
+    elif op in ("regex", "contains"):
+        mask = column.astype("string").str.contains(
+            value, regex=op == "regex", case=condition.get("case", True), na=False
+        )
+    elif op == "startswith":
+        mask = column.astype("string").str.startswith(value, na=False)
+    elif op == "endswith":
+        mask = column.astype("string").str.endswith(value, na=False)
+    elif op == "isnull":
+        mask = column.isna()
+    elif op == "notnull":
+        mask = column.notna()
+    else:
+        raise ValueError(f"Unsupported filter operator: {op}")
+
+    if mask.dtype != bool:
+        mask = mask.fillna(False).astype(bool)
+    return mask
+
+
+def _to_number(column: pd.Series, dtype: Any, errors: str) -> pd.Series:
+    """pd.to_numeric followed by a cast to a numeric dtype."""
+    values = pd.to_numeric(column, errors=errors)
+    if is_integer_dtype(dtype):
+        fractional = values.notna() & (values % 1 != 0)
+        if fractional.any():
+            if errors == "raise":
+                raise ValueError(f"Cannot cast non-integer values of {column.name!r} to {dtype}")
+            values = values.mask(fractional)
+        if errors == "coerce" and values.isna().any() and not isinstance(dtype, ExtensionDtype):
+            # Coerced values need a nullable integer type to stay missing
+            dtype = dtype.name.replace("uint", "UInt").replace("int", "Int")
+    return values.astype(dtype)
+
+
+def cast_column(column: pd.Series, dtype: Any, errors: str = "raise", date_format: Optional[str] = None) -> pd.Series:
+    """Convert one column for a cast operation.
+
+    Args:
+        column: Values to convert
+        dtype: 'datetime', 'numeric' or any pandas dtype; numeric dtypes go
+            through pd.to_numeric so 'coerce' applies to them too
+        errors: raise, coerce (unparseable values become missing) or
+            ignore (the column is returned unchanged if it cannot be converted)
+        date_format: strftime format for 'datetime'
+
+    Returns:
+        Converted column
+    """
+    if dtype == "datetime":
+        def convert(mode: str) -> pd.Series:
+            return pd.to_datetime(column, errors=mode, format=date_format)
+    elif dtype == "numeric":
+        def convert(mode: str) -> pd.Series:
+            return pd.to_numeric(column, errors=mode)
+    else:
+        target = pandas_dtype(dtype)
+
+        def convert(mode: str) -> pd.Series:
+            if is_numeric_dtype(target) and not is_bool_dtype(target):
+                return _to_number(column, target, mode)
+            return column.astype(target)
+
+    if errors == "ignore":
+        # pandas no longer accepts errors='ignore', so emulate it
+        try:
+            return convert("raise")
+        except (ValueError, TypeError):
+            return column
+    return convert(errors)
+
+
+def apply_operation(
+    df: pd.DataFrame,
+    op: Dict[str, Any],
+    resolve_table: Callable[[str], pd.DataFrame],
+) -> pd.DataFrame:
+    """Apply one (normalized) operation and return the resulting DataFrame.
+
+    The input is never modified, so no defensive copy is needed.
+
+    Args:
+        df: Input DataFrame
+        op: Operation dict
+        resolve_table: Turns a join's 'right' name into a DataFrame
+
+    Returns:
+        Transformed DataFrame
+    """
+    op_type = op.get("type")
+
+    if op_type == "filter":
+        if op.get("how", "all") == "any":
+            return df[reduce(operator.or_, (condition_mask(df, c) for c in op["conditions"]))]
+        # Each condition only sees the rows the earlier ones kept, so a
+        # condition that cannot handle the removed rows (e.g. comparing a
+        # mixed-type column) behaves as it would in a separate filter
+        for condition in op["conditions"]:
+            df = df[condition_mask(df, condition)]
+        return df
+
+    elif op_type == "select":
+        return df.loc[:, _as_list(op["columns"])]
+
+    elif op_type == "rename":
+        return df.rename(columns=op["columns"])
+
+    elif op_type == "drop":
+        return df.drop(columns=op["columns"], errors=op.get("errors", "raise"))
+
+    elif op_type == "sort":
+        return df.sort_values(
+            by=op["by"],
+            ascending=op.get("ascending", True),
+            na_position=op.get("na_position", "last"),
+            kind="stable",
+        )
+
+    elif op_type == "fillna":
+        if op.get("columns") is not None:
+            return df.fillna({column: op["value"] for column in _as_list(op["columns"])})
+        return df.fillna(op["value"])
+
+    elif op_type == "compute":
+        for column, expression in _compute_columns(op).items():
+            df = df.assign(**{column: df.eval(expression)})
+        return df
+
+    elif op_type == "cast":
+        errors = op.get("errors", "raise")
+        if errors not in CAST_ERRORS:
+            raise ValueError(f"Unsupported cast errors mode: {errors!r} (use one of {CAST_ERRORS})")
+        converted = {
+            column: cast_column(df[column], dtype, errors, op.get("format"))
+            for column, dtype in op["columns"].items()
+        }
+        return df.assign(**converted)
+
+    elif op_type == "dedupe":
+        return df.drop_duplicates(
+            subset=_as_list(op.get("columns")) or None,
+            keep=op.get("keep", "first"),
+        )
+
+    elif op_type == "groupby":
+        named = {}
+        for output, spec in op["aggregations"].items():
+            named[output] = (output, spec) if isinstance(spec, str) else tuple(spec)
+        return df.groupby(
+            _as_list(op["by"]),
+            as_index=False,
+            sort=op.get("sort", True),
+            dropna=op.get("dropna", False),
+        ).agg(**named)
+
+    elif op_type == "pivot":
+        table = pd.pivot_table(
+            df,
+            index=op["index"],
+            columns=op["columns"],
+            values=op.get("values"),
+            aggfunc=op.get("aggfunc", "sum"),
+            fill_value=op.get("fill_value"),
+        )
+        if isinstance(table.columns, pd.MultiIndex):
+            table.columns = ["_".join(str(part) for part in col if part != "") for col in table.columns]
+        else:
+            table.columns = [str(col) for col in table.columns]
+        return table.reset_index()
+
+    elif op_type == "join":
+        right = op["right"]
+        if isinstance(right, str):
+            right = resolve_table(right)
+        if isinstance(right, list):
+            right = pd.DataFrame(right)
+        if op.get("right_columns"):
+            right = right.loc[:, _as_list(op["right_columns"])]
+        return df.merge(
+            right,
+            how=op.get("how", "inner"),
+            on=op.get("on"),
+            left_on=op.get("left_on"),
+            right_on=op.get("right_on"),
+            suffixes=tuple(op.get("suffixes", ("_x", "_y"))),
+        )
+
+    elif op_type == "limit":
+        return df.head(op["n"])
+
+    raise ValueError(f"Unsupported transformation: {op_type}")
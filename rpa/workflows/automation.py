@@ -36,8 +36,11 @@ class StepType(Enum):
     WRITE_CSV = "write_csv"
     READ_EXCEL = "read_excel"
     WRITE_EXCEL = "write_excel"
+    READ_DATA = "read_data"
+    WRITE_DATA = "write_data"
     FILTER_DATA = "filter_data"
     TRANSFORM_DATA = "transform_data"
+    TRANSFORM_TABLE = "transform_table"
 
     # Web Operations
     HTTP_GET = "http_get"
@@ -57,6 +60,7 @@ class StepType(Enum):
     DB_QUERY = "db_query"
     DB_INSERT = "db_insert"
     DB_UPDATE = "db_update"
+    DB_EXPORT = "db_export"
 
     # Communication
     SEND_EMAIL = "send_email"
@@ -202,6 +206,38 @@ class AutomationWorkflow(LoggerMixin):
             params={"path": path, "data": data, "headers": headers},
         ))
 
+    def read_data(
+        self,
+        name: str,
+        path: str,
+        save_as: Optional[str] = None,
+    ) -> "AutomationWorkflow":
+        """Add a step that reads a table, picking the reader from the file type.
+
+        Parquet and Feather/Arrow files are the fast way to hand large
+        tables from one workflow stage to the next.
+        """
+        return self.add_step(AutomationStep(
+            name=name,
+            step_type=StepType.READ_DATA,
+            params={"path": path},
+            save_result_as=save_as or name,
+        ))
+
+    def write_data(
+        self,
+        name: str,
+        path: str,
+        data: Union[str, List[Dict]],
+    ) -> "AutomationWorkflow":
+        """Add a step that writes a table (or context variable) in the format given by the path."""
+        return self.add_step(AutomationStep(
+            name=name,
+            step_type=StepType.WRITE_DATA,
+            params={"path": path, "data": data},
+            save_result_as=name,
+        ))
+
     def http_get(
         self,
         name: str,
@@ -267,14 +303,15 @@ class AutomationWorkflow(LoggerMixin):
         self,
         name: str,
         url: str,
-        selectors: Dict[str, str],
+        selectors: Dict[str, Union[str, Dict[str, Any]]],
         save_as: Optional[str] = None,
+        item_selector: Optional[str] = None,
     ) -> "AutomationWorkflow":
-        """Add a web scraping step."""
+        """Add a web scraping step (one fetch and parse for all selectors)."""
         return self.add_step(AutomationStep(
             name=name,
             step_type=StepType.SCRAPE_PAGE,
-            params={"url": url, "selectors": selectors},
+            params={"url": url, "selectors": selectors, "item_selector": item_selector},
             save_result_as=save_as or name,
         ))
 
@@ -337,7 +374,7 @@ class AutomationWorkflow(LoggerMixin):
         name: str,
         connection_string: str,
         query: str,
-        params: Optional[tuple] = None,
+        params: Optional[Dict[str, Any]] = None,
         save_as: Optional[str] = None,
     ) -> "AutomationWorkflow":
         """Add a database query step."""
@@ -352,6 +389,29 @@ class AutomationWorkflow(LoggerMixin):
             save_result_as=save_as or name,
         ))
 
+    def db_export(
+        self,
+        name: str,
+        connection_string: str,
+        query: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        chunk_size: int = 10000,
+    ) -> "AutomationWorkflow":
+        """Add a step that streams query results to a CSV file chunk by chunk."""
+        return self.add_step(AutomationStep(
+            name=name,
+            step_type=StepType.DB_EXPORT,
+            params={
+                "connection_string": connection_string,
+                "query": query,
+                "path": path,
+                "params": params,
+                "chunk_size": chunk_size,
+            },
+            save_result_as=name,
+        ))
+
     def send_email(
         self,
         name: str,
@@ -390,6 +450,26 @@ class AutomationWorkflow(LoggerMixin):
             save_result_as=save_as or name,
         ))
 
+    def transform_table(
+        self,
+        name: str,
+        source_var: str,
+        operations: List[Dict[str, Any]],
+        save_as: Optional[str] = None,
+    ) -> "AutomationWorkflow":
+        """Add a step that runs SpreadsheetModule.transform() on a context variable.
+
+        Unlike transform_data(), the operations are plain dicts and are kept
+        when the workflow is saved to JSON. Joins can name other context
+        variables as their 'right' table.
+        """
+        return self.add_step(AutomationStep(
+            name=name,
+            step_type=StepType.TRANSFORM_TABLE,
+            params={"source_var": source_var, "operations": operations},
+            save_result_as=save_as or name,
+        ))
+
     def wait(self, name: str, seconds: float) -> "AutomationWorkflow":
         """Add a wait step."""
         return self.add_step(AutomationStep(
@@ -448,6 +528,13 @@ class AutomationWorkflow(LoggerMixin):
             return [self._resolve_value(v) for v in value]
         return value
 
+    def _database(self, params: Dict[str, Any]):
+        """Database module for a step's connection string (pooled engines are shared)."""
+        connection_string = params.get("connection_string")
+        if connection_string:
+            return self.rpa.database.using(connection_string)
+        return self.rpa.database
+
     def _execute_step(self, step: AutomationStep) -> Any:
         """Execute a single automation step."""
         params = self._resolve_value(step.params)
@@ -508,6 +595,15 @@ class AutomationWorkflow(LoggerMixin):
                 sheet_name=params.get("sheet_name", "Sheet1")
             )
 
+        elif step_type == StepType.READ_DATA:
+            return self.rpa.spreadsheet.read(params["path"])
+
+        elif step_type == StepType.WRITE_DATA:
+            data = params["data"]
+            if isinstance(data, str):
+                data = self.context.get(data, [])
+            return self.rpa.spreadsheet.write(data, params["path"])
+
         elif step_type == StepType.FILTER_DATA:
             data = self.context.get(params["source_var"], [])
             filter_fn = params["filter_fn"]
@@ -518,6 +614,10 @@ class AutomationWorkflow(LoggerMixin):
             transform_fn = params["transform_fn"]
             return transform_fn(data)
 
+        elif step_type == StepType.TRANSFORM_TABLE:
+            data = self.context.get(params["source_var"], [])
+            return self.rpa.spreadsheet.transform(data, params["operations"], tables=self.context)
+
         # Web Operations
         elif step_type == StepType.HTTP_GET:
             return self.rpa.scraper.get(
@@ -540,8 +640,10 @@ class AutomationWorkflow(LoggerMixin):
                 return response.text
 
         elif step_type == StepType.SCRAPE_PAGE:
-            html = self.rpa.scraper.get(params["url"])
-            return self.rpa.scraper.extract_elements(html, params["selectors"])
+            page = self.rpa.scraper.get_page(params["url"], parser=params.get("parser"))
+            if params.get("item_selector"):
+                return page.extract_items(params["item_selector"], params["selectors"])
+            return page.extract(params["selectors"])
 
         elif step_type == StepType.API_CALL:
             return self.rpa.api.request(
@@ -591,27 +693,33 @@ class AutomationWorkflow(LoggerMixin):
 
         # Database Operations
         elif step_type == StepType.DB_QUERY:
-            return self.rpa.database.query(
-                connection_string=params["connection_string"],
-                query=params["query"],
-                params=params.get("params"),
+            return self._database(params).execute(
+                params["query"],
+                params.get("params"),
             )
 
         elif step_type == StepType.DB_INSERT:
-            return self.rpa.database.insert(
-                connection_string=params["connection_string"],
+            return self._database(params).insert(
                 table=params["table"],
                 data=params["data"],
             )
 
         elif step_type == StepType.DB_UPDATE:
-            return self.rpa.database.update(
-                connection_string=params["connection_string"],
+            return self._database(params).update(
                 table=params["table"],
                 data=params["data"],
                 where=params["where"],
             )
 
+        elif step_type == StepType.DB_EXPORT:
+            chunks = self._database(params).stream(
+                params["query"],
+                params.get("params"),
+                chunk_size=params.get("chunk_size", 10000),
+                format="dataframe",
+            )
+            return self.rpa.spreadsheet.write_csv(chunks, params["path"])
+
         # Communication
         elif step_type == StepType.SEND_EMAIL:
             return self.rpa.email.send(
@@ -701,7 +809,7 @@ class AutomationWorkflow(LoggerMixin):
                         "name": step.name,
                         "status": "completed",
                         "duration": step_duration,
-                        "result": str(step_result)[:200] if step_result else None,
+                        "result": str(step_result)[:200] if step_result is not None else None,
                     })
                     break
 
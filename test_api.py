@@ -0,0 +1,109 @@
+"""APIModule pagination tests against a local JSON fixture server."""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from rpa.modules import APIModule
+
+ITEMS = [{"id": i} for i in range(7)]
+
+
+class APIHandler(BaseHTTPRequestHandler):
+    hits = 0
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        APIHandler.hits += 1
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        limit = int(query.get("limit", 3))
+
+        if url.path == "/v1/items":
+            start = (int(query["page"]) - 1) * limit
+            body = {"data": ITEMS[start:start + limit], "total": len(ITEMS)}
+        elif url.path == "/v1/cursor":
+            start = int(query.get("cursor", 0))
+            more = start + limit < len(ITEMS)
+            body = {"data": ITEMS[start:start + limit], "next_cursor": str(start + limit) if more else None}
+        elif url.path == "/v1/nested/list":
+            # Relative next links, as returned by nested endpoints
+            start = int(query.get("offset", 0))
+            more = start + 3 < len(ITEMS)
+            body = {"data": ITEMS[start:start + 3], "next": f"list?offset={start + 3}" if more else None}
+        else:
+            self.send_error(404)
+            return
+
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), APIHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/v1/"
+    server.shutdown()
+    server.server_close()
+
+
+def pages(base_url, endpoint, **options):
+    """Pages from iter_pages() and aiter_pages(), which must agree."""
+    api = APIModule(base_url, retry_count=1, cache=False)
+    sync_pages = list(api.iter_pages(endpoint, limit=3, **options))
+
+    async def collect():
+        try:
+            return [page async for page in api.aiter_pages(endpoint, limit=3, **options)]
+        finally:
+            await api.aclose()
+
+    assert asyncio.run(collect()) == sync_pages
+    return [[item["id"] for item in page] for page in sync_pages]
+
+
+@pytest.mark.parametrize("options", [{}, {"total_key": "total"}, {"total_key": "total", "prefetch": 2}])
+def test_numbered_pages(base_url, options):
+    assert pages(base_url, "items", **options) == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_numbered_pages_max_pages(base_url):
+    assert pages(base_url, "items", max_pages=2, total_key="total", prefetch=2) == [[0, 1, 2], [3, 4, 5]]
+
+
+def test_cursor_pages(base_url):
+    assert pages(base_url, "cursor", strategy="cursor") == [[0, 1, 2], [3, 4, 5], [6]]
+    assert pages(base_url, "cursor", strategy="cursor", max_pages=1) == [[0, 1, 2]]
+
+
+def test_relative_next_link_from_nested_endpoint(base_url):
+    assert pages(base_url, "nested/list", strategy="next") == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_unknown_strategy(base_url):
+    with pytest.raises(ValueError, match="strategy"):
+        list(APIModule(base_url).iter_pages("items", strategy="offset"))
+
+
+def test_parallel_batch_stops_after_failure(base_url):
+    api = APIModule(base_url, retry_count=1, cache=False)
+    batch = [{"method": "GET", "endpoint": "missing"}]
+    batch += [{"method": "GET", "endpoint": "items", "params": {"page": 1}}] * 20
+
+    APIHandler.hits = 0
+    with pytest.raises(Exception):
+        api.batch_request(batch, parallel=True, max_concurrency=1, raise_on_error=True)
+    # The queued requests are cancelled; at most one may have started meanwhile
+    assert APIHandler.hits <= 2
@@ -0,0 +1,38 @@
+"""SQLite cache store tests."""
+
+from rpa.core.cache import CacheEntry, SQLiteCache
+
+
+def entry(size):
+    return CacheEntry(url="http://example.invalid/", status_code=200, headers={}, content=b"x" * size)
+
+
+def test_hits_do_not_write(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.db"), max_bytes=1000)
+    cache.set("a", entry(10))
+    changes = cache._conn.total_changes
+
+    for _ in range(50):
+        assert cache.get("a").content == b"x" * 10
+    assert cache._conn.total_changes == changes
+    cache.close()
+
+
+def test_eviction_sees_unflushed_hits(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = SQLiteCache(path, max_bytes=300)
+    for key in ("a", "b", "c"):
+        cache.set(key, entry(100))
+
+    # "a" is the oldest write but the most recent hit, so "b" goes first
+    cache.get("a")
+    cache.set("d", entry(100))
+    assert [cache.get(k) is not None for k in "abcd"] == [True, False, True, True]
+
+    # Access times survive close() and reopening
+    cache.get("c")
+    cache.close()
+    cache = SQLiteCache(path, max_bytes=300)
+    cache.set("e", entry(100))
+    assert [cache.get(k) is not None for k in "acde"] == [False, True, True, True]
+    cache.close()
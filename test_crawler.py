@@ -0,0 +1,105 @@
+"""Crawler tests against a local HTTP fixture server."""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from rpa.modules import Crawler, ScraperModule
+
+SITE = {
+    "/": '<title>Home</title><a href="/a">A</a> <a href="/b#top">B</a> <a href="/b">B again</a>'
+         ' <a href="http://elsewhere.invalid/x">Off-site</a> <a href="/private/secret">Private</a>',
+    "/a": '<title>A</title><a href="/">Home</a> <a href="/c">C</a>',
+    "/b": '<title>B</title><a href="/a">A</a>',
+    "/c": '<title>C</title>',
+    "/private/secret": '<title>Secret</title>',
+}
+
+
+class SiteHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = SITE.get(self.path)
+        if body is None:
+            self.send_error(404)
+            return
+        data = f"<html><head>{body}</head><body>{body}</body></html>".encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def site():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SiteHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def crawl(site, tmp_path, **options):
+    sink = tmp_path / "pages.jsonl"
+    crawler = Crawler(ScraperModule(rate_limit=0), **options)
+    stats = crawler.run([f"{site}/"], sink=str(sink))
+    records = [json.loads(line) for line in sink.read_text().splitlines()]
+    return stats, {r["url"][len(site):]: r for r in records}
+
+
+def test_depth_dedupe_and_scope(site, tmp_path):
+    stats, pages = crawl(site, tmp_path, max_depth=1, exclude_patterns=[r"/private/"])
+
+    # /c is two links away; /b is fetched once despite the fragment link;
+    # the off-site and excluded links are not followed
+    assert sorted(pages) == ["/", "/a", "/b"]
+    assert pages["/"]["depth"] == 0 and pages["/a"]["depth"] == 1
+    assert pages["/b"]["title"] == "B"
+    assert stats["pages"] == 3 and stats["records"] == 3 and stats["errors"] == 0
+
+
+def test_deeper_crawl_and_max_pages(site, tmp_path):
+    _, pages = crawl(site, tmp_path, max_depth=2, exclude_patterns=[r"/private/"])
+    assert sorted(pages) == ["/", "/a", "/b", "/c"]
+    assert pages["/c"]["depth"] == 2
+
+    stats, pages = crawl(site, tmp_path, max_depth=2, max_pages=2)
+    assert stats["pages"] == 2 and len(pages) == 2
+
+
+def test_selectors_and_callable_sink(site):
+    records = []
+    crawler = Crawler(ScraperModule(rate_limit=0), selectors={"heading": "title"}, max_depth=0)
+    stats = crawler.run([f"{site}/a"], sink=records.append)
+
+    assert stats["pages"] == 1
+    assert records == [{"url": f"{site}/a", "depth": 0, "heading": "A"}]
+
+
+def test_arun_inside_running_loop(site, tmp_path):
+    async def main():
+        scraper = ScraperModule(rate_limit=0)
+        crawler = Crawler(scraper, max_depth=0)
+        try:
+            with pytest.raises(RuntimeError, match="arun"):
+                crawler.run([f"{site}/"], sink=str(tmp_path / "run.jsonl"))
+            return await crawler.arun([f"{site}/"], sink=str(tmp_path / "arun.jsonl"))
+        finally:
+            await scraper.aclose()
+
+    assert asyncio.run(main())["pages"] == 1
+
+
+def test_missing_httpx_fails_loudly(site, tmp_path, monkeypatch):
+    monkeypatch.setattr("rpa.core.http.HTTPX_AVAILABLE", False)
+    sink = tmp_path / "pages.jsonl"
+    with pytest.raises(RuntimeError, match="httpx"):
+        Crawler(ScraperModule(rate_limit=0)).run([f"{site}/"], sink=str(sink))
+    assert not sink.exists()
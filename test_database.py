@@ -0,0 +1,94 @@
+"""DatabaseModule query tests against a temporary SQLite file."""
+
+import pytest
+
+from rpa.modules import DatabaseModule
+
+
+@pytest.fixture
+def db(tmp_path):
+    module = DatabaseModule(f"sqlite:///{tmp_path / 'people.db'}")
+    module.execute("CREATE TABLE people (id INTEGER PRIMARY KEY, name TEXT, city TEXT)")
+    module.insert("people", [
+        {"id": 1, "name": "bo", "city": "x"},
+        {"id": 2, "name": "al", "city": "y"},
+        {"id": 3, "name": "bo", "city": "z"},
+        {"id": 4, "name": "al", "city": "x"},
+    ])
+    yield module
+    module.close(dispose=True)
+
+
+def test_order_by_several_columns(db):
+    rows = db.query("people", columns=["id"], order_by="name, id")
+    assert [r["id"] for r in rows] == [2, 4, 1, 3]
+
+    rows = db.query("people", columns=["id"], order_by="name DESC, id desc")
+    assert [r["id"] for r in rows] == [3, 1, 4, 2]
+
+    rows = db.query("people", columns=["id"], order_by="city,name ASC")
+    assert [r["id"] for r in rows] == [4, 1, 2, 3]
+
+
+def test_order_by_rejects_sql(db):
+    with pytest.raises(ValueError):
+        db.query("people", order_by="name, id; DROP TABLE people")
+    with pytest.raises(ValueError, match="Unknown column"):
+        db.query("people", order_by="name, 1=1")
+    with pytest.raises(ValueError, match="Invalid sort direction"):
+        db.query("people", order_by="name sideways")
+
+
+def test_using_closes_least_recently_used_modules(db, tmp_path):
+    urls = [f"sqlite:///{tmp_path / f'other{i}.db'}" for i in range(db.BOUND_MODULE_LIMIT + 2)]
+    modules = [db.using(url) for url in urls]
+
+    assert len(db._bound) == db.BOUND_MODULE_LIMIT
+    assert modules[0]._engine is None and modules[1]._engine is None
+    assert modules[-1]._engine is not None
+
+    # A closed module is replaced on the next call
+    again = db.using(urls[0])
+    assert again is not modules[0] and again.execute("SELECT 1 AS one") == [{"one": 1}]
+    assert modules[2]._engine is None
+
+
+def test_update_columns_named_like_bind_params(tmp_path):
+    db = DatabaseModule(f"sqlite:///{tmp_path / 'w.db'}")
+    db.execute("CREATE TABLE w (id INTEGER PRIMARY KEY, w_id INTEGER, s_name TEXT, name TEXT)")
+    db.insert("w", [{"id": 1, "w_id": 7, "s_name": "p", "name": "a"}])
+
+    assert db.update("w", {"name": "b"}, {"id": 1}) == 1
+    assert db.update("w", {"s_name": "q"}, {"id": 1}) == 1
+    assert db.update("w", {"w_id": 8, "name": "c"}, {"w_id": 7, "s_name": "q"}) == 1
+    assert db.query("w") == [{"id": 1, "w_id": 8, "s_name": "q", "name": "c"}]
+    assert db.count("w", {"w_id": 8}) == 1
+    db.close(dispose=True)
+
+
+@pytest.mark.parametrize("method", ["native", "staged"])
+def test_bulk_upsert(db, method):
+    rows = [
+        {"id": 1, "name": "bo", "city": "q"},
+        {"id": 5, "name": "cy", "city": "w"},
+        {"id": 5, "name": "di", "city": "v"},
+    ]
+    stats = db.bulk_upsert("people", rows, key_columns=["id"], update_columns=["city"], method=method, return_stats=True)
+
+    assert stats["method"] == method and stats["rows"] == 2
+    result = {r["id"]: (r["name"], r["city"]) for r in db.query("people")}
+    assert result[1] == ("bo", "q")
+    assert result[2] == ("al", "y")
+    assert result[5] == ("di", "v")
+    assert db.get_tables() == ["people"]
+
+
+def test_bulk_upsert_staged_rejects_unknown_columns(db):
+    with pytest.raises(ValueError, match="typo"):
+        db.bulk_upsert("people", [{"id": 1, "name": "x", "typo": 1}], key_columns=["id"], method="staged")
+    assert db.get_tables() == ["people"]
+
+
+def test_bulk_upsert_native_needs_unique_key(db):
+    with pytest.raises(ValueError, match="unique constraint"):
+        db.bulk_upsert("people", [{"id": 1, "name": "x"}], key_columns=["name"], method="native")
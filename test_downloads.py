@@ -0,0 +1,154 @@
+"""DownloadManager resume tests against a local HTTP fixture server."""
+
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from rpa.modules.downloads import DownloadManager
+
+
+class FileHandler(BaseHTTPRequestHandler):
+    """Serves `content` with an ETag and Range/If-Range support.
+
+    While `drop_after` is set, GETs send that many bytes and then drop the
+    connection. `changed` replaces the content from the first GET on.
+    """
+
+    content = b""
+    drop_after = None
+    changed = None
+
+    @classmethod
+    def etag(cls):
+        return '"%s"' % hashlib.md5(cls.content).hexdigest()
+
+    def send_head(self):
+        start, end, status = 0, len(self.content) - 1, 200
+        header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if header and (if_range is None or if_range == self.etag()):
+            first, _, last = header.split("=")[1].partition("-")
+            start, status = int(first), 206
+            end = int(last) if last else end
+        body = self.content[start:end + 1]
+        self.send_response(status)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", self.etag())
+        self.send_header("Content-Length", str(len(body)))
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(self.content)}")
+        self.end_headers()
+        return body
+
+    def do_HEAD(self):
+        self.send_head()
+
+    def do_GET(self):
+        if self.changed is not None:
+            FileHandler.content, FileHandler.changed = self.changed, None
+        body = self.send_head()
+        if self.drop_after is not None:
+            self.wfile.write(body[:self.drop_after])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    FileHandler.content, FileHandler.drop_after, FileHandler.changed = b"", None, None
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), FileHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}/file.bin"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def manager():
+    return DownloadManager(retries=1, retry_delay=0, segments=1, dedupe=False, chunk_size=256)
+
+
+def interrupted(url, target):
+    FileHandler.drop_after = 1024
+    with pytest.raises(Exception):
+        manager().download(url, str(target))
+    FileHandler.drop_after = None
+    assert (target.parent / "out.bin.part").stat().st_size == 1024
+
+
+def test_resume_same_version(server, tmp_path):
+    target = tmp_path / "out.bin"
+    FileHandler.content = bytes(range(256)) * 20
+    interrupted(server, target)
+
+    result = manager().download(server, str(target))
+    assert target.read_bytes() == FileHandler.content
+    assert result["resumed_bytes"] == 1024
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["out.bin"]
+
+
+def test_restart_when_remote_file_changed(server, tmp_path):
+    target = tmp_path / "out.bin"
+    FileHandler.content = b"a" * 5000
+    interrupted(server, target)
+
+    FileHandler.content = b"b" * 6000
+    result = manager().download(server, str(target))
+    assert target.read_bytes() == FileHandler.content
+    assert result["resumed_bytes"] == 0
+
+
+def test_oversized_part_is_discarded(server, tmp_path):
+    target = tmp_path / "out.bin"
+    FileHandler.content = b"c" * 3000
+    interrupted(server, target)
+
+    part = tmp_path / "out.bin.part"
+    part.write_bytes(b"x" * 4000)
+    manager().download(server, str(target))
+    assert target.read_bytes() == FileHandler.content
+
+
+def test_restart_when_file_changes_between_segments(server, tmp_path):
+    target = tmp_path / "out.bin"
+    FileHandler.content = b"a" * 8000
+    FileHandler.changed = b"b" * 8000
+
+    manager = DownloadManager(segments=4, segment_threshold=1000, retry_delay=0, dedupe=False)
+    result = manager.download(server, str(target))
+    assert target.read_bytes() == b"b" * 8000
+    assert result["segments"] == 4
+
+
+def test_dedupe_ignores_overwritten_original(server, tmp_path):
+    manager = DownloadManager(retries=1, retry_delay=0, segments=1, dedupe=True)
+
+    FileHandler.content = b"x" * 2000
+    manager.download(server, str(tmp_path / "a.bin"))
+    FileHandler.content = b"y" * 2000
+    manager.download(server, str(tmp_path / "a.bin"))
+
+    FileHandler.content = b"x" * 2000
+    result = manager.download(server, str(tmp_path / "c.bin"))
+    assert (tmp_path / "c.bin").read_bytes() == b"x" * 2000
+    assert (tmp_path / "a.bin").read_bytes() == b"y" * 2000
+    assert result["duplicate_of"] is None
+
+
+def test_dedupe_rehashes_edited_original(server, tmp_path):
+    manager = DownloadManager(retries=1, retry_delay=0, segments=1, dedupe=True)
+
+    FileHandler.content = b"x" * 2000
+    manager.download(server, str(tmp_path / "a.bin"))
+    (tmp_path / "a.bin").write_bytes(b"edited")
+
+    result = manager.download(server, str(tmp_path / "b.bin"))
+    assert (tmp_path / "b.bin").read_bytes() == b"x" * 2000
+    assert result["duplicate_of"] is None
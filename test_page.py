@@ -0,0 +1,22 @@
+"""Page extraction must give the same result with every parser."""
+
+import pytest
+
+from rpa.modules import Page
+
+HTML = """
+<ul>
+  <li class="item"><span class="item">x</span><a href="/a">A</a></li>
+  <li class="item">y</li>
+</ul>
+"""
+
+
+@pytest.mark.parametrize("parser", ["lxml", "html.parser", "lxml.html"])
+def test_scoped_selectors_match_descendants_only(parser):
+    page = Page(HTML, url="https://example.com/list", parser=parser)
+
+    assert page.extract_items("li.item", {"t": ".item"}) == [{"t": "x"}, {"t": None}]
+    first = page.select("li.item")[0]
+    assert [page.element_text(el) for el in page.select_all_in(first, ".item")] == ["x"]
+    assert page.select_one("li", within=page.select("li.item")[1]) is None
@@ -0,0 +1,197 @@
+"""SpreadsheetModule CSV writing and appending tests."""
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import Font
+
+from rpa.modules import SpreadsheetModule
+from rpa.modules import spreadsheet as SPREADSHEET
+
+
+@pytest.fixture
+def sheet():
+    return SpreadsheetModule()
+
+
+def test_write_csv_aligns_later_chunks(sheet, tmp_path, caplog):
+    target = tmp_path / "out.csv"
+    chunks = [
+        pd.DataFrame({"a": [1], "b": [2]}),
+        pd.DataFrame({"b": [3], "a": [4], "c": [5]}),
+        [{"b": 6, "a": 7}],
+    ]
+    sheet.write_csv(iter(chunks), str(target))
+
+    assert target.read_text().splitlines() == ["a,b", "1,2", "4,3", "7,6"]
+    assert "Dropping columns" in caplog.text and "'c'" in caplog.text
+
+
+@pytest.mark.parametrize("name", ["data.csv", "data.csv.gz"])
+def test_append_to_csv_warns_on_dropped_columns(sheet, tmp_path, caplog, name):
+    target = tmp_path / name
+    sheet.write_csv(pd.DataFrame({"a": [1], "b": [2]}), str(target))
+    sheet.append_to_csv([{"b": 3, "a": 4, "c": 5}], str(target))
+
+    assert pd.read_csv(target).to_dict("records") == [{"a": 1, "b": 2}, {"a": 4, "b": 3}]
+    assert "Dropping columns" in caplog.text and "'c'" in caplog.text
+
+
+# Columnar and compressed formats
+
+FRAME = pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b", None], "amount": [1.5, None, 3.0]})
+
+
+@pytest.mark.parametrize("name, needs", [
+    ("data.parquet", "pyarrow"),
+    ("data.feather", "pyarrow"),
+    ("data.csv.gz", None),
+    ("data.csv.zst", "zstandard"),
+])
+def test_round_trip(sheet, tmp_path, name, needs):
+    if needs:
+        pytest.importorskip(needs)
+    target = str(tmp_path / name)
+
+    sheet.write(FRAME, target)
+    pd.testing.assert_frame_equal(sheet.read(target), FRAME)
+
+
+@pytest.mark.parametrize("name", ["data.parquet", "data.feather"])
+def test_arrow_streamed_chunks(sheet, tmp_path, name):
+    pytest.importorskip("pyarrow")
+    target = str(tmp_path / name)
+    chunks = [
+        pd.DataFrame({"q": [1, 2], "note": [None, None]}),
+        pd.DataFrame({"q": [2.5], "note": ["x"]}),
+    ]
+
+    # The all-null column holds the first chunk back, so int and float unify
+    sheet.write(iter(chunks), target)
+    result = sheet.read(target)
+    assert result["q"].tolist() == [1.0, 2.0, 2.5]
+    assert result["note"].isna().tolist() == [True, True, False] and result["note"].iloc[2] == "x"
+
+    chunks = [pd.DataFrame({"q": [1, 2]}), pd.DataFrame({"q": [1.5]})]
+    with pytest.raises(ValueError, match="file schema"):
+        sheet.write(iter(chunks), target)
+    sheet.write(iter(chunks), target, schema={"q": "float64"})
+    assert sheet.read(target)["q"].tolist() == [1.0, 2.0, 1.5]
+
+
+def test_append_to_zstd_csv(sheet, tmp_path):
+    pytest.importorskip("zstandard")
+    target = str(tmp_path / "data.csv.zst")
+
+    sheet.write_csv(FRAME.iloc[:2], target)
+    sheet.append_to_csv(FRAME.iloc[2:], target)
+    pd.testing.assert_frame_equal(sheet.read(target), FRAME)
+
+
+def test_append_to_zip_csv_is_rejected(sheet, tmp_path):
+    target = str(tmp_path / "data.csv.zip")
+    sheet.write_csv(FRAME, target)
+
+    with pytest.raises(ValueError, match="ZIP"):
+        sheet.append_to_csv(FRAME, target)
+    pd.testing.assert_frame_equal(sheet.read(target), FRAME)
+
+
+# Streaming Excel writer
+
+def engines():
+    return [
+        "openpyxl",
+        pytest.param("xlsxwriter", marks=pytest.mark.skipif(
+            not SPREADSHEET.XLSXWRITER_AVAILABLE, reason="xlsxwriter not installed",
+        )),
+    ]
+
+
+def sheet_rows(path):
+    wb = load_workbook(path)
+    return {ws.title: [list(r) for r in ws.iter_rows(values_only=True)] for ws in wb.worksheets}
+
+
+@pytest.mark.parametrize("engine", engines())
+@pytest.mark.parametrize("rows, columns", [
+    ([(i, f"n{i}", None if i == 2 else i / 2) for i in range(7)], ["id", "name", "half"]),
+    ([{"id": i, "name": f"n{i}", "half": float("nan") if i == 2 else i / 2} for i in range(7)], None),
+])
+def test_write_excel_stream_rolls_over_sheets(sheet, tmp_path, engine, rows, columns):
+    target = tmp_path / "out.xlsx"
+    sheet.write_excel_stream(iter(rows), str(target), columns=columns, engine=engine, max_rows=4)
+
+    sheets = sheet_rows(target)
+    assert list(sheets) == ["Sheet1", "Sheet1_2", "Sheet1_3"]
+    assert all(values[0] == ["id", "name", "half"] for values in sheets.values())
+
+    body = [row for values in sheets.values() for row in values[1:]]
+    assert len(body) == 7 and [len(values) for values in sheets.values()] == [4, 4, 2]
+    assert body[2] == [2, "n2", None]
+    assert body[6] == [6, "n6", 3]
+
+
+# Chunked readers
+
+@pytest.fixture
+def workbook(tmp_path):
+    target = tmp_path / "in.xlsx"
+    pd.DataFrame({
+        "id": list(range(1, 8)),
+        "name": ["a", "b", "c", "d", "e", "f", "g"],
+        "qty": [1, 2, 3, 4, 5, 6, 7],
+        "price": [1.5, 2.0, None, 4.25, 5.0, 6.5, 7.0],
+    }).to_excel(target, index=False)
+    return str(target)
+
+
+@pytest.mark.parametrize("options", [
+    {},
+    {"usecols": ["price", "id"], "dtype": {"qty": "float64", "id": "int32"}},
+    {"usecols": [3, 0], "dtype": "str"},
+    {"header": None},
+])
+def test_iter_excel_matches_read_excel(sheet, workbook, options):
+    streamed = pd.concat(sheet.iter_excel(workbook, chunksize=3, **options), ignore_index=True)
+    pd.testing.assert_frame_equal(streamed, pd.read_excel(workbook, **options))
+
+
+def test_iter_excel_rejects_unknown_usecols(sheet, workbook):
+    with pytest.raises(ValueError, match="nope"):
+        list(sheet.iter_excel(workbook, usecols=["id", "nope"]))
+
+
+def test_iter_csv_matches_read_csv(sheet, workbook, tmp_path):
+    target = str(tmp_path / "in.csv")
+    pd.read_excel(workbook).to_csv(target, index=False)
+
+    streamed = pd.concat(sheet.iter_csv(target, chunksize=3, usecols=["id", "price"]), ignore_index=True)
+    pd.testing.assert_frame_equal(streamed, sheet.read_csv(target, usecols=["id", "price"]))
+
+
+def test_append_to_excel_in_place(sheet, tmp_path):
+    target = tmp_path / "book.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Sheet1"
+    ws.append(["id", "name"])
+    for cell in ws[1]:
+        cell.font = Font(bold=True, color="FF0000")
+    ws.append([1, "a"])
+    ws.append([2, "b"])
+    wb.create_sheet("Other").append(["keep", "me"])
+    wb.save(target)
+
+    sheet.append_to_excel([{"name": "c", "id": 3, "city": "x"}], str(target))
+
+    wb = load_workbook(target)
+    assert wb.sheetnames == ["Sheet1", "Other"]
+    assert [c.value for c in wb["Other"][1]] == ["keep", "me"]
+
+    ws = wb["Sheet1"]
+    assert [c.value for c in ws[1]] == ["id", "name", "city"]
+    assert ws["A1"].font.bold and ws["B1"].font.color.rgb == "00FF0000"
+    assert ws.max_row == 4
+    assert [c.value for c in ws[4]] == [3, "c", "x"]
+    assert [c.value for c in ws[3]] == [2, "b", None]
@@ -0,0 +1,155 @@
+"""transform() must give the same result with and without the planner."""
+
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from rpa.modules import SpreadsheetModule
+from rpa.modules.transforms import plan_operations
+
+ORDERS = pd.DataFrame({
+    "id": [1, 2, 3, 4, 5, 6],
+    "region": ["n", "s", "n", "e", "s", "n"],
+    "amount": [120.0, 80.0, 200.0, None, 50.0, 310.0],
+    "qty": [1, 2, 3, 4, 5, 6],
+    "customer_id": [10, 11, 10, 12, 13, 99],
+})
+
+CUSTOMERS = pd.DataFrame({"customer_id": [10, 11, 12, 13], "name": ["a", "b", "c", "d"]})
+
+
+@pytest.fixture
+def sheet():
+    return SpreadsheetModule()
+
+
+def both(sheet, data, operations, **kwargs):
+    try:
+        unplanned = sheet.transform(data, operations, optimize=False, **kwargs)
+    except Exception as e:
+        # The planned run must fail the same way
+        with pytest.raises(type(e)):
+            sheet.transform(data, operations, optimize=True, **kwargs)
+        return None
+    planned = sheet.transform(data, operations, optimize=True, **kwargs)
+    assert_frame_equal(planned.reset_index(drop=True), unplanned.reset_index(drop=True))
+    return planned
+
+
+@pytest.mark.parametrize("operations", [
+    [
+        {"type": "compute", "column": "total", "expression": "amount * qty"},
+        {"type": "sort", "by": "total", "ascending": False},
+        {"type": "filter", "column": "region", "value": "n"},
+        {"type": "drop", "columns": ["customer_id"]},
+    ],
+    [
+        {"type": "rename", "columns": {"region": "area", "area": "region"}},
+        {"type": "filter", "conditions": [{"column": "area", "op": "in", "value": ["n", "s"]}]},
+        {"type": "fillna", "value": 0, "columns": ["amount"]},
+        {"type": "filter", "conditions": [{"column": "amount", "op": ">", "value": 60}]},
+    ],
+    [
+        {"type": "dedupe", "columns": ["region"]},
+        {"type": "filter", "conditions": [{"column": "region", "op": "!=", "value": "e"}]},
+        {"type": "compute", "column": "unused", "expression": "qty * 2"},
+        {"type": "drop", "columns": ["unused"]},
+    ],
+    [
+        {"type": "join", "right": "customers", "on": "customer_id", "how": "inner"},
+        {"type": "filter", "conditions": [{"column": "customer_id", "op": "<=", "value": 11}]},
+        {"type": "select", "columns": ["id", "customer_id", "name"]},
+        {"type": "drop", "columns": ["name"]},
+    ],
+    [
+        {"type": "cast", "columns": {"amount": "int64"}, "errors": "coerce"},
+        {"type": "filter", "conditions": [{"column": "qty", "op": "!=", "value": 4}]},
+    ],
+    [
+        {"type": "cast", "columns": {"amount": "int64"}, "errors": "ignore"},
+        {"type": "filter", "conditions": [{"column": "qty", "op": "!=", "value": 4}]},
+    ],
+    [
+        {"type": "cast", "columns": {"region": "category"}},
+        {"type": "filter", "conditions": [{"column": "qty", "op": "<", "value": 3}]},
+    ],
+    [
+        {"type": "fillna", "value": "none", "columns": ["amount"]},
+        {"type": "filter", "conditions": [{"column": "qty", "op": "!=", "value": 4}]},
+    ],
+    [
+        {"type": "drop", "columns": ["zz"]},
+        {"type": "drop", "columns": ["region"], "errors": "ignore"},
+    ],
+    [
+        {"type": "drop", "columns": ["region"], "errors": "ignore"},
+        {"type": "drop", "columns": ["zz"], "errors": "ignore"},
+        {"type": "drop", "columns": ["qty"]},
+    ],
+    [
+        {"type": "drop", "columns": ["region"]},
+        {"type": "sort", "by": "id"},
+        {"type": "drop", "columns": ["region"], "errors": "ignore"},
+    ],
+    [
+        {"type": "drop", "columns": ["region"], "errors": "ignore"},
+        {"type": "drop", "columns": ["region"]},
+    ],
+])
+def test_planned_matches_unplanned(sheet, operations):
+    both(sheet, ORDERS, operations, tables={"customers": CUSTOMERS})
+
+
+def test_merged_filters_apply_in_order(sheet):
+    # 'v' only holds numbers where kind == "n"; comparing the strings would raise
+    data = pd.DataFrame({"kind": ["n", "s", "n", "s"], "v": [3, "x", 9, "y"]})
+    operations = [
+        {"type": "filter", "column": "kind", "value": "n"},
+        {"type": "filter", "conditions": [{"column": "v", "op": ">", "value": 5}]},
+    ]
+    assert len(plan_operations(operations)) == 1
+    assert both(sheet, data, operations)["v"].tolist() == [9]
+
+
+def test_filter_stays_after_left_join(sheet):
+    operations = [
+        {"type": "join", "right": "customers", "on": "customer_id", "how": "left"},
+        {"type": "filter", "conditions": [{"column": "customer_id", "op": "<", "value": 99}]},
+    ]
+    assert [op["type"] for op in plan_operations(operations)] == ["join", "filter"]
+    result = both(sheet, ORDERS, operations, tables={"customers": CUSTOMERS})
+    assert result["name"].tolist() == ["a", "b", "a", "c", "d"]
+
+
+def test_no_swap_across_colliding_rename(sheet):
+    data = pd.DataFrame({"a": [1, 2], "b": [3, 4], "c": [5, 6]})
+    operations = [
+        {"type": "rename", "columns": {"a": "b"}},
+        {"type": "drop", "columns": ["b"]},
+    ]
+    assert [op["type"] for op in plan_operations(operations)] == ["rename", "drop"]
+    assert list(both(sheet, data, operations).columns) == ["c"]
+
+    # Columns the rename does not touch can still move ahead of it
+    operations = [
+        {"type": "rename", "columns": {"a": "b"}},
+        {"type": "filter", "conditions": [{"column": "c", "op": ">", "value": 5}]},
+    ]
+    assert [op["type"] for op in plan_operations(operations)] == ["filter", "rename"]
+
+
+def test_cast_errors(sheet):
+    data = pd.DataFrame({"qty": ["1", "2", "x"], "when": ["2024-01-02", "soon", "2024-03-04"]})
+
+    coerced = both(sheet, data, [{"type": "cast", "columns": {"qty": "int64"}, "errors": "coerce"}])
+    assert str(coerced["qty"].dtype) == "Int64"
+    assert coerced["qty"].tolist()[:2] == [1, 2] and pd.isna(coerced["qty"].iloc[2])
+
+    ignored = both(sheet, data, [{"type": "cast", "columns": {"when": "datetime", "qty": "float64"}, "errors": "ignore"}])
+    assert ignored["when"].tolist() == data["when"].tolist()
+    assert ignored["qty"].tolist() == data["qty"].tolist()
+
+    with pytest.raises(ValueError):
+        sheet.transform(data, [{"type": "cast", "columns": {"qty": "int64"}}])
+    with pytest.raises(ValueError, match="errors mode"):
+        sheet.transform(data, [{"type": "cast", "columns": {"qty": "int64"}, "errors": "skip"}])
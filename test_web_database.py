@@ -0,0 +1,34 @@
+"""Web database routes must not rebind the shared bot's connection."""
+
+import pytest
+
+from web.app import app, bot
+
+
+@pytest.fixture
+def client():
+    app.config["TESTING"] = True
+    return app.test_client()
+
+
+def test_connect_leaves_shared_module_alone(client, tmp_path):
+    urls = []
+    for name in ("first", "second"):
+        url = f"sqlite:///{tmp_path / name}.db"
+        bot.database.using(url).execute(f"CREATE TABLE {name}_items (id INTEGER)")
+        urls.append(url)
+
+    engine, connection_string = bot.database._engine, bot.database._connection_string
+
+    tables = []
+    for url in urls:
+        response = client.post("/api/database/connect", json={"connection_string": url})
+        assert response.status_code == 200
+        tables.append(response.get_json()["tables"])
+
+    assert tables == [["first_items"], ["second_items"]]
+    assert bot.database._engine is engine
+    assert bot.database._connection_string == connection_string
+
+    response = client.post("/api/database/query", json={"query": "SELECT 1 AS one", "connection_string": urls[1]})
+    assert response.get_json()["results"] == [{"one": 1}]
@@ -16,6 +16,7 @@ from flask_cors import CORS
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from rpa import RPA
+from rpa.core import engine_metrics
 # Pricing module removed - now licensed as embedded solution
 
 app = Flask(__name__)
@@ -99,6 +100,12 @@ def add_security_headers(response):
 # Initialize RPA
 bot = RPA()
 
+# Re-uploads of the same PDF are served from the extraction cache
+bot.config.set("pdf.cache", {
+    "enabled": True,
+    "path": os.path.join(tempfile.gettempdir(), "rpa_extraction_cache.db"),
+})
+
 # Temp directory for file operations
 UPLOAD_FOLDER = tempfile.mkdtemp()
 OUTPUT_FOLDER = tempfile.mkdtemp()
@@ -379,6 +386,19 @@ def database_page():
     return render_template("database.html")
 
 
+def request_database(connection_string=None):
+    """Database module for one request.
+
+    A connection string gets a module scoped to it (sharing the pooled
+    engine), so requests never rebind the process-wide bot.database.
+    Only the most recently used of these stay open (see
+    DatabaseModule.using), so clients cannot pile up pools.
+    """
+    if connection_string:
+        return bot.database.using(connection_string)
+    return bot.database
+
+
 @app.route("/api/database/connect", methods=["POST"])
 def database_connect():
     try:
@@ -386,8 +406,7 @@ def database_connect():
         if not connection_string:
             return jsonify({"error": "Connection string required"}), 400
 
-        bot.database.connect(connection_string)
-        tables = bot.database.get_tables()
+        tables = request_database(connection_string).get_tables()
 
         return jsonify({"success": True, "tables": tables})
     except Exception as e:
@@ -401,7 +420,7 @@ def database_query():
         if not query:
             return jsonify({"error": "Query required"}), 400
 
-        results = bot.database.execute(query)
+        results = request_database(request.json.get("connection_string")).execute(query)
 
         return jsonify({"success": True, "results": results})
     except Exception as e:
@@ -411,12 +430,20 @@ def database_query():
 @app.route("/api/database/tables", methods=["GET"])
 def database_tables():
     try:
-        tables = bot.database.get_tables()
+        tables = request_database(request.args.get("connection_string")).get_tables()
         return jsonify({"success": True, "tables": tables})
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
+@app.route("/api/database/pool", methods=["GET"])
+def database_pool():
+    try:
+        return jsonify({"success": True, "engines": engine_metrics()})
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
 # ============================================================
 # Files Module
 # ============================================================